@@ -10,7 +10,8 @@ import io
 import json
 import os
 import threading
-from typing import Self
+import time
+from typing import Any, Self
 
 import botlogging
 import discord
@@ -21,7 +22,22 @@ import munch
 import ui
 import yaml
 from botlogging import LogContext, LogLevel
-from core import auxiliary, custom_errors, databases, extensionconfig, http
+from core import (
+    auxiliary,
+    cogs,
+    custom_errors,
+    databases,
+    extensionconfig,
+    extensionloader,
+    guildconfig,
+    http,
+    httplimit,
+    metrics,
+    migrator,
+    perf,
+    ratelimit,
+    watchdog,
+)
 from discord import app_commands
 from discord.ext import commands
 
@@ -45,6 +61,8 @@ class TechSupportBot(commands.Bot):
         EXTENSIONS_DIR (str): The list of all files in the EXTENSIONS_DIR_NAME folder
         FUNCTIONS_DIR_NAME (str):The hardcoded folder for functions
         FUNCTIONS_DIR (str):The list of all files in the FUNCTIONS_DIR_NAME folder
+        EXTENSION_DEPENDENCIES (dict[str, list[str]]): Extensions that must be loaded
+            after other extensions. Every other extension is loaded concurrently
     """
 
     CONFIG_PATH: str = "./config.yml"
@@ -56,6 +74,8 @@ class TechSupportBot(commands.Bot):
     FUNCTIONS_DIR: str = (
         f"{os.path.join(os.path.dirname(__file__))}/{FUNCTIONS_DIR_NAME}"
     )
+    # No setup() uses another extension, they only look each other up at runtime
+    EXTENSION_DEPENDENCIES: dict[str, list[str]] = {}
 
     def __init__(
         self: Self, intents: discord.Intents, allowed_mentions: discord.AllowedMentions
@@ -68,16 +88,26 @@ class TechSupportBot(commands.Bot):
         self.file_config = None
 
         # Sets up some dicts and arrays
-        self.guild_configs: dict[str, munch.Munch] = {}
+        self.guild_configs = guildconfig.GuildConfigStore()
         self.extension_configs = munch.DefaultMunch(None)
         self.extension_states = munch.DefaultMunch(None)
-        self.command_rate_limit_bans: expiringdict.ExpiringDict[str, bool] = (
-            expiringdict.ExpiringDict(
-                max_len=5000,
-                max_age_seconds=600,
-            )
+        self.startup_report = extensionloader.StartupReport()
+        self.admin_ids: frozenset[int] = frozenset()
+        self.admin_roles: frozenset[str] = frozenset()
+        # (guild ID, member ID): whether the member is a bot admin
+        self.bot_admin_cache: expiringdict.ExpiringDict[tuple[int, int], bool] = (
+            expiringdict.ExpiringDict(max_len=5000, max_age_seconds=3600)
+        )
+        self.command_rate_limiter = ratelimit.CommandRateLimiter(
+            ban_seconds=600, max_identities=5000
         )
-        self.command_execute_history: dict[str, dict[int, bool]] = {}
+        self.perf = perf.PerfRecorder()
+        self.metrics = metrics.MetricsRegistry()
+        self.metrics.add_collector(self.collect_metrics)
+        self.gateway_event_counter = self.metrics.counter(
+            "techsupport_gateway_events_total", "Gateway events received, per type"
+        )
+        self.metrics_server: metrics.MetricsServer = None
 
         # Loads the file config, which includes things like the token
         self.load_file_config()
@@ -104,9 +134,28 @@ class TechSupportBot(commands.Bot):
                 send=not self.file_config.logging.block_discord_send,
             )
 
+        # Slash command audit logs are sent in the background, off the command path
+        self.audit_log_queue = botlogging.AuditLogQueue(
+            name=self.__class__.__name__,
+            max_size=self.file_config.logging.get("audit_queue_size", 1000),
+        )
+
+        # Measures event loop lag, and catches whatever blocks the loop
+        self.loop_watchdog = watchdog.LoopWatchdog(
+            self, threshold=self.file_config.logging.get("loop_lag_threshold", 0.5)
+        )
+
         # Creates a http calls class and a reference to it to the bot
         self.http_functions = http.HTTPCalls(self)
 
+        # Every MatchCog gets messages through this, rather than its own listener
+        self.match_dispatcher = cogs.MatchDispatcher(self)
+
+        # Guild config changes are written to postgres in the background
+        self.config_writer = guildconfig.GuildConfigWriter(
+            self, debounce_seconds=self.file_config.cache.get("config_write_seconds", 2)
+        )
+
         # Set the app command on error function to log errors in slash commands
         self.tree.on_error = self.on_app_command_error
 
@@ -126,6 +175,19 @@ class TechSupportBot(commands.Bot):
         if isinstance(self.logger, botlogging.DelayedLogger):
             self.logger.register_queue()
             asyncio.create_task(self.logger.run())
+        self.audit_log_queue.start()
+        self.loop_watchdog.start()
+        self.http_functions.start()
+
+        # The metrics endpoint is only started if it's enabled in the file config
+        metrics_config = self.file_config.get("metrics") or {}
+        if metrics_config.get("enabled"):
+            self.metrics_server = metrics.MetricsServer(
+                self.metrics,
+                host=metrics_config.get("host", "127.0.0.1"),
+                port=metrics_config.get("port", 9100),
+            )
+            await self.metrics_server.start()
 
         # Start the IRC bot in an asynchronous task
         irc_config = self.file_config.api.irc
@@ -153,7 +215,7 @@ class TechSupportBot(commands.Bot):
 
     async def setup_hook(self: Self) -> None:
         """This function is automatically called after the bot has been logged into discord
-        This creates postgres tables if needed, registers new guild configs if needed,
+        This migrates postgres tables if needed, registers new guild configs if needed,
         Loads extensions, registers the custom help command
         and loads guild configs from the database.
 
@@ -166,22 +228,27 @@ class TechSupportBot(commands.Bot):
         )
         self.remove_command("help")
 
-        # Get all the tables setup and create them all if needed
+        # Get all the tables setup, and apply any database migrations not yet applied
         await self.logger.send_log(
-            message="Syncing Postgres tables...",
+            message="Migrating Postgres tables...",
             level=LogLevel.DEBUG,
             console_only=True,
         )
         self.models = munch.DefaultMunch(None)
         databases.setup_models(self)
-        await self.db.gino.create_all()
+        await migrator.run_migrations(
+            self,
+            dry_run=self.file_config.database.get("migrations_dry_run", False),
+        )
 
         # Load all guild config objects into self.guild_configs object
         all_config = await self.models.Config.query.gino.all()
         for config in all_config:
-            self.guild_configs[config.guild_id] = munch.munchify(
-                json.loads(config.config)
-            )
+            stored_config = config.config
+            if isinstance(stored_config, str):
+                stored_config = json.loads(stored_config)
+            self.config_writer.load(config.guild_id, stored_config)
+            self.guild_configs[config.guild_id] = munch.munchify(stored_config)
 
         # Adds persistent views to the bot
         self.add_view(ui.VotingButtonPersistent())
@@ -201,7 +268,7 @@ class TechSupportBot(commands.Bot):
         Args:
             guild (discord.Guild): the guild that was joined
         """
-        self.register_new_guild_config(str(guild.id))
+        await self.register_new_guild_config(str(guild.id))
         for cog in self.cogs.values():
             if getattr(cog, "COG_TYPE", "").lower() == "loop":
                 try:
@@ -225,8 +292,7 @@ class TechSupportBot(commands.Bot):
         await self.get_owner()
 
         # Ensure all guilds have a config
-        for guild in self.guilds:
-            await self.register_new_guild_config(str(guild.id))
+        await self.bootstrap_guild_configs()
 
     # DM Logging
 
@@ -246,7 +312,8 @@ class TechSupportBot(commands.Bot):
         await owner.send(embed=embed)
 
     async def on_message(self: Self, message: discord.Message) -> None:
-        """Logs DMs and ensure that commands are processed
+        """Logs DMs, and ensures that commands and match cogs are processed
+        The context is only built once, and shared by commands and every match cog
 
         Args:
             message (discord.Message): the message object
@@ -267,7 +334,12 @@ class TechSupportBot(commands.Bot):
                 f"{content_string} {attachment_string}",
             )
 
-        await self.process_commands(message)
+        ctx = await self.get_context(message)
+        if message.author.bot:
+            await self.match_dispatcher.dispatch(ctx)
+            return
+
+        await asyncio.gather(self.match_dispatcher.dispatch(ctx), self.invoke(ctx))
 
     # Guild config management functions
 
@@ -290,14 +362,46 @@ class TechSupportBot(commands.Bot):
                 return True
             return False
 
-    async def create_new_context_config(self: Self, guild_id: str) -> munch.Munch:
-        """Creates a new guild config for a given guild.
+    async def bootstrap_guild_configs(self: Self) -> None:
+        """Creates the default config for every guild the bot is in that doesn't have one
+        Every missing config is inserted with a single statement, so this costs the same
+        no matter how many guilds there are. Configs were already loaded in setup_hook
+        """
+        async with self.guild_config_lock:
+            new_configs = {
+                str(guild.id): self.build_new_guild_config(str(guild.id))
+                for guild in self.guilds
+                if not self.guild_configs.get(str(guild.id))
+            }
+            if not new_configs:
+                return
+
+            await self.logger.send_log(
+                message=f"Inserting new configs for {len(new_configs)} guilds",
+                level=LogLevel.DEBUG,
+                console_only=True,
+            )
+            try:
+                await self.config_writer.insert_missing(new_configs)
+            except Exception as exception:
+                # safely finish because the new configs are still useful
+                await self.logger.send_log(
+                    message="Could not insert guild configs into Postgres",
+                    level=LogLevel.ERROR,
+                    exception=exception,
+                )
+
+            for guild_id, config in new_configs.items():
+                self.guild_configs[guild_id] = config
+
+    def build_new_guild_config(self: Self, guild_id: str) -> munch.Munch:
+        """Builds the default guild config for a given guild, without storing it
 
         Args:
-            guild_id (str): The guild ID the config will be for. Only used for storing the config
+            guild_id (str): The guild ID the config will be for
 
         Returns:
-            munch.Munch: The new config object ready to use
+            munch.Munch: The new default config object
         """
         extensions_config = munch.DefaultMunch(None)
 
@@ -315,7 +419,7 @@ class TechSupportBot(commands.Bot):
         config_.member_events_channel = None
         config_.guild_events_channel = None
         config_.private_channels = []
-        config_.enabled_extensions = self.extension_name_list
+        config_.enabled_extensions = list(self.extension_name_list)
         config_.nickname_filter = False
         config_.enable_logging = True
         config_.rate_limit = munch.DefaultMunch(None)
@@ -325,6 +429,19 @@ class TechSupportBot(commands.Bot):
 
         config_.extensions = extensions_config
 
+        return config_
+
+    async def create_new_context_config(self: Self, guild_id: str) -> munch.Munch:
+        """Creates a new guild config for a given guild.
+
+        Args:
+            guild_id (str): The guild ID the config will be for. Only used for storing the config
+
+        Returns:
+            munch.Munch: The new config object ready to use
+        """
+        config_ = self.build_new_guild_config(guild_id)
+
         try:
             await self.logger.send_log(
                 message=f"Inserting new config for lookup key: {guild_id}",
@@ -350,26 +467,103 @@ class TechSupportBot(commands.Bot):
         return config_
 
     async def write_new_config(self: Self, guild_id: str, config: str) -> None:
-        """Takes a config and guild and updates the config in the database
+        """Takes a config and guild and queues the config to be written to the database
         This is only needed when a new guild is joined or the config is modifed
+        Writes are debounced, so several changes close together are written once
 
         Args:
             guild_id (str): The str ID of the guild the config belongs to
             config (str): The str representation of the json config
         """
-        database_config = await self.models.Config.query.where(
-            self.models.Config.guild_id == guild_id
-        ).gino.first()
-        if database_config:
-            await database_config.update(
-                config=str(config), update_time=datetime.datetime.utcnow()
-            ).apply()
-        else:
-            new_database_config = self.models.Config(
-                guild_id=str(guild_id),
-                config=str(config),
+        self.config_writer.schedule(str(guild_id), json.loads(config))
+
+    async def close(self: Self) -> None:
+        """Writes any queued guild config changes and audit logs,
+        stops the background services, then closes the bot"""
+        await self.config_writer.flush_all()
+        await self.audit_log_queue.drain(
+            timeout=self.file_config.logging.get("audit_drain_seconds", 10)
+        )
+        self.loop_watchdog.stop()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        await self.http_functions.close()
+        await super().close()
+
+    def dispatch(
+        self: Self, event_name: str, /, *args: tuple, **kwargs: dict[str, Any]
+    ) -> None:
+        """Counts gateway events for the metrics, then dispatches the event as normal
+
+        Args:
+            event_name (str): The name of the event being dispatched
+            *args (tuple): The arguments of the event
+            **kwargs (dict[str, Any]): The keyword arguments of the event
+        """
+        if event_name == "socket_event_type":
+            self.gateway_event_counter.inc(type=args[0])
+        super().dispatch(event_name, *args, **kwargs)
+
+    def collect_metrics(self: Self) -> None:
+        """Updates the metrics that are read from the bot internals, before a scrape"""
+        self.metrics.gauge(
+            "techsupport_log_queue_depth", "Logs waiting in the delayed logger queue"
+        ).set(getattr(self.logger, "depth", 0))
+        self.metrics.gauge(
+            "techsupport_audit_log_queue_depth", "Logs waiting in the audit log queue"
+        ).set(self.audit_log_queue.depth)
+
+        loop_tasks = self.metrics.gauge(
+            "techsupport_loop_tasks", "Running loop tasks, per extension"
+        )
+        loop_tasks.values.clear()
+        for cog in self.cogs.values():
+            if isinstance(cog, cogs.LoopCog):
+                loop_tasks.inc(len(cog.loop_tasks), extension=cog.extension_name)
+
+        http_queued = self.metrics.gauge(
+            "techsupport_http_queued",
+            "HTTP calls waiting for the rate limit of their host",
+        )
+        http_queued.values.clear()
+        for host, limiter in self.http_functions.host_limiters.items():
+            http_queued.set(limiter.queued(), host=host)
+
+        # Filled by the timed connections of the database pool, for every gino query
+        self.metrics.counter(
+            "techsupport_db_queries_total", "Database queries run"
+        ).set(perf.query_stats.count)
+        self.metrics.counter(
+            "techsupport_db_query_errors_total", "Database queries that failed"
+        ).set(perf.query_stats.errors)
+        self.metrics.counter(
+            "techsupport_db_query_seconds_total", "Total time spent in database queries"
+        ).set(perf.query_stats.seconds)
+        self.metrics.counter(
+            "techsupport_db_slow_queries_total",
+            "Database queries slower than the slow query threshold",
+        ).set(perf.query_stats.slow)
+        if self.db is not None:
+            raw_pool = self.db.bind.raw_pool
+            self.metrics.gauge(
+                "techsupport_db_pool_connections", "Open database connections"
+            ).set(raw_pool.get_size())
+            self.metrics.gauge(
+                "techsupport_db_pool_idle_connections",
+                "Open database connections not running a query",
+            ).set(raw_pool.get_idle_size())
+
+        self.metrics.gauge(
+            "techsupport_event_loop_lag_seconds", "Recent event loop lag"
+        ).set(self.loop_watchdog.get_stats()["p99"], quantile="0.99")
+
+        irc_bot = getattr(self, "irc", None)
+        if irc_bot:
+            irc_messages = self.metrics.counter(
+                "techsupport_irc_messages_total", "Messages relayed by the IRC bot"
             )
-            await new_database_config.create()
+            irc_messages.set(irc_bot.messages_to_discord, direction="to_discord")
+            irc_messages.set(irc_bot.messages_to_irc, direction="to_irc")
 
     def add_extension_config(
         self: Self, extension_name: str, config: extensionconfig.ExtensionConfig
@@ -407,16 +601,19 @@ class TechSupportBot(commands.Bot):
         if not guild:
             return None
 
-        config = self.guild_configs[str(guild.id)]
-        channel_id = config.get(key)
+        if key == "logging_channel":
+            snapshot = self.guild_configs.snapshot(guild.id)
+            channel_id = snapshot.logging_channel if snapshot else None
+        else:
+            channel_id = guildconfig.to_id(self.guild_configs[str(guild.id)].get(key))
 
         if not channel_id:
             return None
 
-        if not guild.get_channel(int(channel_id)):
+        if not guild.get_channel(channel_id):
             return None
 
-        return channel_id
+        return str(channel_id)
 
     # File config loading functions
 
@@ -435,6 +632,12 @@ class TechSupportBot(commands.Bot):
             self.file_config.bot_config.disabled_extensions or []
         )
 
+        # Compile the bot admins once, rather than on every command
+        admins = self.file_config.bot_config.admins
+        self.admin_ids = frozenset(int(admin_id) for admin_id in admins.ids or [])
+        self.admin_roles = frozenset(admins.roles or [])
+        self.bot_admin_cache.clear()
+
         if not validate:
             return
 
@@ -479,6 +682,8 @@ class TechSupportBot(commands.Bot):
             interaction (discord.Interaction): The interaction where the error occured at
             error (app_commands.AppCommandError): The error object that occured
         """
+        self.perf.finish(interaction.extras.get("perf_timing"), error=True)
+
         error_message = await self.handle_error(
             exception=error, channel=interaction.channel, guild=interaction.guild
         )
@@ -558,6 +763,8 @@ class TechSupportBot(commands.Bot):
             context (commands.Context): the context associated with the exception
             exception (Exception): the exception object associated with the error
         """
+        self.perf.finish(getattr(context, "perf_timing", None), error=True)
+
         if self.extra_events.get("on_command_error", None):
             return
         if hasattr(context.command, "on_error"):
@@ -613,12 +820,44 @@ class TechSupportBot(commands.Bot):
             console_only=True,
         )
 
-        await db_ref.set_bind(db_url)
+        # The timed pool reports the time of every query, for the command latency stats
+        await db_ref.set_bind(
+            db_url,
+            pool_class=perf.TimedPool,
+            min_size=config_child.get("pool_min_size", 2),
+            max_size=config_child.get("pool_max_size", 20),
+            statement_cache_size=config_child.get("statement_cache_size", 100),
+            command_timeout=config_child.get("command_timeout_seconds", 30),
+        )
+        perf.query_stats.slow_seconds = config_child.get("slow_query_seconds", 0.5)
+        perf.query_stats.on_slow = self.log_slow_query
 
         db_ref.Model.__table_args__ = {"extend_existing": True}
 
         return db_ref
 
+    def log_slow_query(
+        self: Self, query: str, seconds: float, command: str | None
+    ) -> None:
+        """Logs a database query that took longer than the slow query threshold
+
+        Args:
+            query (str): The SQL of the query
+            seconds (float): How long the query took
+            command (str | None): The command that ran the query, if there was one
+        """
+        query = " ".join(query.split())
+        asyncio.create_task(
+            self.logger.send_log(
+                message=(
+                    f"Slow query ({seconds:.3f}s)"
+                    f" in {command or 'a background task'}: {query[:500]}"
+                ),
+                level=LogLevel.WARNING,
+                console_only=True,
+            )
+        )
+
     # Extension loading and management functions
 
     async def get_potential_extensions(self: Self) -> list[str]:
@@ -656,6 +895,8 @@ class TechSupportBot(commands.Bot):
 
     async def load_extensions(self: Self, graceful: bool = True) -> None:
         """Loads all extensions currently in the extensions directory.
+        Extensions are loaded in waves from the load plan, with every extension
+        in a wave loaded at once. The time taken by each is kept in startup_report
 
         Args:
             graceful (bool, optional): True if extensions should gracefully fail to load.
@@ -665,44 +906,74 @@ class TechSupportBot(commands.Bot):
             exception: If graceful is false, this will raise ANY
                 exception generated by loading extensions
         """
+        self.logger.console.debug("Retrieving commands and functions")
+        modules = {}
+        for folder, extension_names in [
+            (self.EXTENSIONS_DIR_NAME, await self.get_potential_extensions()),
+            (self.FUNCTIONS_DIR_NAME, await self.get_potential_function_extensions()),
+        ]:
+            for extension_name in sorted(extension_names):
+                if extension_name in self.file_config.bot_config.disabled_extensions:
+                    self.logger.console.debug(
+                        f"{extension_name} is disabled on startup - ignoring load"
+                    )
+                    continue
+                modules[extension_name] = f"{folder}.{extension_name}"
 
-        self.logger.console.debug("Retrieving commands")
-        for extension_name in await self.get_potential_extensions():
-            if extension_name in self.file_config.bot_config.disabled_extensions:
-                self.logger.console.debug(
-                    f"{extension_name} is disabled on startup - ignoring load"
-                )
-                continue
+        load_plan = extensionloader.build_load_plan(
+            list(modules), self.EXTENSION_DEPENDENCIES
+        )
 
-            try:
-                await self.load_extension(
-                    f"{self.EXTENSIONS_DIR_NAME}.{extension_name}"
-                )
+        start_time = time.perf_counter()
+        for wave_number, wave in enumerate(load_plan):
+            results = await asyncio.gather(
+                *(
+                    self.timed_load_extension(
+                        extension_name, modules[extension_name], wave_number
+                    )
+                    for extension_name in wave
+                ),
+                return_exceptions=True,
+            )
+            # Each result is None, or the exception the extension failed with
+            for extension_name, exception in zip(wave, results):
+                if isinstance(exception, Exception):
+                    self.logger.console.error(
+                        f"Failed to load extension {extension_name}: {exception}"
+                    )
+                    if not graceful:
+                        raise exception
+                    continue
                 self.extension_name_list.append(extension_name)
-            except Exception as exception:
-                self.logger.console.error(
-                    f"Failed to load extension {extension_name}: {exception}"
-                )
-                if not graceful:
-                    raise exception
-
-        self.logger.console.debug("Retrieving functions")
-        for extension_name in await self.get_potential_function_extensions():
-            if extension_name in self.file_config.bot_config.disabled_extensions:
-                self.logger.console.debug(
-                    f"{extension_name} is disabled on startup - ignoring load"
-                )
-                continue
 
-            try:
-                await self.load_extension(f"{self.FUNCTIONS_DIR_NAME}.{extension_name}")
-                self.extension_name_list.append(extension_name)
-            except Exception as exception:
-                self.logger.console.error(
-                    f"Failed to load extension {extension_name}: {exception}"
-                )
-                if not graceful:
-                    raise exception
+        self.startup_report.total_seconds = time.perf_counter() - start_time
+        self.extension_name_list.sort()
+        # Preconfig hasn't run yet, the full report is logged once it has
+        self.logger.console.info(self.startup_report.format(preconfig=False))
+
+    async def timed_load_extension(
+        self: Self, extension_name: str, module: str, wave_number: int
+    ) -> None:
+        """Loads a single extension, recording how long it took
+
+        Args:
+            extension_name (str): The name of the extension
+            module (str): The full module path of the extension
+            wave_number (int): The wave of the load plan this is part of
+
+        Raises:
+            exception: Any exception generated by loading the extension
+        """
+        timing = self.startup_report.get(extension_name)
+        timing.wave = wave_number
+        start_time = time.perf_counter()
+        try:
+            await self.load_extension(module)
+        except Exception as exception:
+            timing.error = str(exception)
+            raise exception
+        finally:
+            timing.load_seconds = time.perf_counter() - start_time
 
     def get_command_extension_name(self: Self, command: commands.Command) -> str:
         """Gets the subname of an extension from a command.
@@ -764,22 +1035,49 @@ class TechSupportBot(commands.Bot):
             console_only=True,
         )
 
+        cache_key = (getattr(getattr(member, "guild", None), "id", None), member.id)
+        cached_result = self.bot_admin_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         owner = await self.get_owner()
-        if getattr(owner, "id", None) == member.id:
-            return True
+        is_admin = (
+            getattr(owner, "id", None) == member.id
+            or member.id in self.admin_ids
+            or any(
+                role.name in self.admin_roles for role in getattr(member, "roles", [])
+            )
+        )
+
+        # Don't cache a miss when the owner couldn't be looked up
+        if owner or is_admin:
+            self.bot_admin_cache[cache_key] = is_admin
+        return is_admin
+
+    async def on_member_update(
+        self: Self, before: discord.Member, after: discord.Member
+    ) -> None:
+        """Forgets the cached bot admin result of a member whose roles changed
 
-        if member.id in [int(id) for id in self.file_config.bot_config.admins.ids]:
-            return True
+        Args:
+            before (discord.Member): The member before the update
+            after (discord.Member): The member after the update
+        """
+        if before.roles != after.roles:
+            self.bot_admin_cache.pop((after.guild.id, after.id), None)
 
-        role_is_admin = False
-        for role in getattr(member, "roles", []):
-            if role.name in self.file_config.bot_config.admins.roles:
-                role_is_admin = True
-                break
-        if role_is_admin:
-            return True
+    async def on_guild_role_update(
+        self: Self, before: discord.Role, after: discord.Role
+    ) -> None:
+        """Forgets every cached bot admin result when a role is renamed,
+        since admin roles are matched by name
 
-        return False
+        Args:
+            before (discord.Role): The role before the update
+            after (discord.Role): The role after the update
+        """
+        if before.name != after.name:
+            self.bot_admin_cache.clear()
 
     async def get_owner(self: Self) -> discord.User | None:
         """Gets the owner object from the bot application.
@@ -812,10 +1110,10 @@ class TechSupportBot(commands.Bot):
         Returns:
             str: The string of the command prefix by the bot, for the given guild
         """
-        guild_config = self.guild_configs[str(message.guild.id)]
-        return getattr(
-            guild_config, "command_prefix", self.file_config.bot_config.default_prefix
-        )
+        snapshot = self.guild_configs.snapshot(message.guild.id)
+        if not snapshot or not snapshot.command_prefix:
+            return self.file_config.bot_config.default_prefix
+        return snapshot.command_prefix
 
     # Can run command checks
 
@@ -845,33 +1143,20 @@ class TechSupportBot(commands.Bot):
             bool: True if the command should be run, False if under rate limit
         """
         # Assume this is only run if rate limit is enabled
-        config = self.guild_configs[str(guild.id)]
+        snapshot = self.guild_configs.snapshot(guild.id)
         identifier = f"{member.id}-{guild.id}"
 
-        # If this person hasn't run a command in the rate_limit.time
-        # We will need to add them to the execute history
-        if identifier not in self.command_execute_history:
-            self.command_execute_history[identifier] = expiringdict.ExpiringDict(
-                max_len=20,
-                max_age_seconds=config.rate_limit.time,
-            )
-
-        # Ensure that a single command is only ever counted once
-        if command_id not in self.command_execute_history[identifier]:
-            self.command_execute_history[identifier][command_id] = True
-
-        # Ban the person if they are over the rate limit
-        if len(self.command_execute_history[identifier]) > config.rate_limit.commands:
-            self.command_rate_limit_bans[identifier] = True
+        under_limit = self.command_rate_limiter.check(
+            identity=identifier,
+            command_id=command_id,
+            commands=snapshot.rate_limit_commands,
+            window_seconds=snapshot.rate_limit_time,
+        )
 
-        # If this person is banned, raise an error
-        if (
-            identifier in self.command_rate_limit_bans
-            and not member.guild_permissions.administrator
-        ):
+        # Administrators are counted, but never blocked
+        if not under_limit and not member.guild_permissions.administrator:
             return False
 
-        # Otherwise, return True
         return True
 
     def command_run_extension_disabled_check(
@@ -887,8 +1172,8 @@ class TechSupportBot(commands.Bot):
         Returns:
             bool: False if disabled, True if enabled
         """
-        config = self.guild_configs[str(guild.id)]
-        if extension_name not in config.enabled_extensions:
+        snapshot = self.guild_configs.snapshot(guild.id)
+        if not snapshot or extension_name not in snapshot.enabled_extensions:
             return False
         return True
 
@@ -911,8 +1196,18 @@ class TechSupportBot(commands.Bot):
             bool: True if the command should be run, false if it shouldn't be run
         """
 
+        # Time the command, until on_app_command_completion or on_app_command_error
+        interaction.extras["perf_timing"] = self.perf.start(
+            f"/{interaction.command.qualified_name}"
+        )
+        # HTTP calls waiting on a rate limit take turns by guild
+        httplimit.request_guild.set(
+            str(interaction.guild.id) if interaction.guild else None
+        )
+
         # Since we can't do it anywhere else, log slash command here
-        await self.slash_command_log(interaction)
+        # This is queued, so the command doesn't wait for the log to be sent
+        await self.audit_log_queue.submit(self.slash_command_log(interaction))
 
         await self.logger.send_log(
             message="Checking if prefix command can run",
@@ -920,7 +1215,7 @@ class TechSupportBot(commands.Bot):
             context=LogContext(guild=interaction.guild, channel=interaction.channel),
             console_only=True,
         )
-        config = self.guild_configs[str(interaction.guild.id)]
+        snapshot = self.guild_configs.snapshot(interaction.guild.id)
 
         # Check 1 - Ensure extension is enabled
         try:
@@ -946,7 +1241,7 @@ class TechSupportBot(commands.Bot):
 
         # Check 3 - If rate limiter is enabled, run through the rate limiter
         # If the user is under a rate limit, raise an error to show it and block execution
-        if config.rate_limit.get("enabled", False):
+        if snapshot.rate_limit_enabled:
             if not self.command_run_rate_limit_check(
                 member=interaction.user,
                 guild=interaction.guild,
@@ -957,6 +1252,27 @@ class TechSupportBot(commands.Bot):
         # Finally, return the default check, which is always True
         return True
 
+    async def on_command_completion(self: Self, ctx: commands.Context) -> None:
+        """Records the latency of a prefix command that finished without an error
+
+        Args:
+            ctx (commands.Context): The context of the command that finished
+        """
+        self.perf.finish(getattr(ctx, "perf_timing", None))
+
+    async def on_app_command_completion(
+        self: Self,
+        interaction: discord.Interaction,
+        command: app_commands.Command | app_commands.ContextMenu,
+    ) -> None:
+        """Records the latency of an app command that finished without an error
+
+        Args:
+            interaction (discord.Interaction): The interaction of the command that finished
+            command (app_commands.Command | app_commands.ContextMenu): The command that ran
+        """
+        self.perf.finish(interaction.extras.get("perf_timing"))
+
     async def slash_command_log(self: Self, interaction: discord.Interaction) -> None:
         """A command to log the call of a slash command
 
@@ -1007,6 +1323,12 @@ class TechSupportBot(commands.Bot):
         Returns:
             bool: True if the user can run the command, False otherwise
         """
+        # Time the command, until on_command_completion or on_command_error
+        # The help command checks other commands with the same context, so only start once
+        if getattr(ctx, "perf_timing", None) is None:
+            ctx.perf_timing = self.perf.start(ctx.command.qualified_name)
+        # HTTP calls waiting on a rate limit take turns by guild
+        httplimit.request_guild.set(str(ctx.guild.id) if ctx.guild else None)
 
         await self.logger.send_log(
             message="Checking if prefix command can run",
@@ -1014,7 +1336,7 @@ class TechSupportBot(commands.Bot):
             context=LogContext(guild=ctx.guild, channel=ctx.channel),
             console_only=True,
         )
-        config = self.guild_configs[str(ctx.guild.id)]
+        snapshot = self.guild_configs.snapshot(ctx.guild.id)
 
         # Check 1 - Ensure extension is enabled
         extension_name = self.get_command_extension_name(ctx.command)
@@ -1029,7 +1351,7 @@ class TechSupportBot(commands.Bot):
             return result
 
         # Check 3 - If rate limiter is enabled, run through the rate limiter
-        if config.rate_limit.get("enabled", False):
+        if snapshot.rate_limit_enabled:
             # If the user is under a rate limit, raise an error to show it and block execution
             if not self.command_run_rate_limit_check(
                 member=ctx.author, guild=ctx.guild, command_id=ctx.message.id
@@ -1,5 +1,6 @@
 """Exported loggers."""
 
+from .audit import AuditLogQueue
 from .common import LogContext, LogLevel
 from .delayed import DelayedLogger
 from .logger import *
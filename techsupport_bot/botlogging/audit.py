@@ -0,0 +1,150 @@
+"""Module for sending audit logs in the background."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Self
+
+
+class AuditLogQueue:
+    """A bounded queue of log coroutines, sent by a single background worker.
+    Callers never wait on discord, only on the queue if it is full.
+    Nothing is ever dropped, a full queue makes the caller wait for a free slot instead.
+
+    Attributes:
+        depth (int): The number of log sends currently waiting in the queue
+
+    Args:
+        name (str): The name of the console logger to report failures to
+        max_size (int): The most log sends that can be waiting at once
+    """
+
+    def __init__(self: Self, name: str, max_size: int = 1000) -> None:
+        self.console = logging.getLogger(name if name else "root")
+        self.max_size = max_size
+        self.queue: asyncio.Queue = None
+        self.worker: asyncio.Task = None
+        # Whether the worker is in the middle of sending a log
+        self.sending = False
+
+        # Backpressure metrics
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.blocked = 0
+        self.high_water_mark = 0
+
+    def start(self: Self) -> None:
+        """Creates the queue and starts the background worker on the running loop"""
+        if self.worker and not self.worker.done():
+            return
+        if not self.queue:
+            self.queue = asyncio.Queue(maxsize=self.max_size)
+        self.worker = asyncio.create_task(self.run())
+
+    @property
+    def depth(self: Self) -> int:
+        """The number of log sends currently waiting in the queue
+
+        Returns:
+            int: The current queue depth
+        """
+        if not self.queue:
+            return 0
+        return self.queue.qsize()
+
+    async def submit(self: Self, coro: Coroutine) -> None:
+        """Adds a log send to the queue, returning as soon as it has a slot.
+        If the worker isn't running, the log is sent right away instead.
+
+        Args:
+            coro (Coroutine): The log coroutine to run in the background
+        """
+        if not self.queue or not self.worker or self.worker.done():
+            await self.send(coro)
+            return
+
+        try:
+            self.queue.put_nowait(coro)
+        except asyncio.QueueFull:
+            self.blocked += 1
+            await self.queue.put(coro)
+
+        self.enqueued += 1
+        self.high_water_mark = max(self.high_water_mark, self.queue.qsize())
+
+    async def send(self: Self, coro: Coroutine) -> None:
+        """Runs a single log coroutine, recording if it failed
+
+        Args:
+            coro (Coroutine): The log coroutine to run
+        """
+        try:
+            await coro
+            self.sent += 1
+        except Exception as exception:
+            self.failed += 1
+            self.console.error("Failed to send audit log: %s", exception)
+
+    async def run(self: Self) -> None:
+        """A forever loop that sends every log in the queue, in order"""
+        while True:
+            coro = await self.queue.get()
+            self.sending = True
+            try:
+                await self.send(coro)
+            finally:
+                self.sending = False
+                self.queue.task_done()
+
+    async def drain(self: Self, timeout: float = 10) -> int:
+        """Waits for every queued log to be sent, then stops the worker.
+        Used when shutting down, so queued logs aren't lost
+
+        Args:
+            timeout (float, optional): The most seconds to wait. Defaults to 10
+
+        Returns:
+            int: The number of logs that couldn't be sent in time
+        """
+        if not self.queue:
+            return 0
+
+        # A log the worker is cut off in the middle of sending counts as unsent
+        unsent = 0
+        if self.worker and not self.worker.done():
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                unsent += self.sending
+            self.worker.cancel()
+
+        # The worker is gone, so anything left is closed without being sent
+        while not self.queue.empty():
+            self.queue.get_nowait().close()
+            self.queue.task_done()
+            unsent += 1
+        if unsent:
+            self.failed += unsent
+            self.console.error(
+                "%s audit logs were not sent before shutting down", unsent
+            )
+        return unsent
+
+    def get_stats(self: Self) -> dict[str, int]:
+        """Gets the current backpressure metrics of the queue
+
+        Returns:
+            dict[str, int]: The queue metrics, by name
+        """
+        return {
+            "depth": self.depth,
+            "max_size": self.max_size,
+            "high_water_mark": self.high_water_mark,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "blocked": self.blocked,
+        }
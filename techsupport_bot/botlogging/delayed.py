@@ -14,6 +14,9 @@ class DelayedLogger(logger.BotLogger):
     wait_time (float): the time to wait between log sends
     queue_size (int): the max number of queue events
 
+    Attributes:
+        depth (int): The number of logs currently waiting in the queue
+
     Args:
         *args (tuple): The args dict passed to this, for use passing to the main logger
         **kwargs (dict[str, Any]): The kwargs dict passed to this,
@@ -44,6 +47,17 @@ class DelayedLogger(logger.BotLogger):
 
         await self.__send_queue.put(super().send_log(*args, **kwargs))
 
+    @property
+    def depth(self: Self) -> int:
+        """The number of logs currently waiting in the queue
+
+        Returns:
+            int: The current queue depth
+        """
+        if not self.__send_queue:
+            return 0
+        return self.__send_queue.qsize()
+
     def register_queue(self: Self) -> None:
         """Registers the asyncio.Queue object to make delayed logging possible"""
         self.__send_queue = asyncio.Queue(maxsize=self.queue_size)
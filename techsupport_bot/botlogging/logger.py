@@ -140,15 +140,17 @@ class BotLogger:
         if not context.guild:
             return True
 
-        # Get the guilds config
-        config = self.bot.guild_configs[str(context.guild.id)]
+        # Get the guilds compiled config
+        snapshot = self.bot.guild_configs.snapshot(context.guild.id)
+        if not snapshot:
+            return True
 
         # Checking to see if guild logging is enabled
-        if not config.enable_logging:
+        if not snapshot.enable_logging:
             return False
 
         # Checking to see if log occured in private channels
-        if context.channel and str(context.channel.id) in config.private_channels:
+        if context.channel and context.channel.id in snapshot.private_channels:
             return False
 
         return True
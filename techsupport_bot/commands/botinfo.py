@@ -65,6 +65,40 @@ class BotInfo(cogs.BaseCog):
             value=", ".join(f"{guild.name} ({guild.id})" for guild in self.bot.guilds),
             inline=True,
         )
+        audit_stats = self.bot.audit_log_queue.get_stats()
+        embed.add_field(
+            name="Audit log queue",
+            value=(
+                f"Depth: `{audit_stats['depth']}/{audit_stats['max_size']}`"
+                f" (peak `{audit_stats['high_water_mark']}`)\n"
+                f"Sent: `{audit_stats['sent']}` Failed: `{audit_stats['failed']}`\n"
+                f"Times full: `{audit_stats['blocked']}`"
+            ),
+            inline=True,
+        )
+        loop_stats = self.bot.loop_watchdog.get_stats()
+        loop_value = (
+            f"p50: `{loop_stats['p50']*1000:.0f} ms`"
+            f" p99: `{loop_stats['p99']*1000:.0f} ms`"
+            f" max: `{loop_stats['max']*1000:.0f} ms`\n"
+            f"Times blocked: `{loop_stats['stalls']}`"
+        )
+        last_stall = loop_stats["last_stall"]
+        if last_stall:
+            loop_value += (
+                f"\nLast blocked: `{last_stall.seconds:.2f}s`"
+                f" at {last_stall.time:%H:%M:%S} UTC"
+            )
+            if last_stall.stack:
+                # The innermost frame is the code that was running when it blocked
+                frames = [
+                    line.strip()
+                    for line in last_stall.stack.splitlines()
+                    if line.strip().startswith("File")
+                ]
+                if frames:
+                    loop_value += f"\n`{frames[-1][:200]}`"
+        embed.add_field(name="Event loop lag", value=loop_value, inline=True)
         irc_config = self.bot.file_config.api.irc
         if not irc_config.enable_irc:
             embed.add_field(
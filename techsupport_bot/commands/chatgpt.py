@@ -104,7 +104,7 @@ class ChatGPT(cogs.BaseCog):
             ),
         }
         response = await self.bot.http_functions.http_call(
-            "post", self.API_URL, headers=headers, json=data
+            "post", self.API_URL, headers=headers, json=data, rate_limit_wait=30
         )
         return response
 
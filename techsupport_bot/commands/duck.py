@@ -415,9 +415,9 @@ class DuckHunt(cogs.LoopCog):
         """
         duck_user = (
             await self.bot.models.DuckUser.query.where(
-                self.bot.models.DuckUser.author_id == str(user_id)
+                self.bot.models.DuckUser.author_id == user_id
             )
-            .where(self.bot.models.DuckUser.guild_id == str(guild_id))
+            .where(self.bot.models.DuckUser.guild_id == guild_id)
             .gino.first()
         )
 
@@ -434,7 +434,7 @@ class DuckHunt(cogs.LoopCog):
         """
 
         query = await self.bot.models.DuckUser.query.where(
-            self.bot.models.DuckUser.guild_id == str(guild_id)
+            self.bot.models.DuckUser.guild_id == guild_id
         ).gino.all()
 
         speed_records = [record.speed_record for record in query]
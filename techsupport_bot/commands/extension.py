@@ -3,11 +3,12 @@ Commands which allow control over loaded extensions
 The cog in the file is named:
     ExtensionControl
 
-This file contains 4 commands:
+This file contains 5 commands:
     .extension status
     .extension load
     .extension unload
     .extension register
+    .extension timings
 """
 
 from __future__ import annotations
@@ -233,3 +234,22 @@ class ExtensionControl(cogs.BaseCog):
             message="I've registered that extension. You can now try loading it",
             channel=ctx.channel,
         )
+
+    @extension_group.command(
+        name="timings",
+        description="Shows how long each extension took to load on startup",
+    )
+    async def extension_timings(self: Self, ctx: commands.Context) -> None:
+        """Shows the startup report, with the load and preconfig time of each extension
+
+        This is a command and should be accessed via Discord.
+
+        Args:
+            ctx (commands.Context): the context object for the message
+        """
+        report = self.bot.startup_report.format(limit=25)
+        embed = auxiliary.generate_basic_embed(
+            title="Extension startup timings",
+            description=f"```{report}```",
+        )
+        await ctx.send(embed=embed)
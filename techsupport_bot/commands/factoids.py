@@ -18,6 +18,7 @@ import datetime
 import io
 import json
 import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 from socket import gaierror
@@ -31,7 +32,7 @@ import ui
 import yaml
 from aiohttp.client_exceptions import InvalidURL
 from botlogging import LogContext, LogLevel
-from core import auxiliary, cogs, custom_errors, extensionconfig
+from core import auxiliary, cogs, custom_errors, extensionconfig, httpstream
 from croniter import CroniterBadCronError
 from discord import app_commands
 from discord.ext import commands
@@ -824,8 +825,10 @@ class FactoidManager(cogs.MatchCog):
 
         if (
             factoid.restricted
-            and str(ctx.channel.id)
-            not in config.extensions.factoids.restricted_list.value
+            and ctx.channel.id
+            not in self.bot.guild_configs.snapshot(
+                ctx.guild.id
+            ).factoid_restricted_channels
         ):
             return
         if not config.extensions.factoids.disable_embeds.value:
@@ -1709,23 +1712,24 @@ class FactoidManager(cogs.MatchCog):
 
         try:
             # -Tries calling the api-
-            html = await self.generate_html(guild, factoids, aliases)
+            output_data = self.build_formatted_factoid_data(factoids, aliases)
             # If there are no applicable factoids
-            if html is None:
+            if not output_data:
                 # Something must go wrong to get here
                 return None
 
             headers = {
                 "Content-Type": "text/plain",
             }
-            response = await self.bot.http_functions.http_call(
+            # The page is generated while it is sent, so it's never held whole
+            async with self.bot.http_functions.http_stream(
                 "put",
                 self.bot.file_config.api.api_url.linx,
                 headers=headers,
-                data=io.StringIO(html),
-                get_raw_response=True,
-            )
-            url = response["text"]
+                data=httpstream.stream_body(self.generate_html(guild, output_data)),
+                max_bytes=4096,
+            ) as response:
+                url = await response.text()
             filename = url.split("/")[-1]
             url = url.replace(filename, f"selif/{filename}")
 
@@ -1842,9 +1846,9 @@ class FactoidManager(cogs.MatchCog):
 
         try:
             # -Tries calling the api-
-            html = await self.generate_html(ctx.guild, factoids, aliases)
+            output_data = self.build_formatted_factoid_data(factoids, aliases)
             # If there are no applicable factoids
-            if html is None:
+            if not output_data:
                 await auxiliary.send_deny_embed(
                     message="No factoids found!", channel=ctx.channel
                 )
@@ -1853,14 +1857,15 @@ class FactoidManager(cogs.MatchCog):
             headers = {
                 "Content-Type": "text/plain",
             }
-            response = await self.bot.http_functions.http_call(
+            # The page is generated while it is sent, so it's never held whole
+            async with self.bot.http_functions.http_stream(
                 "put",
                 self.bot.file_config.api.api_url.linx,
                 headers=headers,
-                data=io.StringIO(html),
-                get_raw_response=True,
-            )
-            url = response["text"]
+                data=httpstream.stream_body(self.generate_html(ctx.guild, output_data)),
+                max_bytes=4096,
+            ) as response:
+                url = await response.text()
             filename = url.split("/")[-1]
             url = url.replace(filename, f"selif/{filename}")
 
@@ -1891,56 +1896,53 @@ class FactoidManager(cogs.MatchCog):
     async def generate_html(
         self: Self,
         guild: discord.Guild,
-        factoids: list[munch.Munch],
-        aliases: dict[str, list[str]],
-    ) -> str:
-        """Method to generate the html file contents
+        output_data: list[dict[str, dict[str, str]]],
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[bytes]:
+        """Generates the html file contents a piece at a time, so the whole page
+        is never held in memory while it is uploaded
 
         Args:
             guild (discord.Guild): The guild the factoids are being pulled from
-            factoids (list[munch.Munch]): List of all factoids
-            aliases (dict[str, list[str]]): A dictionary containing factoids and their aliases
+            output_data (list[dict[str, dict[str, str]]]): The formatted factoids,
+                from build_formatted_factoid_data
+            chunk_size (int, optional): The size to gather pieces up to before yielding
 
-        Returns:
-            str: The result html file
+        Yields:
+            bytes: The next chunk of the html file
         """
-
-        body_contents = ""
-
-        output_data = self.build_formatted_factoid_data(factoids, aliases)
-
-        if not output_data:
-            # Something is wrong with the database if we are ever here
-            return None
+        buffer = bytearray(
+            f"""
+        <!DOCTYPE html>
+        <html>
+        <body>
+        <h3>Factoids for {guild.name}</h3>
+        <ul>""".encode(
+                "utf-8"
+            )
+        )
 
         for factoid in output_data:
-            name, data = next(iter(factoid.items()))
+            ((name, data),) = factoid.items()
             embed_text = " (embed)" if data["embed"] else ""
 
             if "aliases" in data:
-                body_contents += (
+                buffer += (
                     f"<li><code>{name} [{', '.join(data['aliases'])}]{embed_text}"
                     + f" - {data['message']}</code></li>"
-                )
+                ).encode("utf-8")
             else:
-                body_contents += (
+                buffer += (
                     f"<li><code>{name}{embed_text}"
                     + f" - {data['message']}</code></li>"
-                )
+                ).encode("utf-8")
 
-        if body_contents == "":
-            return None
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
 
-        body_contents = f"<ul>{body_contents}</ul>"
-        output = (
-            f"""
-        <!DOCTYPE html>
-        <html>
-        <body>
-        <h3>Factoids for {guild.name}</h3>
-        {body_contents}
-        <style>"""
-            + """
+        buffer += """</ul>
+        <style>
         ul {
             display: table;
             width: auto;
@@ -1956,9 +1958,10 @@ class FactoidManager(cogs.MatchCog):
         </style>
         </body>
         </html>
-        """
+        """.encode(
+            "utf-8"
         )
-        return output
+        yield bytes(buffer)
 
     async def send_factoids_as_file(
         self: Self,
@@ -79,6 +79,19 @@ async def setup(bot: bot.TechSupportBot) -> None:
 class ServerGate(cogs.MatchCog):
     """Class to get the server gate from config."""
 
+    def match_channels(self: Self, config: munch.Munch) -> set[int]:
+        """Gets the gate channel, the only channel the gate matches in
+
+        Args:
+            config (munch.Munch): The config for the guild to get the channel from
+
+        Returns:
+            set[int]: A set with the gate channel ID, or an empty set if there is no gate
+        """
+        if not config.extensions.gate.channel.value:
+            return set()
+        return {int(config.extensions.gate.channel.value)}
+
     async def match(
         self: Self, config: munch.Munch, ctx: commands.Context, _: str
     ) -> bool:
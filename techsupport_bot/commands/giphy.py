@@ -78,6 +78,7 @@ class Giphy(cogs.BaseCog):
                 self.bot.file_config.api.api_keys.giphy,
                 self.SEARCH_LIMIT,
             ),
+            use_cache=True,
         )
 
         data = response.get("data")
@@ -70,6 +70,9 @@ class Helper(cogs.BaseCog):
         app_command_list = list(self.bot.tree.walk_commands())
 
         command_prefix = await self.bot.get_prefix(ctx.message)
+        enabled_extensions = self.bot.guild_configs.snapshot(
+            ctx.guild.id
+        ).enabled_extensions
 
         # Build a list of custom command objects from the lists
         # Will include aliases and full command names
@@ -83,8 +86,7 @@ class Helper(cogs.BaseCog):
 
             # Check if extension is enabled
             extension_name = self.bot.get_command_extension_name(command)
-            config = self.bot.guild_configs[str(ctx.guild.id)]
-            if extension_name not in config.enabled_extensions:
+            if extension_name not in enabled_extensions:
                 continue
 
             # Deal with aliases by looping through all parent groups and alises
@@ -122,8 +124,7 @@ class Helper(cogs.BaseCog):
 
             # Check if extension is enabled
             extension_name = command.extras["module"]
-            config = self.bot.guild_configs[str(ctx.guild.id)]
-            if extension_name not in config.enabled_extensions:
+            if extension_name not in enabled_extensions:
                 continue
 
             # We have to manually build a string representation of the usage
@@ -89,7 +89,9 @@ class KanyeQuotes(cogs.LoopCog):
         Returns:
             str: The raw quote from the API, without any special formatting
         """
-        response = await self.bot.http_functions.http_call("get", self.API_URL)
+        response = await self.bot.http_functions.http_call(
+            "get", self.API_URL, rate_limit_wait=30
+        )
         return response.get("quote")
 
     async def execute(self: Self, config: munch.Munch, guild: discord.Guild) -> None:
@@ -126,7 +126,9 @@ class News(cogs.LoopCog):
         if category:
             url = f"{url}&category={category}"
 
-        response = await self.bot.http_functions.http_call("get", url)
+        response = await self.bot.http_functions.http_call(
+            "get", url, rate_limit_wait=30
+        )
 
         articles = response.get("articles")
         if not articles:
@@ -0,0 +1,91 @@
+"""
+Commands which show the recorded latency of commands
+The cog in the file is named:
+    Perf
+
+This file contains 1 command:
+    /perf
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Self
+
+import discord
+from core import auxiliary, cogs
+from discord import app_commands
+
+if TYPE_CHECKING:
+    import bot
+
+
+async def setup(bot: bot.TechSupportBot) -> None:
+    """Loading the Perf plugin into the bot
+
+    Args:
+        bot (bot.TechSupportBot): The bot object to register the cogs to
+    """
+    await bot.add_cog(Perf(bot=bot))
+
+
+def format_seconds(seconds: float) -> str:
+    """Formats a duration as milliseconds for the perf embed
+
+    Args:
+        seconds (float): The duration in seconds
+
+    Returns:
+        str: The duration in milliseconds, with no decimals
+    """
+    return f"{seconds * 1000:.0f}ms"
+
+
+class Perf(cogs.BaseCog):
+    """
+    The class that holds the perf command
+    """
+
+    @app_commands.check(auxiliary.bot_admin_check_interaction)
+    @app_commands.command(
+        name="perf",
+        description="Shows the slowest commands since the bot started",
+        extras={
+            "module": "perf",
+        },
+    )
+    async def perf(
+        self: Self, interaction: discord.Interaction, limit: int = 10
+    ) -> None:
+        """Shows the latency percentiles of the slowest commands
+
+        Args:
+            interaction (discord.Interaction): The interaction that called this command
+            limit (int): The most commands to show, up to 25
+        """
+        slowest = self.bot.perf.top(limit=max(1, min(limit, 25)))
+        if not slowest:
+            embed = auxiliary.prepare_deny_embed(
+                message="No commands have been run since the bot started"
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title="Slowest commands by p95", color=discord.Color.blurple()
+        )
+        for stats in slowest:
+            embed.add_field(
+                name=f"{stats.name} ({stats.wall.count} runs, {stats.errors} errors)",
+                value=(
+                    f"Wall: p50 `{format_seconds(stats.wall.percentile(50))}`"
+                    f" p95 `{format_seconds(stats.wall.percentile(95))}`"
+                    f" p99 `{format_seconds(stats.wall.percentile(99))}`\n"
+                    f"HTTP p95: `{format_seconds(stats.http.percentile(95))}`"
+                    f" DB p95: `{format_seconds(stats.db.percentile(95))}`"
+                    f" Queries/run: `{stats.queries / stats.wall.count:.1f}`"
+                ),
+                inline=False,
+            )
+        embed.set_footer(text="Percentiles are estimated from fixed size histograms")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -14,7 +14,7 @@ import expiringdict
 import munch
 import ui
 from botlogging import LogContext, LogLevel
-from core import auxiliary, cogs, extensionconfig
+from core import auxiliary, cogs, extensionconfig, guildconfig
 from discord.ext import commands
 
 if TYPE_CHECKING:
@@ -151,6 +151,7 @@ class Protector(cogs.MatchCog):
         ALERT_ICON_URL (str): The icon for the alert messages
         CLIPBOARD_ICON_URL (str): The icon for the paste messages
         CHARS_PER_NEWLINE (int): The arbitrary length of a line
+        MATCH_ORDER (int): Protect is matched before any other match cog
 
     """
 
@@ -162,6 +163,7 @@ class Protector(cogs.MatchCog):
         "https://icon-icons.com/icons2/203/PNG/128/diagram-30_24487.png"
     )
     CHARS_PER_NEWLINE: int = 80
+    MATCH_ORDER: int = 10
 
     async def preconfig(self: Self) -> None:
         """Method to preconfig the protect."""
@@ -169,6 +171,22 @@ class Protector(cogs.MatchCog):
             max_len=100, max_age_seconds=3600
         )
 
+    def match_channels(self: Self, config: munch.Munch) -> set[int]:
+        """Gets the protected channels, the only channels protect matches in
+
+        Args:
+            config (munch.Munch): The guild config to get the channels from
+
+        Returns:
+            set[int]: The set of protected channel IDs
+        """
+        snapshot = self.bot.guild_configs.snapshot(config.guild_id)
+        if snapshot and snapshot.config is config:
+            return set(snapshot.protect_channels)
+        return {
+            int(channel_id) for channel_id in config.extensions.protect.channels.value
+        }
+
     async def match(
         self: Self, config: munch.Munch, ctx: commands.Context, content: str
     ) -> bool:
@@ -183,8 +201,12 @@ class Protector(cogs.MatchCog):
         Returns:
             bool: False if the message shouldn't be checked, True if it should
         """
+        snapshot = self.bot.guild_configs.snapshot(ctx.guild.id)
+        if not snapshot or snapshot.config is not config:
+            snapshot = guildconfig.compile_guild_config(ctx.guild.id, config)
+
         # exit the match based on exclusion parameters
-        if not str(ctx.channel.id) in config.extensions.protect.channels.value:
+        if ctx.channel.id not in snapshot.protect_channels:
             await self.bot.logger.send_log(
                 message="Channel not in protected channels - ignoring protect check",
                 level=LogLevel.DEBUG,
@@ -192,15 +214,13 @@ class Protector(cogs.MatchCog):
             )
             return False
 
-        role_names = [role.name.lower() for role in getattr(ctx.author, "roles", [])]
-
         if any(
-            role_name.lower() in role_names
-            for role_name in config.extensions.protect.bypass_roles.value
+            role.name.lower() in snapshot.protect_bypass_roles
+            for role in getattr(ctx.author, "roles", [])
         ):
             return False
 
-        if ctx.author.id in config.extensions.protect.bypass_ids.value:
+        if ctx.author.id in snapshot.protect_bypass_ids:
             return False
 
         return True
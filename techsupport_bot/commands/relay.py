@@ -59,6 +59,20 @@ class DiscordToIRC(cogs.MatchCog):
             self.mapping.put(
                 irc_discord_map.discord_channel_id, irc_discord_map.irc_channel_id
             )
+        self.bot.match_dispatcher.invalidate()
+
+    def match_channels(self: Self, _config: munch.Munch) -> set[int]:
+        """Gets every discord channel that is linked to IRC
+
+        Args:
+            _config (munch.Munch): The config of the guild, unused as links are global
+
+        Returns:
+            set[int]: The set of linked discord channel IDs
+        """
+        if not self.mapping:
+            return set()
+        return {int(channel_id) for channel_id in self.mapping.keys()}
 
     async def match(
         self: Self, config: munch.Munch, ctx: commands.Context, content: str
@@ -335,6 +349,7 @@ class DiscordToIRC(cogs.MatchCog):
         self.mapping.put(
             irc_discord_map.discord_channel_id, irc_discord_map.irc_channel_id
         )
+        self.bot.match_dispatcher.invalidate(ctx.guild.id)
 
         await irc_discord_map.create()
         await auxiliary.send_confirm_embed(
@@ -380,6 +395,7 @@ class DiscordToIRC(cogs.MatchCog):
             return
 
         irc_channel = self.mapping.pop(str(ctx.channel.id))
+        self.bot.match_dispatcher.invalidate(ctx.guild.id)
 
         db_link = await self.bot.models.IRCChannelMapping.query.where(
             self.bot.models.IRCChannelMapping.discord_channel_id == str(ctx.channel.id)
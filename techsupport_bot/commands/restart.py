@@ -60,6 +60,9 @@ class Restarter(cogs.BaseCog):
         if modmail_cog:
             await modmail_cog.handle_reboot()
 
+        # Write any guild config changes that are still queued
+        await self.bot.config_writer.flush_all()
+
         # Ending the event loop
         self.bot.loop.stop()
 
@@ -90,7 +90,7 @@ class Spotify(cogs.BaseCog):
         headers = {"Authorization": f"Bearer {oauth_token}"}
         params = {"q": query, "type": "track", "market": "US", "limit": 3}
         response = await self.bot.http_functions.http_call(
-            "get", self.API_URL, headers=headers, params=params
+            "get", self.API_URL, headers=headers, params=params, use_cache=True
         )
 
         items = response.get("tracks", {}).get("items", [])
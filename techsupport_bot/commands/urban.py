@@ -62,7 +62,7 @@ class UrbanDictionary(cogs.BaseCog):
             query (str): The query to urban dictionary
         """
         response = await self.bot.http_functions.http_call(
-            "get", f"{self.BASE_URL}{query}"
+            "get", f"{self.BASE_URL}{query}", use_cache=True
         )
         definitions = response.get("list")
 
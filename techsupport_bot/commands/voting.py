@@ -20,6 +20,7 @@ import ui
 import ui.persistent_voting
 from core import cogs, extensionconfig
 from discord import app_commands
+from sqlalchemy.dialects import postgresql
 
 if TYPE_CHECKING:
     import bot
@@ -179,17 +180,27 @@ class Voting(cogs.LoopCog):
             ),
             inline=False,
         )
+        ballots = await self.get_ballots(vote_id)
+        voters_yes = [ballot.voter_id for ballot in ballots if ballot.choice]
+        voters_no = [ballot.voter_id for ballot in ballots if not ballot.choice]
         embed.add_field(
             name="Votes",
             value=await self.make_fancy_voting_list(
                 guild,
-                db_entry.vote_ids_yes.split(","),
-                db_entry.vote_ids_no.split(","),
+                voters_yes,
+                voters_no,
                 (db_entry.vote_active and hide) or db_entry.anonymous,
             ),
         )
-        print_yes_votes = "?" if (hide and db_entry.vote_active) else db_entry.votes_yes
-        print_no_votes = "?" if (hide and db_entry.vote_active) else db_entry.votes_no
+        # The ballots are already fetched for the list, so counting them here
+        # saves a second query. The ballots of an ended anonymous vote are gone,
+        # so the stored result is used once the vote is over
+        if db_entry.vote_active:
+            votes_yes, votes_no = len(voters_yes), len(voters_no)
+        else:
+            votes_yes, votes_no = db_entry.votes_yes, db_entry.votes_no
+        print_yes_votes = "?" if (hide and db_entry.vote_active) else votes_yes
+        print_no_votes = "?" if (hide and db_entry.vote_active) else votes_no
         embed.add_field(
             name="Vote counts",
             value=f"Votes for yes: {print_yes_votes}\nVotes for no: {print_no_votes}",
@@ -224,8 +235,6 @@ class Voting(cogs.LoopCog):
         voters = voters_yes + voters_no
         final_str = []
         for user in voters:
-            if len(user) == 0:
-                continue
             user_object = await guild.fetch_member(int(user))
             if should_hide:
                 final_str.append(f"{user_object.display_name} - ?")
@@ -236,101 +245,123 @@ class Voting(cogs.LoopCog):
         final_str.sort()
         return "\n".join(final_str)
 
-    async def register_yes_vote(
+    async def get_ballots(self: Self, vote_id: int) -> list[munch.Munch]:
+        """Gets every ballot cast in a vote
+
+        Args:
+            vote_id (int): The ID of the vote
+
+        Returns:
+            list[munch.Munch]: The ballots of the vote
+        """
+        return await self.bot.models.VoteBallot.query.where(
+            self.bot.models.VoteBallot.vote_id == vote_id
+        ).gino.all()
+
+    async def count_ballots(self: Self, vote_id: int) -> tuple[int, int]:
+        """Counts the ballots of a vote in the database
+
+        Args:
+            vote_id (int): The ID of the vote
+
+        Returns:
+            tuple[int, int]: The number of votes for yes, and the number for no
+        """
+        ballot = self.bot.models.VoteBallot
+        votes_yes, votes_no = await self.bot.db.first(
+            self.bot.db.select(
+                [
+                    self.bot.db.func.count().filter(ballot.choice.is_(True)),
+                    self.bot.db.func.count().filter(ballot.choice.is_(False)),
+                ]
+            ).where(ballot.vote_id == vote_id)
+        )
+        return votes_yes, votes_no
+
+    async def cast_ballot(
+        self: Self, vote_id: int, voter_id: int, choice: bool
+    ) -> bool:
+        """Records a ballot with a single statement, replacing any other choice
+        the voter made before. Safe when many people vote at the same time
+
+        Args:
+            vote_id (int): The ID of the vote
+            voter_id (int): The ID of the user voting
+            choice (bool): True to vote yes, False to vote no
+
+        Returns:
+            bool: False if the voter had already made this choice
+        """
+        table = self.bot.models.VoteBallot.__table__
+        statement = postgresql.insert(table).values(
+            vote_id=vote_id,
+            voter_id=voter_id,
+            choice=choice,
+            voted_at=datetime.datetime.utcnow(),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["vote_id", "voter_id"],
+            set_={
+                "choice": statement.excluded.choice,
+                "voted_at": statement.excluded.voted_at,
+            },
+            where=table.c.choice != statement.excluded.choice,
+        ).returning(table.c.vote_id)
+        return await self.bot.db.first(statement) is not None
+
+    async def register_vote(
         self: Self,
         interaction: discord.Interaction,
         view: discord.ui.View,
+        choice: bool,
     ) -> None:
-        """This updates the vote database when someone votes yes
+        """This updates the vote database when someone votes
 
         Args:
             interaction (discord.Interaction): The interaction that started the vote
             view (discord.ui.View): The view that was interacted with
+            choice (bool): True if the vote is for yes, False if for no
         """
+        choice_name = "yes" if choice else "no"
         db_entry = await self.search_db_for_vote_by_message(str(interaction.message.id))
 
-        # Update vote_ids_yes
-        vote_ids_yes = db_entry.vote_ids_yes.split(",")
-        if str(interaction.user.id) in vote_ids_yes:
+        if not await self.cast_ballot(db_entry.vote_id, interaction.user.id, choice):
             await interaction.response.send_message(
-                "You have already voted yes", ephemeral=True
+                f"You have already voted {choice_name}", ephemeral=True
             )
-            return  # Already voted yes, don't do anything more
-
-        db_entry = self.clear_vote_record(db_entry, str(interaction.user.id))
-
-        vote_ids_yes.append(str(interaction.user.id))
-        db_entry.vote_ids_yes = ",".join(vote_ids_yes)
-
-        # Increment votes_yes
-        db_entry.votes_yes += 1
-
-        # Update vote_ids_all
-        vote_ids_all = db_entry.vote_ids_all.split(",")
-        vote_ids_all.append(str(interaction.user.id))
-        db_entry.vote_ids_all = ",".join(vote_ids_all)
-
-        await db_entry.update(
-            vote_ids_no=db_entry.vote_ids_no,
-            votes_no=db_entry.votes_no,
-            vote_ids_yes=db_entry.vote_ids_yes,
-            votes_yes=db_entry.votes_yes,
-            vote_ids_all=db_entry.vote_ids_all,
-        ).apply()
+            return  # Already voted for this, don't do anything more
 
         embed = await self.build_vote_embed(db_entry.vote_id, interaction.guild)
         await interaction.message.edit(embed=embed, view=view)
         await interaction.response.send_message(
-            "Your vote for yes has been counted", ephemeral=True
+            f"Your vote for {choice_name} has been counted", ephemeral=True
         )
 
-    async def register_no_vote(
+    async def register_yes_vote(
         self: Self,
         interaction: discord.Interaction,
         view: discord.ui.View,
     ) -> None:
-        """This updates the vote database when someone votes no
+        """This updates the vote database when someone votes yes
 
         Args:
             interaction (discord.Interaction): The interaction that started the vote
             view (discord.ui.View): The view that was interacted with
         """
-        db_entry = await self.search_db_for_vote_by_message(str(interaction.message.id))
+        await self.register_vote(interaction, view, choice=True)
 
-        # Update vote_ids_no
-        vote_ids_no = db_entry.vote_ids_no.split(",")
-        if str(interaction.user.id) in vote_ids_no:
-            await interaction.response.send_message(
-                "You have already voted no", ephemeral=True
-            )
-            return  # Already voted no, don't do anything more
-
-        db_entry = self.clear_vote_record(db_entry, str(interaction.user.id))
-
-        vote_ids_no.append(str(interaction.user.id))
-        db_entry.vote_ids_no = ",".join(vote_ids_no)
-
-        # Increment votes_no
-        db_entry.votes_no += 1
-
-        # Update vote_ids_all
-        vote_ids_all = db_entry.vote_ids_all.split(",")
-        vote_ids_all.append(str(interaction.user.id))
-        db_entry.vote_ids_all = ",".join(vote_ids_all)
-
-        await db_entry.update(
-            vote_ids_no=db_entry.vote_ids_no,
-            votes_no=db_entry.votes_no,
-            vote_ids_yes=db_entry.vote_ids_yes,
-            votes_yes=db_entry.votes_yes,
-            vote_ids_all=db_entry.vote_ids_all,
-        ).apply()
+    async def register_no_vote(
+        self: Self,
+        interaction: discord.Interaction,
+        view: discord.ui.View,
+    ) -> None:
+        """This updates the vote database when someone votes no
 
-        embed = await self.build_vote_embed(db_entry.vote_id, interaction.guild)
-        await interaction.message.edit(embed=embed, view=view)
-        await interaction.response.send_message(
-            "Your vote for no has been counted", ephemeral=True
-        )
+        Args:
+            interaction (discord.Interaction): The interaction that started the vote
+            view (discord.ui.View): The view that was interacted with
+        """
+        await self.register_vote(interaction, view, choice=False)
 
     async def clear_vote(
         self: Self,
@@ -345,15 +376,11 @@ class Voting(cogs.LoopCog):
         """
         db_entry = await self.search_db_for_vote_by_message(str(interaction.message.id))
 
-        db_entry = self.clear_vote_record(db_entry, str(interaction.user.id))
-
-        await db_entry.update(
-            vote_ids_no=db_entry.vote_ids_no,
-            votes_no=db_entry.votes_no,
-            vote_ids_yes=db_entry.vote_ids_yes,
-            votes_yes=db_entry.votes_yes,
-            vote_ids_all=db_entry.vote_ids_all,
-        ).apply()
+        await self.bot.models.VoteBallot.delete.where(
+            self.bot.models.VoteBallot.vote_id == db_entry.vote_id
+        ).where(
+            self.bot.models.VoteBallot.voter_id == interaction.user.id
+        ).gino.status()
 
         embed = await self.build_vote_embed(db_entry.vote_id, interaction.guild)
         await interaction.message.edit(embed=embed, view=view)
@@ -361,41 +388,6 @@ class Voting(cogs.LoopCog):
             "Your vote has been removed", ephemeral=True
         )
 
-    def clear_vote_record(
-        self: Self, db_entry: munch.Munch, user_id: str
-    ) -> munch.Munch:
-        """Clears the vote from a person from the database
-        Should always be called before changing or adding a vote
-
-        Args:
-            db_entry (munch.Munch): The database entry of the vote
-            user_id (str): The user ID who is voting
-
-        Returns:
-            munch.Munch: The updated database entry that has NOT been synced to postgres
-        """
-        # If there is a vote for yes, remove it
-        vote_ids_yes = db_entry.vote_ids_yes.split(",")
-        if user_id in vote_ids_yes:
-            vote_ids_yes.remove(user_id)
-            db_entry.votes_yes -= 1
-        db_entry.vote_ids_yes = ",".join(vote_ids_yes)
-
-        # If there is a vote for no, remote it
-        vote_ids_no = db_entry.vote_ids_no.split(",")
-        if user_id in vote_ids_no:
-            vote_ids_no.remove(user_id)
-            db_entry.votes_no -= 1
-        db_entry.vote_ids_no = ",".join(vote_ids_no)
-
-        # Remove from vote id all
-        vote_ids_all = db_entry.vote_ids_all.split(",")
-        if user_id in vote_ids_all:
-            vote_ids_all.remove(user_id)
-        db_entry.vote_ids_all = ",".join(vote_ids_all)
-
-        return db_entry
-
     async def wait(self: Self, config: munch.Munch, _: discord.Guild) -> None:
         """Makes a check every hour for if any votes have concluded
 
@@ -433,11 +425,19 @@ class Voting(cogs.LoopCog):
             vote (munch.Munch): The vote database object that needs to be ended
             guild (discord.Guild): The guild that vote belongs to
         """
-        await vote.update(vote_active=False).apply()
+        votes_yes, votes_no = await self.count_ballots(vote.vote_id)
+        await vote.update(
+            vote_active=False,
+            votes_yes=votes_yes,
+            votes_no=votes_no,
+            votes_total=votes_yes + votes_no,
+        ).apply()
         embed = await self.build_vote_embed(vote.vote_id, guild)
         # If the vote is anonymous, at this point we need to clear the vote record forever
         if vote.anonymous:
-            await vote.update(vote_ids_yes="", vote_ids_no="").apply()
+            await self.bot.models.VoteBallot.delete.where(
+                self.bot.models.VoteBallot.vote_id == vote.vote_id
+            ).gino.status()
 
         channel = await guild.fetch_channel(int(vote.thread_id))
         message = await channel.fetch_message(int(vote.message_id))
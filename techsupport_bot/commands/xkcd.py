@@ -154,7 +154,10 @@ class XKCD(cogs.BaseCog):
             munch.Munch: The response from the API
         """
         url = self.SPECIFIC_API_URL % (number) if number else self.MOST_RECENT_API_URL
-        response = await self.bot.http_functions.http_call("get", url)
+        # A numbered comic never changes, so it can be cached
+        response = await self.bot.http_functions.http_call(
+            "get", url, use_cache=bool(number)
+        )
 
         return response
 
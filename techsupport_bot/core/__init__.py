@@ -4,4 +4,6 @@ from .auxiliary import *
 from .cogs import *
 from .custom_errors import *
 from .databases import *
+from .guildconfig import *
 from .http import *
+from .ratelimit import *
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Self
 
 import discord
 import munch
 from botlogging import LogContext, LogLevel
+from core import httplimit
 from discord.ext import commands
 
 if TYPE_CHECKING:
@@ -54,8 +56,11 @@ class BaseCog(commands.Cog):
         Args:
             handler (Callable[..., Awaitable[None]]): the preconfig handler
         """
+        # Counted before waiting, so the report waits for every startup preconfig
+        self.bot.startup_report.start_preconfig()
         await self.bot.wait_until_ready()
 
+        start_time = time.perf_counter()
         try:
             await handler()
         except Exception as exception:
@@ -66,6 +71,12 @@ class BaseCog(commands.Cog):
             )
             if not self.KEEP_COG_ON_FAILURE:
                 await self.bot.remove_cog(self)
+        finally:
+            if self.bot.startup_report.record_preconfig(
+                self.__module__.rsplit(".", maxsplit=1)[-1],
+                time.perf_counter() - start_time,
+            ):
+                self.bot.logger.console.info(self.bot.startup_report.format())
 
     async def _preconfig(self: Self) -> None:
         """Blocks the preconfig until the bot is ready."""
@@ -84,11 +95,17 @@ class BaseCog(commands.Cog):
             bool: True if the extension is enabled for the context
                 False if it isn't
         """
-        if config is None:
-            config = {}
-        if self.no_guild or self.extension_name in config.get("enabled_extensions", []):
+        if self.no_guild:
             return True
-        return False
+        if config is None:
+            return False
+
+        # Use the compiled set if the config is the one currently cached
+        snapshot = self.bot.guild_configs.snapshot(config.get("guild_id"))
+        if snapshot and snapshot.config is config:
+            return self.extension_name in snapshot.enabled_extensions
+
+        return self.extension_name in config.get("enabled_extensions", [])
 
 
 class MatchCog(BaseCog):
@@ -96,45 +113,56 @@ class MatchCog(BaseCog):
     Cog for matching a specific context criteria and responding.
 
     This makes the process of handling events simpler for development.
+    Messages are not listened for by the cog itself, instead the bot hands
+    every message to the MatchDispatcher, which calls match() on every registered cog.
 
     Attributes:
         COG_TYPE (str): The string representation for the type of cog
+        MATCH_ORDER (int): The order this cog is matched in, lowest first
     """
 
     COG_TYPE: str = "Match"
+    MATCH_ORDER: int = 100
 
-    @commands.Cog.listener()
-    async def on_message(self: Self, message: discord.Message) -> None:
-        """Listens for a message and passes it to the response handler if valid.
+    async def cog_load(self: Self) -> None:
+        """Registers this cog with the bots shared match dispatcher."""
+        self.bot.match_dispatcher.register(self)
 
-        Args:
-            message (discord.Message): the message object
-        """
-        if message.author == self.bot.user:
-            return
+    async def cog_unload(self: Self) -> None:
+        """Removes this cog from the bots shared match dispatcher."""
+        self.bot.match_dispatcher.unregister(self)
 
-        ctx = await self.bot.get_context(message)
+    def match_channels(self: Self, _config: munch.Munch) -> set[int] | None:
+        """Gets the channel IDs this cog can match messages in.
+        The MatchDispatcher uses this to skip the cog for messages in any other channel
 
-        config = self.bot.guild_configs[str(ctx.guild.id)]
-        if not config:
-            return
+        Args:
+            _config (munch.Munch): the config of the guild to get the channels for
 
-        if not self.extension_enabled(config):
-            return
+        Returns:
+            set[int] | None: The set of channel IDs to match in,
+                or None if messages in every channel need to be matched
+        """
+        return None
 
-        result = await self.match(config, ctx, message.content)
-        if not result:
-            return
+    async def handle_response(
+        self: Self,
+        config: munch.Munch,
+        ctx: commands.Context,
+        content: str,
+        result: bool,
+    ) -> None:
+        """Calls the response function, logging any error that is raised.
 
+        Args:
+            config (munch.Munch): the config associated with the context
+            ctx (commands.Context): the context object
+            content (str): the message content
+            result (bool): the boolean result from match()
+        """
         try:
-            await self.response(config, ctx, message.content, result)
+            await self.response(config, ctx, content, result)
         except Exception as exception:
-            await self.bot.logger.send_log(
-                message="Checking config for log channel",
-                level=LogLevel.DEBUG,
-                context=LogContext(guild=ctx.guild, channel=ctx.channel),
-            )
-            config = self.bot.guild_configs[str(ctx.guild.id)]
             channel = config.get("logging_channel")
             await self.bot.logger.send_log(
                 message=f"Match cog error: {self.__class__.__name__} {exception}!",
@@ -177,6 +205,172 @@ class MatchCog(BaseCog):
         """
 
 
+class MatchDispatcher:
+    """The single message pipeline for every MatchCog.
+    The context and guild config are built once per message and
+    then handed to every registered match cog in MATCH_ORDER
+
+    Args:
+        bot (bot.TechSupportBot): the bot object
+    """
+
+    def __init__(self: Self, bot: bot.TechSupportBot) -> None:
+        self.bot = bot
+        self.match_cogs: list[MatchCog] = []
+        # guild ID: (config version the index was built from, channel ID: cogs, global cogs)
+        self.channel_index: dict[
+            int, tuple[int, dict[int, set[MatchCog]], set[MatchCog]]
+        ] = {}
+        self.match_counter = bot.metrics.counter(
+            "techsupport_match_checks_total", "Messages checked by each match cog"
+        )
+        self.response_counter = bot.metrics.counter(
+            "techsupport_match_responses_total", "Messages matched by each match cog"
+        )
+
+    def register(self: Self, cog: MatchCog) -> None:
+        """Adds a match cog to the dispatcher, keeping the list in MATCH_ORDER
+
+        Args:
+            cog (MatchCog): the cog to start sending messages to
+        """
+        if cog in self.match_cogs:
+            return
+        self.match_cogs.append(cog)
+        # sort is stable, so cogs with the same order stay in load order
+        self.match_cogs.sort(key=lambda match_cog: match_cog.MATCH_ORDER)
+        self.invalidate()
+
+    def unregister(self: Self, cog: MatchCog) -> None:
+        """Removes a match cog from the dispatcher
+
+        Args:
+            cog (MatchCog): the cog to stop sending messages to
+        """
+        if cog in self.match_cogs:
+            self.match_cogs.remove(cog)
+        self.invalidate()
+
+    def invalidate(self: Self, guild_id: int = None) -> None:
+        """Drops the channel index, so it is rebuilt on the next message.
+        The index is rebuilt by itself when the guild config version changes,
+        this only needs to be called when channels change some other way
+
+        Args:
+            guild_id (int, optional): The guild to drop the index for.
+                Defaults to None, which drops every guild
+        """
+        if guild_id is None:
+            self.channel_index.clear()
+            return
+        self.channel_index.pop(int(guild_id), None)
+
+    def build_channel_index(
+        self: Self, config: munch.Munch
+    ) -> tuple[dict[int, set[MatchCog]], set[MatchCog]]:
+        """Builds the lookup of which match cogs care about which channels in a guild
+
+        Args:
+            config (munch.Munch): the guild config to build the index from
+
+        Returns:
+            tuple[dict[int, set[MatchCog]], set[MatchCog]]: The channel ID to cogs map,
+                and the set of cogs that need to see every message
+        """
+        channel_map: dict[int, set[MatchCog]] = {}
+        global_cogs: set[MatchCog] = set()
+        for cog in self.match_cogs:
+            try:
+                channels = cog.match_channels(config)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                # If the config can't be read, let match() decide what to do
+                channels = None
+
+            if channels is None:
+                global_cogs.add(cog)
+                continue
+
+            for channel_id in channels:
+                channel_map.setdefault(channel_id, set()).add(cog)
+
+        return channel_map, global_cogs
+
+    def get_channel_cogs(
+        self: Self,
+        config: munch.Munch,
+        guild: discord.Guild,
+        channel: discord.abc.Messageable,
+    ) -> list[MatchCog]:
+        """Gets every match cog that could match a message in a channel, in MATCH_ORDER
+        Threads are looked up by both their own ID and their parent channel ID
+
+        Args:
+            config (munch.Munch): the config of the guild the channel is in
+            guild (discord.Guild): the guild the message was sent in
+            channel (discord.abc.Messageable): the channel the message was sent in
+
+        Returns:
+            list[MatchCog]: The cogs to call match() on
+        """
+        guild_id = guild.id
+        snapshot = self.bot.guild_configs.snapshot(guild_id)
+        version = snapshot.version if snapshot else None
+        index = self.channel_index.get(guild_id)
+        if not index or index[0] != version:
+            index = (version, *self.build_channel_index(config))
+            self.channel_index[guild_id] = index
+
+        _, channel_map, global_cogs = index
+        candidates = global_cogs | channel_map.get(channel.id, set())
+        parent_id = getattr(channel, "parent_id", None)
+        if parent_id:
+            candidates = candidates | channel_map.get(parent_id, set())
+
+        return [cog for cog in self.match_cogs if cog in candidates]
+
+    async def dispatch(self: Self, ctx: commands.Context) -> None:
+        """Runs every registered match cog against a message.
+        Matches are checked in order, and every matched response is then run concurrently
+
+        Args:
+            ctx (commands.Context): the context built for the message
+        """
+        message = ctx.message
+        if message.author == self.bot.user or not ctx.guild:
+            return
+
+        config = self.bot.guild_configs.get(str(ctx.guild.id))
+        if not config:
+            return
+
+        responses = []
+        for cog in self.get_channel_cogs(config, ctx.guild, ctx.channel):
+            if not cog.extension_enabled(config):
+                continue
+
+            self.match_counter.inc(cog=cog.extension_name)
+            try:
+                result = await cog.match(config, ctx, message.content)
+            except Exception as exception:
+                await self.bot.logger.send_log(
+                    message=f"Match cog error: {cog.__class__.__name__} {exception}!",
+                    level=LogLevel.ERROR,
+                    channel=config.get("logging_channel"),
+                    context=LogContext(guild=ctx.guild, channel=ctx.channel),
+                    exception=exception,
+                )
+                continue
+
+            if result:
+                self.response_counter.inc(cog=cog.extension_name)
+                responses.append(
+                    cog.handle_response(config, ctx, message.content, result)
+                )
+
+        if responses:
+            await asyncio.gather(*responses)
+
+
 class LoopCog(BaseCog):
     """Cog for various types of looping including cron-config.
 
@@ -204,6 +398,21 @@ class LoopCog(BaseCog):
         super().__init__(*args, **kwargs)
         asyncio.create_task(self._loop_preconfig())
         self.channels = {}
+        self.loop_tasks: set[asyncio.Task] = set()
+
+    def start_loop_task(
+        self: Self, guild: discord.Guild, target_channel: discord.abc.Messageable = None
+    ) -> None:
+        """Starts a loop task, keeping track of it until it finishes
+
+        Args:
+            guild (discord.Guild): the guild associated with the execution
+            target_channel (discord.abc.Messageable): The channel to run the loop in,
+                if the loop is channel specific
+        """
+        task = asyncio.create_task(self._loop_execute(guild, target_channel))
+        self.loop_tasks.add(task)
+        task.add_done_callback(self.loop_tasks.discard)
 
     async def register_new_tasks(self: Self, guild: discord.Guild) -> None:
         """Creates the configured loop tasks for a given guild.
@@ -230,14 +439,14 @@ class LoopCog(BaseCog):
                     level=LogLevel.DEBUG,
                     context=LogContext(guild=channel.guild, channel=channel),
                 )
-                asyncio.create_task(self._loop_execute(guild, channel))
+                self.start_loop_task(guild, channel)
         else:
             await self.bot.logger.send_log(
                 message=f"Creating loop task for guild with ID {guild.id}",
                 level=LogLevel.DEBUG,
                 context=LogContext(guild=guild),
             )
-            asyncio.create_task(self._loop_execute(guild))
+            self.start_loop_task(guild)
 
     async def _loop_preconfig(self: Self) -> None:
         """Blocks the loop_preconfig until the bot is ready."""
@@ -248,7 +457,7 @@ class LoopCog(BaseCog):
                 message="Creating global loop task",
                 level=LogLevel.DEBUG,
             )
-            asyncio.create_task(self._loop_execute(None))
+            self.start_loop_task(None)
             return
 
         for guild in self.bot.guilds:
@@ -321,7 +530,7 @@ class LoopCog(BaseCog):
                             level=LogLevel.DEBUG,
                             context=LogContext(guild=channel.guild, channel=channel),
                         )
-                        asyncio.create_task(self._loop_execute(guild, channel))
+                        self.start_loop_task(guild, channel)
 
                     new_registered_channels.append(channel)
 
@@ -342,6 +551,10 @@ class LoopCog(BaseCog):
         """
         config = self.bot.guild_configs[str(guild.id)]
 
+        # HTTP calls of loops wait behind the HTTP calls of commands
+        httplimit.request_priority.set(httplimit.Priority.BACKGROUND)
+        httplimit.request_guild.set(str(guild.id))
+
         if not self.ON_START:
             await self.wait(config, guild)
 
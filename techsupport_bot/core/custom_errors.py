@@ -67,6 +67,28 @@ class HTTPRateLimit(commands.errors.CommandError):
         self.wait = wait
 
 
+class HTTPHostDown(commands.errors.CommandError):
+    """An API failed too many times in a row, so it isn't being called for now
+
+    Args:
+        wait (float): The amount of seconds left until the API is tried again
+    """
+
+    def __init__(self: Self, wait: float) -> None:
+        self.wait = wait
+
+
+class HTTPResponseTooLarge(commands.errors.CommandError):
+    """An API response was larger than the caller allowed, so it was given up on
+
+    Args:
+        max_bytes (int): The most bytes the caller allowed
+    """
+
+    def __init__(self: Self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+
+
 class ErrorResponse:
     """Object for generating a custom error message from an exception.
 
@@ -252,6 +274,14 @@ COMMAND_ERROR_RESPONSES = {
         "That API is on cooldown. Try again in %.2f seconds",
         {"key": "wait"},
     ),
+    HTTPHostDown: ErrorResponse(
+        "That API isn't responding. Try again in %.2f seconds",
+        {"key": "wait"},
+    ),
+    HTTPResponseTooLarge: ErrorResponse(
+        "That API response was larger than %d bytes",
+        {"key": "max_bytes"},
+    ),
     # -Custom errors-
     FactoidNotFoundError: ErrorResponse(
         "I couldn't find the factoid `%s`", {"key": "argument"}
@@ -5,12 +5,58 @@ All models can be used by any extension
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Self
+
+from sqlalchemy import types
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine.interfaces import Dialect
 
 if TYPE_CHECKING:
     import bot
 
 
+class Snowflake(types.TypeDecorator):  # pylint: disable=abstract-method
+    """A discord ID, stored as a BIGINT.
+    Both ints and strings can be used in queries, and values are read back as strings,
+    so code written for the old String columns keeps working
+
+    Attributes:
+        impl (type): The type the ID is stored as
+        cache_ok (bool): Whether the type can be used in cached statements
+    """
+
+    impl: type = types.BigInteger
+    cache_ok: bool = True
+
+    def process_bind_param(
+        self: Self, value: int | str | None, dialect: Dialect
+    ) -> int | None:
+        """Converts an ID to an int before it is sent to the database
+
+        Args:
+            value (int | str | None): The ID used in the query
+            dialect (Dialect): The database dialect, unused
+
+        Returns:
+            int | None: The ID as an int
+        """
+        return None if value is None else int(value)
+
+    def process_result_value(
+        self: Self, value: int | None, dialect: Dialect
+    ) -> str | None:
+        """Converts an ID read from the database to a string
+
+        Args:
+            value (int | None): The ID as stored
+            dialect (Dialect): The database dialect, unused
+
+        Returns:
+            str | None: The ID as a string
+        """
+        return None if value is None else str(value)
+
+
 def setup_models(bot: bot.TechSupportBot) -> None:
     """A function to setup all of the postgres tables
     This is stored in bot.models variable
@@ -35,11 +81,19 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "applications"
+        __table_args__ = (
+            bot.db.Index(
+                "ix_applications_guild_applicant_status",
+                "guild_id",
+                "applicant_id",
+                "application_status",
+            ),
+        )
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True, autoincrement=True)
-        guild_id: str = bot.db.Column(bot.db.String)
+        guild_id: str = bot.db.Column(Snowflake)
         applicant_name: str = bot.db.Column(bot.db.String)
-        applicant_id: str = bot.db.Column(bot.db.String)
+        applicant_id: str = bot.db.Column(Snowflake)
         application_status: str = bot.db.Column(bot.db.String)
         background: str = bot.db.Column(bot.db.String)
         reason: str = bot.db.Column(bot.db.String)
@@ -58,10 +112,13 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "appbans"
+        __table_args__ = (
+            bot.db.Index("ix_appbans_guild_applicant", "guild_id", "applicant_id"),
+        )
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True, autoincrement=True)
-        guild_id: str = bot.db.Column(bot.db.String)
-        applicant_id: str = bot.db.Column(bot.db.String)
+        guild_id: str = bot.db.Column(Snowflake)
+        applicant_id: str = bot.db.Column(Snowflake)
 
     class DuckUser(bot.db.Model):
         """The postgres table for ducks
@@ -78,10 +135,13 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "duckusers"
+        __table_args__ = (
+            bot.db.Index("ix_duckusers_guild_author", "guild_id", "author_id"),
+        )
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True, autoincrement=True)
-        author_id: str = bot.db.Column(bot.db.String)
-        guild_id: str = bot.db.Column(bot.db.String)
+        author_id: str = bot.db.Column(Snowflake)
+        guild_id: str = bot.db.Column(Snowflake)
         befriend_count: int = bot.db.Column(bot.db.Integer, default=0)
         kill_count: int = bot.db.Column(bot.db.Integer, default=0)
         updated: datetime.datetime = bot.db.Column(
@@ -108,10 +168,11 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "factoids"
+        __table_args__ = (bot.db.Index("ix_factoids_guild_name", "guild", "name"),)
 
         factoid_id: int = bot.db.Column(bot.db.Integer, primary_key=True)
         name: str = bot.db.Column(bot.db.String)
-        guild: str = bot.db.Column(bot.db.String)
+        guild: str = bot.db.Column(Snowflake)
         message: str = bot.db.Column(bot.db.String)
         time: datetime.datetime = bot.db.Column(
             bot.db.DateTime, default=datetime.datetime.utcnow
@@ -140,7 +201,7 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         factoid: int = bot.db.Column(
             bot.db.Integer, bot.db.ForeignKey("factoids.factoid_id")
         )
-        channel: str = bot.db.Column(bot.db.String)
+        channel: str = bot.db.Column(Snowflake)
         cron: str = bot.db.Column(bot.db.String)
 
     class Grab(bot.db.Model):
@@ -158,11 +219,14 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "grabs"
+        __table_args__ = (
+            bot.db.Index("ix_grabs_guild_author_nsfw", "guild", "author_id", "nsfw"),
+        )
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        author_id: str = bot.db.Column(bot.db.String)
-        channel: str = bot.db.Column(bot.db.String)
-        guild: str = bot.db.Column(bot.db.String)
+        author_id: str = bot.db.Column(Snowflake)
+        channel: str = bot.db.Column(Snowflake)
+        guild: str = bot.db.Column(Snowflake)
         message: str = bot.db.Column(bot.db.String)
         time: datetime.datetime = bot.db.Column(
             bot.db.DateTime, default=datetime.datetime.utcnow
@@ -183,8 +247,8 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         __tablename__ = "ircchannelmap"
 
         map_id: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        guild_id: str = bot.db.Column(bot.db.String, default=None)
-        discord_channel_id: str = bot.db.Column(bot.db.String, default=None)
+        guild_id: str = bot.db.Column(Snowflake, default=None)
+        discord_channel_id: str = bot.db.Column(Snowflake, default=None)
         irc_channel_id: str = bot.db.Column(bot.db.String, default=None)
 
     class ModmailBan(bot.db.Model):
@@ -197,7 +261,7 @@ def setup_models(bot: bot.TechSupportBot) -> None:
 
         __tablename__ = "modmail_bans"
 
-        user_id: str = bot.db.Column(bot.db.String, default=None, primary_key=True)
+        user_id: str = bot.db.Column(Snowflake, default=None, primary_key=True)
 
     class UserNote(bot.db.Model):
         """The postgres table for notes
@@ -213,14 +277,19 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "usernote"
+        __table_args__ = (
+            bot.db.Index(
+                "ix_usernote_guild_user_updated", "guild_id", "user_id", "updated"
+            ),
+        )
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True, autoincrement=True)
-        user_id: str = bot.db.Column(bot.db.String)
-        guild_id: str = bot.db.Column(bot.db.String)
+        user_id: str = bot.db.Column(Snowflake)
+        guild_id: str = bot.db.Column(Snowflake)
         updated: datetime.datetime = bot.db.Column(
             bot.db.DateTime, default=datetime.datetime.utcnow
         )
-        author_id: str = bot.db.Column(bot.db.String)
+        author_id: str = bot.db.Column(Snowflake)
         body: str = bot.db.Column(bot.db.String)
 
     class Warning(bot.db.Model):
@@ -236,10 +305,13 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "warnings"
+        __table_args__ = (
+            bot.db.Index("ix_warnings_guild_user", "guild_id", "user_id"),
+        )
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        user_id: str = bot.db.Column(bot.db.String)
-        guild_id: str = bot.db.Column(bot.db.String)
+        user_id: str = bot.db.Column(Snowflake)
+        guild_id: str = bot.db.Column(Snowflake)
         reason: str = bot.db.Column(bot.db.String)
         time: datetime.datetime = bot.db.Column(
             bot.db.DateTime, default=datetime.datetime.utcnow
@@ -252,15 +324,15 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         Attributes:
             pk (int): The primary key for the database
             guild_id (str): The ID of the guild this config is for
-            config (str): The config text
+            config (dict): The config json
             update_time (datetime.datetime): The time the config was last updated
         """
 
         __tablename__ = "guild_config"
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        guild_id: str = bot.db.Column(bot.db.String)
-        config: str = bot.db.Column(bot.db.String)
+        guild_id: str = bot.db.Column(Snowflake, unique=True)
+        config: dict = bot.db.Column(JSONB)
         update_time: datetime.datetime = bot.db.Column(
             bot.db.DateTime, default=datetime.datetime.utcnow
         )
@@ -276,10 +348,11 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "listeners"
+        __table_args__ = (bot.db.Index("ix_listeners_src", "src_id"),)
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        src_id: str = bot.db.Column(bot.db.String)
-        dst_id: str = bot.db.Column(bot.db.String)
+        src_id: str = bot.db.Column(Snowflake)
+        dst_id: str = bot.db.Column(Snowflake)
 
     class Rule(bot.db.Model):
         """The postgres table for rules
@@ -294,7 +367,7 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         __tablename__ = "guild_rules"
 
         pk: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        guild_id: str = bot.db.Column(bot.db.String)
+        guild_id: str = bot.db.Column(Snowflake)
         rules: str = bot.db.Column(bot.db.String)
 
     class Votes(bot.db.Model):
@@ -308,12 +381,9 @@ def setup_models(bot: bot.TechSupportBot) -> None:
             thread_id (str): The ID of the thread the vote is in
             vote_owner_id (str): The ID of the user who started the vote
             vote_description (str): The long form description of the vote
-            vote_ids_yes (str): The comma separated list of who has voted yes
-            vote_ids_no (str): The comma separated list of who has voted no
-            vote_ids_all (str): The comma separated list of who has voted
-            votes_yes (int): The number of votes for yes
-            votes_no (int): The number of votes for no
-            votes_total (int): The number of votes
+            votes_yes (int): The final number of votes for yes, set when the vote ends
+            votes_no (int): The final number of votes for no, set when the vote ends
+            votes_total (int): The final number of votes, set when the vote ends
             start_time (datetime.datetime): The start time of the vote
             vote_active (bool): If the vote is current active or not
             blind (bool): If the vote needs to be blind
@@ -321,16 +391,17 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "voting"
+        __table_args__ = (
+            bot.db.Index("ix_voting_message", "message_id"),
+            bot.db.Index("ix_voting_guild_active", "guild_id", "vote_active"),
+        )
 
         vote_id: int = bot.db.Column(bot.db.Integer, primary_key=True)
-        guild_id: str = bot.db.Column(bot.db.String)
-        message_id: str = bot.db.Column(bot.db.String)
-        thread_id: str = bot.db.Column(bot.db.String)
-        vote_owner_id: str = bot.db.Column(bot.db.String)
+        guild_id: str = bot.db.Column(Snowflake)
+        message_id: str = bot.db.Column(Snowflake)
+        thread_id: str = bot.db.Column(Snowflake)
+        vote_owner_id: str = bot.db.Column(Snowflake)
         vote_description: str = bot.db.Column(bot.db.String)
-        vote_ids_yes: str = bot.db.Column(bot.db.String, default="")
-        vote_ids_no: str = bot.db.Column(bot.db.String, default="")
-        vote_ids_all: str = bot.db.Column(bot.db.String, default="")
         votes_yes: int = bot.db.Column(bot.db.Integer, default=0)
         votes_no: int = bot.db.Column(bot.db.Integer, default=0)
         votes_total: int = bot.db.Column(bot.db.Integer, default=0)
@@ -341,6 +412,30 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         blind: bool = bot.db.Column(bot.db.Boolean, default=False)
         anonymous: bool = bot.db.Column(bot.db.Boolean, default=False)
 
+    class VoteBallot(bot.db.Model):
+        """The postgres table for the ballots of votes, one row per voter
+        Currently used in voting.py
+
+        Attributes:
+            vote_id (int): The vote the ballot was cast in
+            voter_id (str): The ID of the user who voted
+            choice (bool): True if the user voted yes, False if they voted no
+            voted_at (datetime.datetime): When the user last changed their ballot
+        """
+
+        __tablename__ = "vote_ballots"
+
+        vote_id: int = bot.db.Column(
+            bot.db.Integer,
+            bot.db.ForeignKey("voting.vote_id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+        voter_id: str = bot.db.Column(Snowflake, primary_key=True)
+        choice: bool = bot.db.Column(bot.db.Boolean, nullable=False)
+        voted_at: datetime.datetime = bot.db.Column(
+            bot.db.DateTime, default=datetime.datetime.utcnow
+        )
+
     bot.models.Applications = Applications
     bot.models.AppBans = ApplicationBans
     bot.models.DuckUser = DuckUser
@@ -355,3 +450,4 @@ def setup_models(bot: bot.TechSupportBot) -> None:
     bot.models.Listener = Listener
     bot.models.Rule = Rule
     bot.models.Votes = Votes
+    bot.models.VoteBallot = VoteBallot
@@ -0,0 +1,138 @@
+"""
+Defines the extension load plan and the startup timing report
+This has no commands
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Self
+
+
+@dataclass
+class ExtensionTiming:
+    """The startup timings of a single extension
+
+    Attributes:
+        name (str): The name of the extension
+        wave (int): The wave of the load plan the extension was loaded in
+        load_seconds (float): The time taken to import the file and run setup()
+        preconfig_seconds (float): The time taken by every preconfig of the extension
+        error (str): The error if the extension failed to load
+    """
+
+    name: str
+    wave: int = 0
+    load_seconds: float = 0.0
+    preconfig_seconds: float = 0.0
+    error: str = None
+
+
+def build_load_plan(
+    extensions: list[str], dependencies: dict[str, list[str]]
+) -> list[list[str]]:
+    """Groups extensions into waves, where every extension in a wave can load at once.
+    An extension is only placed after every dependency it has that is being loaded
+
+    Args:
+        extensions (list[str]): The names of every extension to load, in a stable order
+        dependencies (dict[str, list[str]]): Extension name to the names it depends on
+
+    Raises:
+        ValueError: Raised if the dependencies have a cycle
+
+    Returns:
+        list[list[str]]: The waves of extensions, in the order they should be loaded
+    """
+    remaining = list(extensions)
+    loaded: set[str] = set()
+    waves = []
+    while remaining:
+        wave = [
+            name
+            for name in remaining
+            if all(
+                dependency in loaded or dependency not in extensions
+                for dependency in dependencies.get(name, [])
+            )
+        ]
+        if not wave:
+            raise ValueError(f"Extension dependencies have a cycle: {remaining}")
+        waves.append(wave)
+        loaded.update(wave)
+        remaining = [name for name in remaining if name not in loaded]
+    return waves
+
+
+class StartupReport:
+    """Collects the load and preconfig timings of every extension"""
+
+    def __init__(self: Self) -> None:
+        self.timings: dict[str, ExtensionTiming] = {}
+        self.total_seconds: float = 0.0
+        # Preconfigs wait for the bot to be ready, so they finish after loading
+        self.preconfigs_running: int = 0
+        self.preconfigs_reported: bool = False
+
+    def get(self: Self, name: str) -> ExtensionTiming:
+        """Gets the timing entry of an extension, making it if needed
+
+        Args:
+            name (str): The name of the extension
+
+        Returns:
+            ExtensionTiming: The timing entry
+        """
+        if name not in self.timings:
+            self.timings[name] = ExtensionTiming(name=name)
+        return self.timings[name]
+
+    def start_preconfig(self: Self) -> None:
+        """Counts a preconfig that has started, so the report waits for it"""
+        self.preconfigs_running += 1
+
+    def record_preconfig(self: Self, name: str, seconds: float) -> bool:
+        """Adds the time taken by a preconfig to an extension
+
+        Args:
+            name (str): The name of the extension
+            seconds (float): The time the preconfig took
+
+        Returns:
+            bool: True if this was the last preconfig of startup to finish,
+                so the full report can be logged
+        """
+        self.get(name).preconfig_seconds += seconds
+        self.preconfigs_running -= 1
+        if self.preconfigs_running or self.preconfigs_reported:
+            return False
+        self.preconfigs_reported = True
+        return True
+
+    def format(self: Self, limit: int = None, preconfig: bool = True) -> str:
+        """Makes a plain text table of the slowest extensions
+
+        Args:
+            limit (int, optional): The most extensions to include. Defaults to all
+            preconfig (bool, optional): Whether to include the preconfig times.
+                Defaults to True
+
+        Returns:
+            str: The formatted report
+        """
+        timings = sorted(
+            self.timings.values(),
+            key=lambda timing: timing.load_seconds + timing.preconfig_seconds,
+            reverse=True,
+        )[:limit]
+        lines = [f"Extensions loaded in {self.total_seconds:.2f}s"]
+        header = f"{'extension':<16}{'wave':>5}{'load':>9}"
+        lines.append(header + f"{'preconfig':>11}" if preconfig else header)
+        for timing in timings:
+            line = f"{timing.name:<16}{timing.wave:>5}{timing.load_seconds:>8.3f}s"
+            if preconfig:
+                line += f"{timing.preconfig_seconds:>10.3f}s"
+            if timing.error:
+                line += " FAILED"
+            lines.append(line)
+        return "\n".join(lines)
@@ -0,0 +1,455 @@
+"""
+Defines the compiled guild config snapshots, used by hot paths instead of the raw config,
+and the write-behind persistence of guild configs
+This has no commands
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import itertools
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+import munch
+from botlogging import LogLevel
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    import bot
+
+# Every compiled snapshot gets a new version, so caches can tell when a config changed
+_versions = itertools.count(1)
+
+
+@dataclass(frozen=True, slots=True)
+class GuildConfigSnapshot:
+    """An immutable, precompiled view of a single guild config.
+    Channel and member IDs are converted to int and lists are held as frozensets
+
+    Attributes:
+        guild_id (int): The ID of the guild the config is for
+        version (int): The unique version of this snapshot
+        config (munch.Munch): The raw config the snapshot was compiled from
+        command_prefix (str): The prefix for prefix commands
+        logging_channel (int | None): The ID of the logging channel
+        enable_logging (bool): Whether logging is enabled in the guild
+        private_channels (frozenset[int]): The channels that are never logged
+        enabled_extensions (frozenset[str]): The names of every enabled extension
+        rate_limit_enabled (bool): Whether the command rate limiter is enabled
+        rate_limit_commands (int): The number of commands allowed in the window
+        rate_limit_time (int): The length of the rate limit window, in seconds
+        protect_channels (frozenset[int]): The channels protect runs in
+        protect_bypass_ids (frozenset[int]): The members protect ignores
+        protect_bypass_roles (frozenset[str]): The lowercase role names protect ignores
+        factoid_restricted_channels (frozenset[int]): The channels restricted
+            factoids can be called in
+    """
+
+    guild_id: int
+    version: int
+    config: munch.Munch
+    command_prefix: str
+    logging_channel: int | None
+    enable_logging: bool
+    private_channels: frozenset[int]
+    enabled_extensions: frozenset[str]
+    rate_limit_enabled: bool
+    rate_limit_commands: int
+    rate_limit_time: int
+    protect_channels: frozenset[int]
+    protect_bypass_ids: frozenset[int]
+    protect_bypass_roles: frozenset[str]
+    factoid_restricted_channels: frozenset[int]
+
+
+def to_id(value: str | int | None) -> int | None:
+    """Converts a config ID, which is usually a string, to an int
+
+    Args:
+        value (str | int | None): The ID from the config
+
+    Returns:
+        int | None: The int ID, or None if it isn't a valid ID
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_id_set(values: Iterable | None) -> frozenset[int]:
+    """Converts a list of config IDs to a frozenset of int IDs, skipping invalid IDs
+
+    Args:
+        values (Iterable | None): The list of IDs from the config
+
+    Returns:
+        frozenset[int]: The set of valid int IDs
+    """
+    if not values:
+        return frozenset()
+    ids = (to_id(value) for value in values)
+    return frozenset(value for value in ids if value is not None)
+
+
+def get_extension_value(config: munch.Munch, extension: str, key: str) -> object:
+    """Safely gets the value of an extension config key
+
+    Args:
+        config (munch.Munch): The guild config
+        extension (str): The name of the extension
+        key (str): The config key in the extension
+
+    Returns:
+        object: The value of the key, or None if it isn't in the config
+    """
+    extension_config = (config.get("extensions") or {}).get(extension) or {}
+    return (extension_config.get(key) or {}).get("value")
+
+
+def compile_guild_config(guild_id: str, config: munch.Munch) -> GuildConfigSnapshot:
+    """Compiles a raw guild config into an immutable snapshot
+
+    Args:
+        guild_id (str): The ID of the guild the config is for
+        config (munch.Munch): The raw guild config
+
+    Returns:
+        GuildConfigSnapshot: The compiled snapshot, with a new version
+    """
+    rate_limit = config.get("rate_limit") or {}
+    bypass_roles = get_extension_value(config, "protect", "bypass_roles") or []
+
+    return GuildConfigSnapshot(
+        guild_id=int(guild_id),
+        version=next(_versions),
+        config=config,
+        command_prefix=config.get("command_prefix"),
+        logging_channel=to_id(config.get("logging_channel")),
+        enable_logging=bool(config.get("enable_logging")),
+        private_channels=to_id_set(config.get("private_channels")),
+        enabled_extensions=frozenset(config.get("enabled_extensions") or []),
+        rate_limit_enabled=bool(rate_limit.get("enabled", False)),
+        rate_limit_commands=rate_limit.get("commands"),
+        rate_limit_time=rate_limit.get("time"),
+        protect_channels=to_id_set(get_extension_value(config, "protect", "channels")),
+        protect_bypass_ids=to_id_set(
+            get_extension_value(config, "protect", "bypass_ids")
+        ),
+        protect_bypass_roles=frozenset(str(role).lower() for role in bypass_roles),
+        factoid_restricted_channels=to_id_set(
+            get_extension_value(config, "factoids", "restricted_list")
+        ),
+    )
+
+
+class GuildConfigStore(dict):
+    """The bots guild config cache, keyed by the string guild ID.
+    Every time a config is set, it is compiled into a new GuildConfigSnapshot
+    """
+
+    def __init__(self: Self) -> None:
+        super().__init__()
+        self.snapshots: dict[int, GuildConfigSnapshot] = {}
+
+    def __setitem__(self: Self, guild_id: str, config: munch.Munch) -> None:
+        """Stores a guild config, and compiles the snapshot for it
+
+        Args:
+            guild_id (str): The ID of the guild the config is for
+            config (munch.Munch): The raw guild config
+        """
+        super().__setitem__(guild_id, config)
+        if config:
+            self.snapshots[int(guild_id)] = compile_guild_config(guild_id, config)
+        else:
+            self.snapshots.pop(int(guild_id), None)
+
+    def __delitem__(self: Self, guild_id: str) -> None:
+        """Removes a guild config, and the snapshot for it
+
+        Args:
+            guild_id (str): The ID of the guild to remove the config for
+        """
+        super().__delitem__(guild_id)
+        self.snapshots.pop(int(guild_id), None)
+
+    def snapshot(self: Self, guild_id: int | str) -> GuildConfigSnapshot | None:
+        """Gets the compiled snapshot of a guild config
+
+        Args:
+            guild_id (int | str): The ID of the guild
+
+        Returns:
+            GuildConfigSnapshot | None: The snapshot, or None if the guild has no config
+        """
+        try:
+            return self.snapshots.get(int(guild_id))
+        except (TypeError, ValueError):
+            return None
+
+
+def build_config_patch(
+    old_config: object, new_config: object
+) -> tuple[list[tuple[list[str], Any]], list[list[str]]] | None:
+    """Works out the keys that changed between two configs, at any depth.
+    Nested dicts are compared key by key, so a single changed value deep in
+    a config is a single change
+
+    Args:
+        old_config (object): The config that is currently stored in the database
+        new_config (object): The config that should be stored in the database
+
+    Returns:
+        tuple[list[tuple[list[str], Any]], list[list[str]]] | None: The path and new value
+            of every changed key, and the path of every removed key.
+            None if the whole config must be replaced
+    """
+    if not isinstance(old_config, dict) or not isinstance(new_config, dict):
+        return None
+
+    changed: list[tuple[list[str], Any]] = []
+    removed: list[list[str]] = []
+    # Each entry is a pair of dicts to compare, and the path they are at
+    to_compare = [(old_config, new_config, [])]
+    while to_compare:
+        old, new, path = to_compare.pop()
+        for key, value in new.items():
+            if key not in old:
+                changed.append((path + [key], value))
+            elif isinstance(old[key], dict) and isinstance(value, dict):
+                to_compare.append((old[key], value, path + [key]))
+            elif old[key] != value:
+                changed.append((path + [key], value))
+        removed.extend(path + [key] for key in old if key not in new)
+    return changed, removed
+
+
+def build_patch_query(changes: int, removals: int) -> str:
+    """Makes the UPDATE that applies a patch to a stored config, with one jsonb_set
+    for every changed key and one #- for every removed key
+
+    Args:
+        changes (int): The number of changed keys,
+            bound as path_0, value_0, path_1, value_1 and so on
+        removals (int): The number of removed keys, bound as removed_0, removed_1 and so on
+
+    Returns:
+        str: The query
+    """
+    config = "config"
+    for index in range(changes):
+        config = (
+            f"jsonb_set({config}, CAST(:path_{index} AS TEXT[]),"
+            f" CAST(:value_{index} AS JSONB))"
+        )
+    for index in range(removals):
+        config = f"({config} #- CAST(:removed_{index} AS TEXT[]))"
+    return (
+        f"UPDATE guild_config SET config = {config}, update_time = :update_time"
+        " WHERE guild_id = :guild_id"
+    )
+
+
+class GuildConfigWriter:
+    """Write-behind persistence for guild configs.
+    Writes to the same guild are coalesced, and flushed once after debounce_seconds.
+    Only the keys that changed are sent, at any depth, with a single UPDATE.
+    A flush that fails is tried again later, waiting longer after every failure
+
+    Attributes:
+        REPLACE_QUERY (str): The UPSERT that stores a whole config
+        MAX_RETRY_SECONDS (float): The longest wait before trying a failed flush again
+
+    Args:
+        bot (bot.TechSupportBot): The bot object, used for the database and logging
+        debounce_seconds (float): How long to wait for more writes before flushing
+    """
+
+    REPLACE_QUERY: str = (
+        "INSERT INTO guild_config (guild_id, config, update_time)"
+        " VALUES (:guild_id, CAST(:config AS JSONB), :update_time)"
+        " ON CONFLICT (guild_id) DO UPDATE"
+        " SET config = EXCLUDED.config, update_time = EXCLUDED.update_time"
+    )
+    MAX_RETRY_SECONDS: float = 300
+
+    def __init__(self: Self, bot: bot.TechSupportBot, debounce_seconds: float) -> None:
+        self.bot = bot
+        self.debounce_seconds = debounce_seconds
+        # The config last known to be in the database, per guild
+        self.persisted: dict[str, Any] = {}
+        self.pending: dict[str, Any] = {}
+        self.flush_tasks: dict[str, asyncio.Task] = {}
+        # The failed flushes in a row, per guild
+        self.failures: dict[str, int] = {}
+
+    def load(self: Self, guild_id: str, config: dict[str, Any]) -> None:
+        """Records a config that was read from the database, so later writes can patch it
+
+        Args:
+            guild_id (str): The ID of the guild the config is for
+            config (dict[str, Any]): The config as stored in the database
+        """
+        self.persisted[str(guild_id)] = config
+
+    def schedule(self: Self, guild_id: str, config: dict[str, Any]) -> None:
+        """Queues a config to be written, replacing any write still waiting for the guild
+
+        Args:
+            guild_id (str): The ID of the guild the config is for
+            config (dict[str, Any]): The JSON compatible config to store
+        """
+        guild_id = str(guild_id)
+        self.pending[guild_id] = config
+        self.schedule_flush(guild_id, self.debounce_seconds)
+
+    def schedule_flush(self: Self, guild_id: str, delay: float) -> None:
+        """Flushes the guild after a delay, unless a flush is already waiting
+
+        Args:
+            guild_id (str): The ID of the guild to flush
+            delay (float): The seconds to wait before flushing
+        """
+        if guild_id not in self.flush_tasks:
+            self.flush_tasks[guild_id] = asyncio.create_task(
+                self.delayed_flush(guild_id, delay)
+            )
+
+    async def delayed_flush(self: Self, guild_id: str, delay: float) -> None:
+        """Waits, then flushes the guild
+
+        Args:
+            guild_id (str): The ID of the guild to flush
+            delay (float): The seconds to wait before flushing
+        """
+        await asyncio.sleep(delay)
+        self.flush_tasks.pop(guild_id, None)
+        await self.flush(guild_id)
+
+    async def flush(self: Self, guild_id: str, retry: bool = True) -> None:
+        """Writes the latest pending config for a guild to the database
+
+        Args:
+            guild_id (str): The ID of the guild to flush
+            retry (bool, optional): Whether to try again later if the write fails.
+                Defaults to True
+        """
+        if guild_id not in self.pending:
+            return
+        config = self.pending.pop(guild_id)
+
+        patch = (
+            build_config_patch(self.persisted[guild_id], config)
+            if guild_id in self.persisted
+            else None
+        )
+
+        try:
+            await self.write(guild_id, config, patch)
+        except Exception as exception:
+            # Keep the config, and try again later unless a newer write already will
+            self.pending.setdefault(guild_id, config)
+            failures = self.failures.get(guild_id, 0) + 1
+            self.failures[guild_id] = failures
+            if retry:
+                self.schedule_flush(
+                    guild_id,
+                    min(self.debounce_seconds * 2**failures, self.MAX_RETRY_SECONDS),
+                )
+            await self.bot.logger.send_log(
+                message=(
+                    f"Could not write guild config for {guild_id} to Postgres"
+                    f" ({failures} failures in a row)"
+                ),
+                level=LogLevel.ERROR,
+                exception=exception,
+            )
+            return
+
+        self.failures.pop(guild_id, None)
+        # Compare against a copy, so later in-place edits of the config are noticed
+        self.persisted[guild_id] = json.loads(json.dumps(config))
+
+    async def write(
+        self: Self,
+        guild_id: str,
+        config: dict[str, Any],
+        patch: tuple[list[tuple[list[str], Any]], list[list[str]]] | None,
+    ) -> None:
+        """Writes a config to the database, as a patch if there is one.
+        If the guild has no stored config to patch, the whole config is stored
+
+        Args:
+            guild_id (str): The ID of the guild the config is for
+            config (dict[str, Any]): The whole config
+            patch (tuple[list[tuple[list[str], Any]], list[list[str]]] | None):
+                The changed and removed keys, or None to replace the whole config
+        """
+        update_time = datetime.datetime.utcnow()
+
+        if patch is not None:
+            changed, removed = patch
+            if not changed and not removed:
+                return
+            params = {}
+            for index, (path, value) in enumerate(changed):
+                params[f"path_{index}"] = path
+                params[f"value_{index}"] = json.dumps(value)
+            for index, path in enumerate(removed):
+                params[f"removed_{index}"] = path
+            status, _ = await self.bot.db.status(
+                self.bot.db.text(build_patch_query(len(changed), len(removed))),
+                guild_id=int(guild_id),
+                update_time=update_time,
+                **params,
+            )
+            if status != "UPDATE 0":
+                return
+
+        await self.bot.db.status(
+            self.bot.db.text(self.REPLACE_QUERY),
+            guild_id=int(guild_id),
+            config=json.dumps(config),
+            update_time=update_time,
+        )
+
+    async def insert_missing(self: Self, configs: dict[str, Any]) -> None:
+        """Inserts the configs of many guilds at once, with a single statement.
+        Guilds that already have a config in the database are left alone
+
+        Args:
+            configs (dict[str, Any]): The guild ID to the JSON compatible config to insert
+        """
+        table = self.bot.models.Config.__table__
+        update_time = datetime.datetime.utcnow()
+        statement = (
+            postgresql.insert(table)
+            .values(
+                [
+                    {
+                        "guild_id": str(guild_id),
+                        "config": config,
+                        "update_time": update_time,
+                    }
+                    for guild_id, config in configs.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["guild_id"])
+        )
+        await self.bot.db.status(statement)
+
+        for guild_id, config in configs.items():
+            self.persisted[str(guild_id)] = json.loads(json.dumps(config))
+
+    async def flush_all(self: Self) -> None:
+        """Immediately writes every pending config, used before shutting down"""
+        for task in self.flush_tasks.values():
+            task.cancel()
+        self.flush_tasks.clear()
+        for guild_id in list(self.pending):
+            await self.flush(guild_id, retry=False)
@@ -5,22 +5,41 @@ This has no commands
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+import random
 import time
-import urllib
-from collections import deque
+from collections.abc import AsyncIterator
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Self
 from urllib.parse import urlparse
 
 import aiohttp
-import expiringdict
 import munch
 from botlogging import LogLevel
-from core import custom_errors
+from core import (
+    custom_errors,
+    httpcache,
+    httphealth,
+    httplimit,
+    httpreplay,
+    httpstream,
+    perf,
+)
 
 if TYPE_CHECKING:
     import bot
 
+# Methods that are safe to send again if the first try failed
+IDEMPOTENT_METHODS = frozenset({"get", "head", "options", "put", "delete"})
+# Statuses that mean the host is having trouble, rather than the request being wrong
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+# Errors that mean the host failed, whether or not it got the request
+FAILURE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+# Errors raised before the request reached the host
+NOT_SENT_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError)
+
 
 class HTTPCalls:
     """
@@ -30,15 +49,86 @@ class HTTPCalls:
     Args:
         bot (bot.TechSupportBot): The bot object that will be making http calls.
             This is only used for access to file_config and nothing more
+
+    Raises:
+        ValueError: Raised if the fixture mode in the file config isn't known
     """
 
     def __init__(self: Self, bot: bot.TechSupportBot) -> None:
         self.bot = bot
-        self.http_cache = expiringdict.ExpiringDict(
-            max_len=self.bot.file_config.cache.http_cache_length,
-            max_age_seconds=self.bot.file_config.cache.http_cache_seconds,
+        cache_config = self.bot.file_config.cache
+        self.response_cache = httpcache.ResponseCache(
+            max_bytes=cache_config.get("http_cache_bytes", 5_000_000),
+            default_ttl=cache_config.http_cache_seconds,
+            host_ttls=cache_config.get("http_cache_host_seconds"),
+            stale_seconds=cache_config.get("http_cache_stale_seconds", 0),
+        )
+        # Responses of some hosts are also kept on disk, so they survive restarts
+        disk_config = cache_config.get("http_disk_cache") or {}
+        self.disk_cache: httpcache.DiskCache = None
+        if disk_config.get("enabled"):
+            self.disk_cache = httpcache.DiskCache(
+                path=disk_config.get("path", "http_cache.sqlite3"),
+                max_bytes=disk_config.get("max_bytes", 50_000_000),
+                host_ttls=disk_config.get("host_seconds"),
+            )
+        # Disk cache writes still running, so they can finish before closing
+        self.disk_writes: set[asyncio.Task] = set()
+        # Cache key: the task refreshing the stale response
+        self.revalidating: dict[str, asyncio.Task] = {}
+        # Request key: the task making a GET request that other callers can share
+        self.in_flight: dict[str, asyncio.Task] = {}
+        # Host: the rate limiter of the host, made on the first call
+        self.host_limiters: dict[str, httplimit.HostRateLimiter] = {}
+        # Host: the failure tracking of the host, made on the first call
+        self.host_health: dict[str, httphealth.HostHealth] = {}
+        http_config = self.bot.file_config.api.get("http") or {}
+        self.retries = http_config.get("retries", 2)
+        self.retry_backoff = http_config.get("retry_backoff_seconds", 0.5)
+        self.failure_threshold = http_config.get("circuit_failure_threshold", 5)
+        self.circuit_reset = http_config.get("circuit_reset_seconds", 30)
+        self.stream_max_bytes = http_config.get("stream_max_bytes", 10_000_000)
+        self.stream_chunk_size = http_config.get("stream_chunk_bytes", 65536)
+        # Sends fully read requests. Fixtures are used instead of the network if set
+        self.transport: httpreplay.Transport = self.send_live
+        fixture_config = http_config.get("fixtures") or {}
+        fixture_mode = fixture_config.get("mode", "live")
+        # A typo must never silently replay fixtures in production
+        if fixture_mode not in httpreplay.FIXTURE_MODES:
+            raise ValueError(
+                f"api.http.fixtures.mode must be one of"
+                f" {sorted(httpreplay.FIXTURE_MODES)}, not {fixture_mode!r}"
+            )
+        if fixture_mode != "live":
+            self.transport = httpreplay.FixtureTransport(
+                directory=fixture_config.get("directory", "tests/fixtures/http"),
+                mode=fixture_mode,
+                live=self.send_live,
+                latency=fixture_config.get("latency_seconds", 0),
+            ).send
+        # The shared session, so connections are kept alive and reused between calls
+        self.session: aiohttp.ClientSession = None
+        self.request_counter = bot.metrics.counter(
+            "techsupport_http_requests_total", "HTTP requests made, per host"
+        )
+        self.cache_hit_counter = bot.metrics.counter(
+            "techsupport_http_cache_hits_total", "HTTP responses served from cache"
+        )
+        self.coalesced_counter = bot.metrics.counter(
+            "techsupport_http_coalesced_total",
+            "HTTP GET requests that shared an identical request already in flight",
+        )
+        self.rate_limited_counter = bot.metrics.counter(
+            "techsupport_http_rate_limited_total",
+            "HTTP requests refused by the rate limiter, per host",
+        )
+        self.retry_counter = bot.metrics.counter(
+            "techsupport_http_retries_total", "HTTP requests sent again, per host"
+        )
+        self.host_down_counter = bot.metrics.counter(
+            "techsupport_http_host_down_total",
+            "HTTP requests refused because the host kept failing, per host",
         )
-        self.url_rate_limit_history = {}
         # Rate limit configurations for each root URL
         # This is "URL": (calls, seconds)
         self.rate_limits = {
@@ -83,6 +173,44 @@ class HTTPCalls:
         except AttributeError:
             print("No linx API URL found. Not rate limiting linx")
 
+    def start(self: Self) -> None:
+        """Creates the shared session and its connection pool, using the file config.
+        This must be called from the running event loop
+        """
+        if self.session and not self.session.closed:
+            return
+        http_config = self.bot.file_config.api.get("http") or {}
+        connector = aiohttp.TCPConnector(
+            limit=http_config.get("connection_limit", 100),
+            limit_per_host=http_config.get("connection_limit_per_host", 10),
+            keepalive_timeout=http_config.get("keepalive_seconds", 30),
+            ttl_dns_cache=http_config.get("dns_cache_seconds", 300),
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=http_config.get("timeout_seconds", 30),
+            connect=http_config.get("connect_timeout_seconds", 10),
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def close(self: Self) -> None:
+        """Closes the shared session, every pooled connection, and the disk cache"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        if self.disk_cache:
+            await asyncio.gather(*self.disk_writes)
+            self.disk_cache.close()
+
+    def get_session(self: Self) -> aiohttp.ClientSession:
+        """Gets the shared session, making it if it hasn't been started
+
+        Returns:
+            aiohttp.ClientSession: The shared session
+        """
+        if not self.session or self.session.closed:
+            self.start()
+        return self.session
+
     async def http_call(
         self: Self, method: str, url: str, *args: tuple, **kwargs: dict[str, Any]
     ) -> munch.Munch:
@@ -91,6 +219,10 @@ class HTTPCalls:
         By default this returns JSON/dict with the status code injected.
         use_cache (bool):  True if the GET result should be grabbed from cache
         get_raw_response (bool): True if the actual response object should be returned
+        timeout (float | aiohttp.ClientTimeout): The total timeout of this call,
+            instead of the configured default
+        rate_limit_wait (float): The most seconds to wait for the host rate limit,
+            instead of raising HTTPRateLimit right away
 
         Args:
             method (str): the HTTP method to use
@@ -98,99 +230,507 @@ class HTTPCalls:
             *args (tuple): Used to allow any combination of parameters to the API
             **kwargs (dict[str, Any]): Used to allow any combination of parameters to the API
 
-        Raises:
-            HTTPRateLimit: Raised if the API is currently on cooldown
-
         Returns:
             munch.Munch: The munch object containing the response from the API
         """
 
         # Get the URL not the endpoint being called
-        ignore_rate_limit = False
         root_url = urlparse(url).netloc
 
-        # If the URL is not rate limited, we assume it can be executed an unlimited amount of times
-        if root_url in self.rate_limits:
-            executions_allowed, time_window = self.rate_limits[root_url]
-
-            now = time.time()
+        url = url.replace(" ", "%20").replace("+", "%2b")
 
-            # If the URL being called is not in the history, add it
-            # A deque allows easy max limit length
-            if root_url not in self.url_rate_limit_history:
-                self.url_rate_limit_history[root_url] = deque(
-                    [], maxlen=executions_allowed
+        method = method.lower()
+        use_cache = kwargs.pop("use_cache", False) and method == "get"
+        get_raw_response = kwargs.pop("get_raw_response", False)
+        rate_limit_wait = kwargs.pop("rate_limit_wait", 0)
+        if isinstance(kwargs.get("timeout"), (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=kwargs["timeout"])
+
+        cache_key = httpcache.make_cache_key(url, kwargs.get("params"))
+
+        # Cached responses don't reach the API, so they don't count for the rate limit
+        if use_cache:
+            cached_response, fresh = self.response_cache.get(cache_key)
+            if cached_response:
+                self.cache_hit_counter.inc(host=root_url, tier="memory")
+                if not fresh:
+                    self.revalidate(cache_key, root_url, url, args, kwargs)
+                log_message = f"Retrieving cached HTTP GET response ({cache_key})"
+                return await self.process_http_response(
+                    cached_response, method, cache_key, get_raw_response, log_message
                 )
 
-            # Determine which calls, if any, have to be removed because they are out of the time
-            while (
-                self.url_rate_limit_history[root_url]
-                and now - self.url_rate_limit_history[root_url][0] >= time_window
-            ):
-                self.url_rate_limit_history[root_url].popleft()
-
-            # Determind if we hit or exceed the limit, and we should observe the limit
-            if (
-                not ignore_rate_limit
-                and len(self.url_rate_limit_history[root_url]) >= executions_allowed
-            ):
-                time_to_wait = time_window - (
-                    now - self.url_rate_limit_history[root_url][0]
+            cached_response = await self.get_disk_cached(cache_key, root_url)
+            if cached_response:
+                self.cache_hit_counter.inc(host=root_url, tier="disk")
+                log_message = f"Retrieving disk cached HTTP GET response ({cache_key})"
+                return await self.process_http_response(
+                    cached_response, method, cache_key, get_raw_response, log_message
                 )
-                time_to_wait = max(time_to_wait, 0)
-                raise custom_errors.HTTPRateLimit(time_to_wait)
 
-            # Add an entry for this call with the timestamp the call was placed
-            self.url_rate_limit_history[root_url].append(now)
+        if method == "get":
+            response = await self.shared_fetch(
+                url, root_url, cache_key, use_cache, rate_limit_wait, args, kwargs
+            )
+        else:
+            response = await self.fetch(
+                method, url, root_url, None, rate_limit_wait, args, kwargs
+            )
+        log_message = f"Making HTTP {method.upper()} request to URL: {cache_key}"
+        return await self.process_http_response(
+            response, method, cache_key, get_raw_response, log_message
+        )
+
+    @contextlib.asynccontextmanager
+    async def http_stream(
+        self: Self, method: str, url: str, *args: tuple, **kwargs: dict[str, Any]
+    ) -> AsyncIterator[httpstream.StreamedResponse]:
+        """Makes an HTTP request without reading the body, so it can be read in chunks.
+        Send a large body with httpstream.stream_body as data, so it's never held whole.
+        Streamed requests are never cached, shared or retried
+
+        max_bytes (int): The most body bytes to read, instead of the configured default
+        chunk_size (int): The most bytes to read at once
+        progress (httpstream.ProgressCallback): Called after every chunk is read
+        rate_limit_wait (float): The most seconds to wait for the host rate limit,
+            instead of raising HTTPRateLimit right away
+        timeout (float | aiohttp.ClientTimeout): The total timeout of this call,
+            instead of the configured default
+
+        Args:
+            method (str): the HTTP method to use
+            url (str): the URL to call
+            *args (tuple): Used to allow any combination of parameters to the API
+            **kwargs (dict[str, Any]): Used to allow any combination of parameters to the API
+
+        Raises:
+            ClientError: Raised if the request failed to connect or read the response
+            TimeoutError: Raised if the request timed out
 
+        Yields:
+            httpstream.StreamedResponse: The open response, to read the body from
+        """
+        root_url = urlparse(url).netloc
         url = url.replace(" ", "%20").replace("+", "%2b")
 
         method = method.lower()
-        use_cache = kwargs.pop("use_cache", False)
-        get_raw_response = kwargs.pop("get_raw_response", False)
+        max_bytes = kwargs.pop("max_bytes", self.stream_max_bytes)
+        chunk_size = kwargs.pop("chunk_size", self.stream_chunk_size)
+        progress = kwargs.pop("progress", None)
+        rate_limit_wait = kwargs.pop("rate_limit_wait", 0)
+        if isinstance(kwargs.get("timeout"), (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=kwargs["timeout"])
+
+        health = self.check_health(root_url)
+        recorded_at = await self.acquire_rate_limit(root_url, rate_limit_wait)
+        self.request_counter.inc(host=root_url)
+        await self.bot.logger.send_log(
+            message=f"Making streamed HTTP {method.upper()} request to URL: {url}",
+            level=LogLevel.INFO,
+            console_only=True,
+        )
 
-        cache_key = url.lower()
-        if kwargs.get("params"):
-            params = urllib.parse.urlencode(kwargs.get("params"))
-            cache_key = f"{cache_key}?{params}"
+        # Reading the body is part of the request, so it's counted as HTTP time
+        started = time.monotonic()
+        try:
+            method_fn = getattr(self.get_session(), method)
+            async with method_fn(url, *args, **kwargs) as response_object:
+                if response_object.status in RETRY_STATUSES:
+                    health.record_failure()
+                else:
+                    health.record_success()
+                yield httpstream.StreamedResponse(
+                    response_object, max_bytes, chunk_size, progress
+                )
+        except FAILURE_ERRORS as exception:
+            if isinstance(exception, NOT_SENT_ERRORS):
+                self.refund_rate_limit(root_url, recorded_at)
+            health.record_failure()
+            raise
+        finally:
+            perf.record_http(time.monotonic() - started)
+
+    async def acquire_rate_limit(
+        self: Self, root_url: str, wait: float
+    ) -> float | None:
+        """Records a call to a host, waiting for the host rate limit if allowed to.
+        Waiting calls are let through by the priority and guild of the calling task
 
-        cached_response = (
-            self.http_cache.get(cache_key) if (use_cache and method == "get") else None
-        )
+        Args:
+            root_url (str): The host being called
+            wait (float): The most seconds to wait for the rate limit
+
+        Raises:
+            HTTPRateLimit: Raised if the API is still on cooldown after waiting
+
+        Returns:
+            float | None: The time the call was recorded at,
+                or None if the host isn't rate limited
+        """
+        # If the URL is not rate limited, we assume it can be executed an unlimited amount of times
+        if root_url not in self.rate_limits:
+            return None
 
-        client = None
-        if cached_response:
-            response_object = cached_response
-            log_message = f"Retrieving cached HTTP GET response ({cache_key})"
-            return await self.process_http_response(
-                response_object, method, cache_key, get_raw_response, log_message
+        limiter = self.host_limiters.get(root_url)
+        if limiter is None:
+            limiter = httplimit.HostRateLimiter(*self.rate_limits[root_url])
+            self.host_limiters[root_url] = limiter
+
+        try:
+            return await limiter.acquire(
+                wait,
+                httplimit.request_priority.get(),
+                httplimit.request_guild.get(),
             )
-        async with aiohttp.ClientSession() as client:
-            method_fn = getattr(client, method.lower())
-            async with method_fn(url, *args, **kwargs) as response_object:
-                log_message = (
-                    f"Making HTTP {method.upper()} request to URL: {cache_key}"
+        except custom_errors.HTTPRateLimit:
+            self.rate_limited_counter.inc(host=root_url)
+            raise
+
+    def refund_rate_limit(self: Self, root_url: str, recorded_at: float | None) -> None:
+        """Gives back the rate limit slot of a call that never reached the host
+
+        Args:
+            root_url (str): The host that was called
+            recorded_at (float | None): The time the call was recorded at
+        """
+        limiter = self.host_limiters.get(root_url)
+        if limiter and recorded_at is not None:
+            limiter.refund(recorded_at)
+
+    def check_health(self: Self, root_url: str) -> httphealth.HostHealth:
+        """Checks that a host can be called, making its failure tracking on the first call
+
+        Args:
+            root_url (str): The host being called
+
+        Raises:
+            HTTPHostDown: Raised if the host failed too often, and isn't being called
+
+        Returns:
+            httphealth.HostHealth: The failure tracking of the host
+        """
+        health = self.host_health.get(root_url)
+        if health is None:
+            health = httphealth.HostHealth(self.failure_threshold, self.circuit_reset)
+            self.host_health[root_url] = health
+        try:
+            health.check()
+        except custom_errors.HTTPHostDown:
+            self.host_down_counter.inc(host=root_url)
+            raise
+        return health
+
+    async def fetch(
+        self: Self,
+        method: str,
+        url: str,
+        root_url: str,
+        cache_key: str | None,
+        rate_limit_wait: float,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> httpcache.CachedResponse:
+        """Makes the HTTP request and reads the whole body, so the connection
+        can go back to the pool right away.
+        Idempotent requests that fail, or get a server error, are retried with backoff.
+        The request takes a single rate limit slot and counts as a single failure
+        of the host, no matter how many times it is retried.
+        A host that keeps failing isn't called at all until its circuit closes
+
+        Args:
+            method (str): the HTTP method to use
+            url (str): the URL to call
+            root_url (str): The host being called, for the rate limit
+            cache_key (str | None): The key to cache a successful response under,
+                or None if the response shouldn't be cached
+            rate_limit_wait (float): The most seconds to wait for the host rate limit
+            args (tuple): The positional arguments to pass to aiohttp
+            kwargs (dict[str, Any]): The keyword arguments to pass to aiohttp
+
+        Raises:
+            HTTPHostDown: Raised if the host failed too often, and isn't being called
+            ClientError: Raised if the last try failed to connect or read the response
+            TimeoutError: Raised if the last try timed out
+
+        Returns:
+            httpcache.CachedResponse: The status and body of the response
+        """
+        attempts = self.retries + 1 if method in IDEMPOTENT_METHODS else 1
+        health = self.check_health(root_url)
+        recorded_at = await self.acquire_rate_limit(root_url, rate_limit_wait)
+        # The slot is only given back if no try ever reached the host
+        reached_host = False
+
+        for attempt in range(attempts):
+            try:
+                response = await self.send(method, url, root_url, args, kwargs)
+            except FAILURE_ERRORS as exception:
+                reached_host = reached_host or not isinstance(
+                    exception, NOT_SENT_ERRORS
                 )
-                return await self.process_http_response(
-                    response_object,
-                    method,
-                    cache_key,
-                    get_raw_response,
-                    log_message,
+                if attempt + 1 == attempts:
+                    if not reached_host:
+                        self.refund_rate_limit(root_url, recorded_at)
+                    health.record_failure()
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES:
+                    health.record_success()
+                    break
+                reached_host = True
+                # The last server error is returned, like any other response
+                if attempt + 1 == attempts:
+                    health.record_failure()
+                    break
+
+            self.retry_counter.inc(host=root_url)
+            await asyncio.sleep(
+                self.retry_backoff * 2**attempt * random.uniform(0.5, 1.0)
+            )
+
+        if cache_key and response.status < 400:
+            self.response_cache.set(cache_key, root_url, response)
+            if self.disk_cache and self.disk_cache.is_eligible(root_url):
+                # Written in the background, so the caller doesn't wait on SQLite
+                task = asyncio.create_task(
+                    self.write_disk_cache(cache_key, root_url, response)
+                )
+                self.disk_writes.add(task)
+                task.add_done_callback(self.disk_writes.discard)
+        return response
+
+    async def write_disk_cache(
+        self: Self, cache_key: str, root_url: str, response: httpcache.CachedResponse
+    ) -> None:
+        """Stores a response in the disk cache, logging instead of raising on failure
+
+        Args:
+            cache_key (str): The cache key of the request
+            root_url (str): The host that was called
+            response (httpcache.CachedResponse): The response to store
+        """
+        try:
+            await asyncio.to_thread(self.disk_cache.set, cache_key, root_url, response)
+        except Exception as exception:
+            # The response is still cached in memory
+            await self.bot.logger.send_log(
+                message=f"Could not write HTTP response to the disk cache ({cache_key})",
+                level=LogLevel.WARNING,
+                console_only=True,
+                exception=exception,
+            )
+
+    async def get_disk_cached(
+        self: Self, cache_key: str, root_url: str
+    ) -> httpcache.CachedResponse | None:
+        """Looks up a response in the disk cache, moving it into memory if found
+
+        Args:
+            cache_key (str): The cache key of the request
+            root_url (str): The host being called
+
+        Returns:
+            httpcache.CachedResponse | None: The response, or None if it isn't stored
+        """
+        if not self.disk_cache or not self.disk_cache.is_eligible(root_url):
+            return None
+        response = await asyncio.to_thread(self.disk_cache.get, cache_key)
+        if response:
+            self.response_cache.set(cache_key, root_url, response)
+        return response
+
+    async def send(
+        self: Self,
+        method: str,
+        url: str,
+        root_url: str,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> httpcache.CachedResponse:
+        """Sends a single HTTP request and reads the whole body
+
+        Args:
+            method (str): the HTTP method to use
+            url (str): the URL to call
+            root_url (str): The host being called, for metrics
+            args (tuple): The positional arguments to pass to aiohttp
+            kwargs (dict[str, Any]): The keyword arguments to pass to aiohttp
+
+        Returns:
+            httpcache.CachedResponse: The status and body of the response
+        """
+        self.request_counter.inc(host=root_url)
+
+        # The time of the request is counted as HTTP time of the running command
+        started = time.monotonic()
+        try:
+            return await self.transport(method, url, args, kwargs)
+        finally:
+            perf.record_http(time.monotonic() - started)
+
+    async def send_live(
+        self: Self,
+        method: str,
+        url: str,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> httpcache.CachedResponse:
+        """Sends a single HTTP request over the network, with the shared session
+
+        Args:
+            method (str): the HTTP method to use
+            url (str): the URL to call
+            args (tuple): The positional arguments to pass to aiohttp
+            kwargs (dict[str, Any]): The keyword arguments to pass to aiohttp
+
+        Returns:
+            httpcache.CachedResponse: The status and body of the response
+        """
+        method_fn = getattr(self.get_session(), method)
+        async with method_fn(url, *args, **kwargs) as response_object:
+            return httpcache.CachedResponse(
+                status=response_object.status,
+                text=await response_object.text(errors="replace"),
+            )
+
+    async def shared_fetch(
+        self: Self,
+        url: str,
+        root_url: str,
+        cache_key: str,
+        use_cache: bool,
+        rate_limit_wait: float,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> httpcache.CachedResponse:
+        """Makes a GET request, sharing one upstream call between identical requests
+        made at the same time. Only the first caller uses a rate limit slot
+
+        Args:
+            url (str): the URL to call
+            root_url (str): The host being called, for the rate limit
+            cache_key (str): The cache key of the request
+            use_cache (bool): Whether the response should be cached
+            rate_limit_wait (float): The most seconds the first caller waits
+                for the host rate limit
+            args (tuple): The positional arguments to pass to aiohttp
+            kwargs (dict[str, Any]): The keyword arguments to pass to aiohttp
+
+        Returns:
+            httpcache.CachedResponse: The status and body of the response
+        """
+        # Requests with different headers can get different responses
+        headers = kwargs.get("headers")
+        flight_key = f"{cache_key} {sorted(headers.items())}" if headers else cache_key
+
+        task = self.in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.create_task(
+                self.fetch(
+                    "get",
+                    url,
+                    root_url,
+                    cache_key if use_cache else None,
+                    rate_limit_wait,
+                    args,
+                    kwargs,
                 )
+            )
+            self.in_flight[flight_key] = task
+            task.add_done_callback(lambda done: self.finish_flight(flight_key, done))
+            # Shielded, so one caller giving up doesn't cancel the request for the others
+            return await asyncio.shield(task)
+
+        self.coalesced_counter.inc(host=root_url)
+        started = time.monotonic()
+        try:
+            return await asyncio.shield(task)
+        finally:
+            perf.record_http(time.monotonic() - started)
+
+    def finish_flight(self: Self, flight_key: str, task: asyncio.Task) -> None:
+        """Stops sharing a finished GET request
+
+        Args:
+            flight_key (str): The key the request was shared under
+            task (asyncio.Task): The finished request task
+        """
+        if self.in_flight.get(flight_key) is task:
+            del self.in_flight[flight_key]
+        # Marks the exception as retrieved, in case every caller gave up waiting
+        if not task.cancelled():
+            task.exception()
+
+    def revalidate(
+        self: Self,
+        cache_key: str,
+        root_url: str,
+        url: str,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Refreshes a stale cached response in the background, once at a time per key
+
+        Args:
+            cache_key (str): The key the response is cached under
+            root_url (str): The host being called
+            url (str): the URL to call
+            args (tuple): The positional arguments to pass to aiohttp
+            kwargs (dict[str, Any]): The keyword arguments to pass to aiohttp
+        """
+        if cache_key in self.revalidating:
+            return
+        # A new context, so the refresh isn't counted as time of the calling command
+        # It waits behind every interactive call, since the stale response is served
+        context = contextvars.Context()
+        context.run(httplimit.request_priority.set, httplimit.Priority.BACKGROUND)
+        self.revalidating[cache_key] = asyncio.create_task(
+            self.background_revalidate(cache_key, root_url, url, args, kwargs),
+            context=context,
+        )
+
+    async def background_revalidate(
+        self: Self,
+        cache_key: str,
+        root_url: str,
+        url: str,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Fetches a fresh copy of a stale cached response
+
+        Args:
+            cache_key (str): The key the response is cached under
+            root_url (str): The host being called
+            url (str): the URL to call
+            args (tuple): The positional arguments to pass to aiohttp
+            kwargs (dict[str, Any]): The keyword arguments to pass to aiohttp
+        """
+        try:
+            await self.fetch("get", url, root_url, cache_key, 0, args, kwargs)
+        except Exception as exception:
+            # The stale response is kept until it can't be served anymore
+            await self.bot.logger.send_log(
+                message=f"Could not refresh cached HTTP GET response ({cache_key})",
+                level=LogLevel.WARNING,
+                console_only=True,
+                exception=exception,
+            )
+        finally:
+            self.revalidating.pop(cache_key, None)
 
     async def process_http_response(
         self: Self,
-        response_object: aiohttp.ClientResponse,
+        response_object: httpcache.CachedResponse,
         method: str,
         cache_key: str,
         get_raw_response: bool,
         log_message: bool,
     ) -> munch.Munch:
-        """Processes the HTTP response object, both cached and fresh
+        """Processes the HTTP response, both cached and fresh
 
         Args:
-            response_object (aiohttp.ClientResponse): The raw response object
+            response_object (httpcache.CachedResponse): The fully read response
             method (str): The HTTP method this request is using
             cache_key (str): The key for the cache array
             get_raw_response (bool): Whether the function should return the response raw
@@ -199,9 +739,6 @@ class HTTPCalls:
         Returns:
             munch.Munch: The resposne object ready for use
         """
-        if method == "get":
-            self.http_cache[cache_key] = response_object
-
         await self.bot.logger.send_log(
             message=log_message,
             level=LogLevel.INFO,
@@ -211,15 +748,12 @@ class HTTPCalls:
         if get_raw_response:
             response = {
                 "status": response_object.status,
-                "text": await response_object.text(),
+                "text": response_object.text,
             }
         else:
             try:
-                response_json = await response_object.json()
-            except (
-                aiohttp.ClientResponseError,
-                JSONDecodeError,
-            ) as exception:
+                response_json = response_object.json()
+            except JSONDecodeError as exception:
                 response_json = {}
                 await self.bot.logger.send_log(
                     message=f"{method.upper()} request to URL: {cache_key} failed",
@@ -228,11 +762,10 @@ class HTTPCalls:
                     exception=exception,
                 )
 
-            response = (
-                munch.munchify(response_json) if response_object else munch.Munch()
-            )
+            # munchify copies the body, so the cached copy is never changed by callers
+            response = munch.munchify(response_json)
             try:
-                response["status_code"] = getattr(response_object, "status", None)
+                response["status_code"] = response_object.status
             except TypeError:
                 await self.bot.logger.send_log(
                     message="Failed to add status_code to API response",
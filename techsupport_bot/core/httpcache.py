@@ -0,0 +1,339 @@
+"""
+Defines the HTTP response cache, which holds decoded bodies in an LRU bounded by size,
+and the optional disk tier under it
+This has no commands
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Self
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+# Stored in place of a decoded JSON body that hasn't been decoded yet
+NOT_DECODED = object()
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A fully read HTTP response, safe to keep after the connection is released
+
+    Attributes:
+        status (int): The HTTP status code
+        text (str): The decoded text of the body
+        stored_at (float): The monotonic time the response was stored
+        expires_at (float): The monotonic time the response stops being fresh
+        stale_until (float): The monotonic time the response can no longer be used
+        decoded_json (Any): The JSON body, decoded the first time it's needed
+        size (int): The rough memory cost of the response, used for the byte budget
+    """
+
+    status: int
+    text: str
+    stored_at: float = 0.0
+    expires_at: float = 0.0
+    stale_until: float = 0.0
+    decoded_json: Any = field(default=NOT_DECODED)
+
+    @property
+    def size(self: Self) -> int:
+        """The rough memory cost of the response, used for the byte budget
+
+        Returns:
+            int: The size of the body, plus a fixed overhead
+        """
+        return len(self.text) + 200
+
+    def json(self: Self) -> object:
+        """Decodes the body as JSON, only once no matter how often it's called
+
+        Returns:
+            object: The decoded JSON body
+        """
+        if self.decoded_json is NOT_DECODED:
+            self.decoded_json = json.loads(self.text)
+        return self.decoded_json
+
+
+def make_cache_key(url: str, params: dict[str, Any] = None) -> str:
+    """Makes the cache key of a GET request. Only the scheme and host are lowercased,
+    since the path and query can be case sensitive
+
+    Args:
+        url (str): The URL being called
+        params (dict[str, Any], optional): The query parameters of the call
+
+    Returns:
+        str: The cache key
+    """
+    parts = urlsplit(url)
+    key = urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path,
+            parts.query,
+            parts.fragment,
+        )
+    )
+    if params:
+        separator = "&" if parts.query else "?"
+        key = f"{key}{separator}{urlencode(sorted(params.items()))}"
+    return key
+
+
+class ResponseCache:
+    """An LRU cache of HTTP responses, bounded by the total size of the bodies.
+    Responses past their TTL can still be served for stale_seconds,
+    while the caller refreshes them in the background
+
+    Args:
+        max_bytes (int): The most body bytes to hold at once
+        default_ttl (float): How long a response is fresh, in seconds
+        host_ttls (dict[str, float]): Overrides of the TTL, per host
+        stale_seconds (float): How long a response can be served after going stale
+    """
+
+    def __init__(
+        self: Self,
+        max_bytes: int,
+        default_ttl: float,
+        host_ttls: dict[str, float] = None,
+        stale_seconds: float = 0,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.host_ttls = dict(host_ttls or {})
+        self.stale_seconds = stale_seconds
+        self.total_bytes = 0
+        # Least recently used response is always first
+        self.entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def get_ttl(self: Self, host: str) -> float:
+        """Gets the TTL of responses from a host
+
+        Args:
+            host (str): The host the response came from
+
+        Returns:
+            float: How long the response is fresh, in seconds
+        """
+        return self.host_ttls.get(host, self.default_ttl)
+
+    def get(
+        self: Self, key: str, now: float = None
+    ) -> tuple[CachedResponse | None, bool]:
+        """Looks up a response, dropping it if it can't be served anymore
+
+        Args:
+            key (str): The cache key of the request
+            now (float, optional): The current time. Defaults to time.monotonic()
+
+        Returns:
+            tuple[CachedResponse | None, bool]: The response, or None if it isn't cached,
+                and whether it is still fresh
+        """
+        if now is None:
+            now = time.monotonic()
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, False
+        if now >= entry.stale_until:
+            self.remove(key)
+            return None, False
+        self.entries.move_to_end(key)
+        return entry, now < entry.expires_at
+
+    def set(
+        self: Self, key: str, host: str, entry: CachedResponse, now: float = None
+    ) -> None:
+        """Stores a response, evicting expired then least recently used ones to stay in budget
+
+        Args:
+            key (str): The cache key of the request
+            host (str): The host the response came from, to pick the TTL
+            entry (CachedResponse): The response to store
+            now (float, optional): The current time. Defaults to time.monotonic()
+        """
+        if now is None:
+            now = time.monotonic()
+        if entry.size > self.max_bytes:
+            return
+        entry.stored_at = now
+        entry.expires_at = now + self.get_ttl(host)
+        entry.stale_until = entry.expires_at + self.stale_seconds
+
+        self.remove(key)
+        self.entries[key] = entry
+        self.total_bytes += entry.size
+        while self.total_bytes > self.max_bytes:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self: Self, key: str) -> None:
+        """Removes a response, if it is cached
+
+        Args:
+            key (str): The cache key of the request
+        """
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+
+    def __len__(self: Self) -> int:
+        """Gets the number of cached responses
+
+        Returns:
+            int: The number of cached responses
+        """
+        return len(self.entries)
+
+
+class DiskCache:
+    """A second cache tier in a local SQLite file, so responses survive restarts.
+    Only hosts with a TTL configured are stored. The least recently used responses
+    are evicted to keep the file under max_bytes.
+    Every method blocks, so they should be run in a thread
+
+    Attributes:
+        total_bytes (int): The body bytes stored in the file
+
+    Args:
+        path (str): The path of the SQLite file
+        max_bytes (int): The most body bytes to hold at once
+        host_ttls (dict[str, float]): How long responses are kept, per host
+    """
+
+    def __init__(
+        self: Self, path: str, max_bytes: int, host_ttls: dict[str, float]
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.host_ttls = dict(host_ttls or {})
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status INTEGER, text TEXT, size INTEGER, "
+                "expires_at REAL, last_used REAL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used "
+                "ON responses (last_used)"
+            )
+            # Summed once here, then kept up to date by every write and eviction
+            (self.total_bytes,) = self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+    def is_eligible(self: Self, host: str) -> bool:
+        """Checks if responses from a host are kept on disk
+
+        Args:
+            host (str): The host the response came from
+
+        Returns:
+            bool: True if the host has a disk TTL configured
+        """
+        return host in self.host_ttls
+
+    @staticmethod
+    def hash_key(key: str) -> str:
+        """Hashes a cache key, so API keys in URLs are never written to disk
+
+        Args:
+            key (str): The cache key of the request
+
+        Returns:
+            str: The hashed key
+        """
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self: Self, key: str, now: float = None) -> CachedResponse | None:
+        """Looks up a response, dropping it if it expired
+
+        Args:
+            key (str): The cache key of the request
+            now (float, optional): The current time. Defaults to time.time()
+
+        Returns:
+            CachedResponse | None: The response, or None if it isn't stored
+        """
+        if now is None:
+            now = time.time()
+        hashed_key = self.hash_key(key)
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                "SELECT status, text, size, expires_at FROM responses WHERE key = ?",
+                (hashed_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            status, text, size, expires_at = row
+            if now >= expires_at:
+                self.connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (hashed_key,)
+                )
+                self.total_bytes -= size
+                return None
+            self.connection.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (now, hashed_key)
+            )
+        return CachedResponse(status=status, text=text)
+
+    def set(
+        self: Self, key: str, host: str, entry: CachedResponse, now: float = None
+    ) -> None:
+        """Stores a response, evicting expired then least recently used ones to stay in budget
+
+        Args:
+            key (str): The cache key of the request
+            host (str): The host the response came from, to pick the TTL
+            entry (CachedResponse): The response to store
+            now (float, optional): The current time. Defaults to time.time()
+        """
+        if not self.is_eligible(host) or entry.size > self.max_bytes:
+            return
+        if now is None:
+            now = time.time()
+        hashed_key = self.hash_key(key)
+        with self.lock, self.connection:
+            replaced = self.connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (hashed_key,)
+            ).fetchone()
+            self.connection.execute(
+                "REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    hashed_key,
+                    entry.status,
+                    entry.text,
+                    entry.size,
+                    now + self.host_ttls[host],
+                    now,
+                ),
+            )
+            self.total_bytes += entry.size - (replaced[0] if replaced else 0)
+            if self.total_bytes <= self.max_bytes:
+                return
+            # Walks the expired responses, then the least recently used,
+            # until enough is freed
+            evicted = []
+            for evict_key, size in self.connection.execute(
+                "SELECT key, size FROM responses ORDER BY expires_at > ?, last_used",
+                (now,),
+            ):
+                if self.total_bytes <= self.max_bytes:
+                    break
+                evicted.append((evict_key,))
+                self.total_bytes -= size
+            self.connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def close(self: Self) -> None:
+        """Closes the SQLite file"""
+        with self.lock:
+            self.connection.close()
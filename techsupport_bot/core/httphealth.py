@@ -0,0 +1,80 @@
+"""
+Defines the health tracking of HTTP hosts, which stops calling a host
+for a while after it fails too many times in a row
+This has no commands
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Self
+
+from core import custom_errors
+
+
+class HostHealth:
+    """A circuit breaker for a single host.
+    After failure_threshold failures in a row, calls fail right away for reset_seconds.
+    After that, a single trial call is let through, and closes the circuit if it works
+
+    Attributes:
+        is_open (bool): Whether the host has failed too often to be called normally
+
+    Args:
+        failure_threshold (int): The failures in a row that open the circuit
+        reset_seconds (float): How long the circuit stays open
+    """
+
+    def __init__(self: Self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.open_until = 0.0
+        # When the last trial call was let through, while the circuit is open
+        self.trial_started = 0.0
+
+    @property
+    def is_open(self: Self) -> bool:
+        """Whether the host has failed too often to be called normally
+
+        Returns:
+            bool: True if the circuit is open
+        """
+        return self.failures >= self.failure_threshold
+
+    def check(self: Self, now: float = None) -> None:
+        """Checks if the host can be called right now
+
+        Args:
+            now (float, optional): The current time. Defaults to time.monotonic()
+
+        Raises:
+            HTTPHostDown: Raised if the circuit is open, and it isn't time for a trial
+        """
+        if not self.is_open:
+            return
+        if now is None:
+            now = time.monotonic()
+        # A trial that never reported back doesn't keep the circuit open forever
+        if now >= self.open_until and now - self.trial_started >= self.reset_seconds:
+            self.trial_started = now
+            return
+        retry_at = max(self.open_until, self.trial_started + self.reset_seconds)
+        raise custom_errors.HTTPHostDown(max(retry_at - now, 0.0))
+
+    def record_success(self: Self) -> None:
+        """Closes the circuit, after the host answered"""
+        self.failures = 0
+        self.trial_started = 0.0
+
+    def record_failure(self: Self, now: float = None) -> None:
+        """Counts a failure, opening the circuit if there were too many in a row
+
+        Args:
+            now (float, optional): The current time. Defaults to time.monotonic()
+        """
+        if now is None:
+            now = time.monotonic()
+        self.failures += 1
+        if self.is_open:
+            self.open_until = now + self.reset_seconds
@@ -0,0 +1,196 @@
+"""
+Defines the per host rate limiter of HTTP calls, which can queue callers
+until a call is allowed, instead of refusing them right away
+This has no commands
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import enum
+import time
+from collections import OrderedDict, deque
+from typing import Self
+
+from core import custom_errors
+
+
+class Priority(enum.IntEnum):
+    """The order queued HTTP calls are let through in, lowest first
+
+    Attributes:
+        INTERACTIVE (int): Calls made by commands, with a user waiting on them
+        BACKGROUND (int): Calls made by loops and cache refreshes
+    """
+
+    INTERACTIVE: int = 0
+    BACKGROUND: int = 1
+
+
+# The priority and guild of the HTTP calls made by the running task
+# Commands set the guild when they start, loop tasks set both when they start
+request_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "request_priority", default=Priority.INTERACTIVE
+)
+request_guild: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "request_guild", default=None
+)
+
+
+class HostRateLimiter:
+    """A sliding window rate limit of a single host.
+    Callers willing to wait are queued by priority, and within a priority
+    take turns by guild, so one guild can't use up a shared quota
+
+    Args:
+        calls (int): The number of calls allowed in the window
+        window (float): The length of the window, in seconds
+    """
+
+    def __init__(self: Self, calls: int, window: float) -> None:
+        self.calls = calls
+        self.window = window
+        # The times of the calls made in the current window, oldest first
+        self.history: deque[float] = deque()
+        # Priority: guild ID: the futures of the callers waiting, oldest first
+        self.queues: dict[Priority, OrderedDict[str | None, deque[asyncio.Future]]] = {
+            priority: OrderedDict() for priority in Priority
+        }
+        self.wake_handle: asyncio.TimerHandle = None
+
+    def get_wait(self: Self, now: float = None) -> float:
+        """Gets how long until another call is allowed, ignoring queued callers
+
+        Args:
+            now (float, optional): The current time. Defaults to time.monotonic()
+
+        Returns:
+            float: The seconds until a call is allowed, 0 if one is allowed now
+        """
+        if now is None:
+            now = time.monotonic()
+        while self.history and now - self.history[0] >= self.window:
+            self.history.popleft()
+        if len(self.history) < self.calls:
+            return 0.0
+        return max(self.window - (now - self.history[0]), 0.0)
+
+    def queued(self: Self) -> int:
+        """Gets the number of callers waiting for a call
+
+        Returns:
+            int: The number of waiting callers
+        """
+        return sum(
+            len(queue) for guilds in self.queues.values() for queue in guilds.values()
+        )
+
+    async def acquire(
+        self: Self,
+        wait: float = 0,
+        priority: Priority = Priority.INTERACTIVE,
+        guild: str = None,
+    ) -> float:
+        """Records a call, waiting up to wait seconds for one to be allowed
+
+        Args:
+            wait (float, optional): The most seconds to wait. Defaults to not waiting
+            priority (Priority, optional): The priority of the call
+            guild (str, optional): The ID of the guild the call is made for
+
+        Raises:
+            HTTPRateLimit: Raised if no call is allowed within the time to wait
+
+        Returns:
+            float: The time the call was recorded at, to refund it with
+        """
+        now = time.monotonic()
+        time_to_wait = self.get_wait(now)
+        # Queued callers get the next allowed calls, so nobody can skip ahead of them
+        if not time_to_wait and not self.queued():
+            self.history.append(now)
+            return now
+        if wait <= 0 or time_to_wait > wait:
+            raise custom_errors.HTTPRateLimit(time_to_wait)
+
+        future = asyncio.get_running_loop().create_future()
+        self.queues[priority].setdefault(guild, deque()).append(future)
+        self.schedule()
+        try:
+            return await asyncio.wait_for(future, wait)
+        except asyncio.TimeoutError as exception:
+            raise custom_errors.HTTPRateLimit(self.get_wait()) from exception
+        finally:
+            self.discard(priority, guild, future)
+
+    def refund(self: Self, recorded_at: float) -> None:
+        """Gives back a call that never reached the host, and lets the next caller through
+
+        Args:
+            recorded_at (float): The time the call was recorded at
+        """
+        try:
+            self.history.remove(recorded_at)
+        except ValueError:
+            # The call already left the window
+            return
+        if self.queued():
+            self.schedule()
+
+    def discard(
+        self: Self, priority: Priority, guild: str, future: asyncio.Future
+    ) -> None:
+        """Removes a caller that stopped waiting from the queue
+
+        Args:
+            priority (Priority): The priority the caller was queued with
+            guild (str): The ID of the guild the caller was queued for
+            future (asyncio.Future): The future of the caller
+        """
+        queue = self.queues[priority].get(guild)
+        if queue is None or future not in queue:
+            return
+        queue.remove(future)
+        if not queue:
+            del self.queues[priority][guild]
+
+    def next_waiter(self: Self) -> asyncio.Future | None:
+        """Takes the next caller to let through, moving its guild to the back
+
+        Returns:
+            asyncio.Future | None: The future of the caller, or None if nobody is waiting
+        """
+        for priority in Priority:
+            guilds = self.queues[priority]
+            while guilds:
+                guild, queue = next(iter(guilds.items()))
+                future = queue.popleft()
+                if queue:
+                    guilds.move_to_end(guild)
+                else:
+                    del guilds[guild]
+                if not future.done():
+                    return future
+        return None
+
+    def schedule(self: Self) -> None:
+        """Lets queued callers through while calls are allowed,
+        then sleeps until the next call is allowed
+        """
+        if self.wake_handle:
+            self.wake_handle.cancel()
+            self.wake_handle = None
+
+        now = time.monotonic()
+        while not self.get_wait(now):
+            future = self.next_waiter()
+            if future is None:
+                return
+            self.history.append(now)
+            future.set_result(now)
+
+        if self.queued():
+            self.wake_handle = asyncio.get_running_loop().call_later(
+                self.get_wait(now), self.schedule
+            )
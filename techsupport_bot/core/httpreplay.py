@@ -0,0 +1,201 @@
+"""
+Defines the fixture transport of HTTP calls, which records real responses to a directory
+and replays them later without the network, with an artificial latency
+This has no commands
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any, Self
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from core import httpcache
+
+# Sends a request: method, url, args and kwargs of aiohttp, to the fully read response
+Transport = Callable[
+    [str, str, tuple, dict[str, Any]], Awaitable[httpcache.CachedResponse]
+]
+
+# Every fixture mode. Live sends requests over the network, without fixtures
+FIXTURE_MODES = frozenset({"live", "record", "replay"})
+
+# Query parameters that hold secrets, so they never reach a fixture file
+SECRET_PARAMS = frozenset(
+    {"key", "apikey", "api_key", "appid", "token", "access_token", "client_secret"}
+)
+
+
+class FixtureNotFoundError(Exception):
+    """Raised when replaying a request that was never recorded
+
+    Args:
+        method (str): The HTTP method of the request
+        url (str): The URL of the request, without secrets
+    """
+
+    def __init__(self: Self, method: str, url: str) -> None:
+        super().__init__(f"No recorded response for {method.upper()} {url}")
+
+
+def redact_url(url: str, params: dict[str, Any] = None) -> str:
+    """Makes the URL a fixture is stored under, without any secret query parameters
+
+    Args:
+        url (str): The URL being called
+        params (dict[str, Any], optional): The query parameters of the call
+
+    Returns:
+        str: The URL, with the params added and secrets left out
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(name, str(value)) for name, value in params.items()]
+    query = sorted(
+        (name, "" if name.lower() in SECRET_PARAMS else value) for name, value in query
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path,
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def make_fixture_key(method: str, url: str, kwargs: dict[str, Any]) -> str:
+    """Makes the key a request is recorded under, the same every run
+
+    Args:
+        method (str): The HTTP method of the request
+        url (str): The URL of the request, without secrets
+        kwargs (dict[str, Any]): The keyword arguments of aiohttp, for the body
+
+    Returns:
+        str: The key of the request
+    """
+    body = kwargs.get("data")
+    if "json" in kwargs:
+        body = json.dumps(kwargs["json"], sort_keys=True)
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes):
+        body = b""
+
+    digest = hashlib.sha256(f"{method.lower()} {url}\n".encode("utf-8"))
+    digest.update(body)
+    return digest.hexdigest()[:32]
+
+
+class FixtureTransport:
+    """Records responses to a fixture directory, or replays them from it.
+    In record mode requests are sent with the live transport, and saved.
+    In replay mode the network is never used
+
+    Args:
+        directory (str): The directory fixtures are stored in, one folder per host
+        mode (str): Either "record" or "replay"
+        live (Transport): The transport that really sends requests, for recording
+        latency (float, optional): The seconds every replayed response takes
+
+    Raises:
+        ValueError: Raised if the mode isn't "record" or "replay"
+    """
+
+    def __init__(
+        self: Self,
+        directory: str,
+        mode: str,
+        live: Transport,
+        latency: float = 0,
+    ) -> None:
+        if mode not in FIXTURE_MODES - {"live"}:
+            raise ValueError(f'Fixture mode must be "record" or "replay", not "{mode}"')
+        self.directory = directory
+        self.mode = mode
+        self.live = live
+        self.latency = latency
+
+    def get_path(self: Self, method: str, url: str, kwargs: dict[str, Any]) -> str:
+        """Gets the file a request is recorded in
+
+        Args:
+            method (str): The HTTP method of the request
+            url (str): The URL of the request, without secrets
+            kwargs (dict[str, Any]): The keyword arguments of aiohttp
+
+        Returns:
+            str: The path of the fixture file
+        """
+        host = urlsplit(url).netloc or "unknown"
+        key = make_fixture_key(method, url, kwargs)
+        return os.path.join(self.directory, host, f"{key}.json")
+
+    async def send(
+        self: Self, method: str, url: str, args: tuple, kwargs: dict[str, Any]
+    ) -> httpcache.CachedResponse:
+        """Sends a request through the fixture directory
+
+        Args:
+            method (str): The HTTP method of the request
+            url (str): The URL of the request
+            args (tuple): The positional arguments of aiohttp
+            kwargs (dict[str, Any]): The keyword arguments of aiohttp
+
+        Raises:
+            FixtureNotFoundError: Raised if replaying a request that was never recorded
+
+        Returns:
+            httpcache.CachedResponse: The status and body of the response
+        """
+        redacted_url = redact_url(url, kwargs.get("params"))
+        path = self.get_path(method, redacted_url, kwargs)
+
+        if self.mode == "record":
+            response = await self.live(method, url, args, kwargs)
+            fixture = {
+                "method": method.upper(),
+                "url": redacted_url,
+                "status": response.status,
+                "text": response.text,
+            }
+            await asyncio.to_thread(self.write_fixture, path, fixture)
+            return response
+
+        try:
+            fixture = await asyncio.to_thread(self.read_fixture, path)
+        except FileNotFoundError as exception:
+            raise FixtureNotFoundError(method, redacted_url) from exception
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return httpcache.CachedResponse(status=fixture["status"], text=fixture["text"])
+
+    def write_fixture(self: Self, path: str, fixture: dict[str, Any]) -> None:
+        """Saves a recorded response, run in a thread
+
+        Args:
+            path (str): The path of the fixture file
+            fixture (dict[str, Any]): The recorded request and response
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fixture_file:
+            json.dump(fixture, fixture_file, indent=4, sort_keys=True)
+
+    def read_fixture(self: Self, path: str) -> dict[str, Any]:
+        """Loads a recorded response, run in a thread
+
+        Args:
+            path (str): The path of the fixture file
+
+        Returns:
+            dict[str, Any]: The recorded request and response
+        """
+        with open(path, encoding="utf-8") as fixture_file:
+            return json.load(fixture_file)
@@ -0,0 +1,157 @@
+"""
+Defines streamed HTTP bodies, so large uploads and downloads are sent and read
+in chunks, instead of being held in memory all at once
+This has no commands
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import Self
+
+import aiohttp
+import multidict
+from core import custom_errors
+
+# Called with the bytes moved so far, and the total bytes if they are known
+ProgressCallback = Callable[[int, int | None], None]
+
+
+async def read_chunks(
+    source: bytes | io.IOBase | AsyncIterable[bytes], chunk_size: int
+) -> AsyncIterator[bytes]:
+    """Splits a request body into chunks
+
+    Args:
+        source (bytes | io.IOBase | AsyncIterable[bytes]): The body to send
+        chunk_size (int): The most bytes in a chunk
+
+    Yields:
+        bytes: The next chunk of the body
+    """
+    if isinstance(source, bytes):
+        for start in range(0, len(source), chunk_size):
+            yield source[start : start + chunk_size]
+    elif isinstance(source, io.IOBase):
+        while chunk := source.read(chunk_size):
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+    else:
+        async for chunk in source:
+            yield chunk
+
+
+async def stream_body(
+    source: str | bytes | io.IOBase | AsyncIterable[bytes],
+    chunk_size: int = 65536,
+    progress: ProgressCallback = None,
+) -> AsyncIterator[bytes]:
+    """Makes a request body that aiohttp sends in chunks, reporting progress as it goes
+
+    Args:
+        source (str | bytes | io.IOBase | AsyncIterable[bytes]): The body to send.
+            Files are read a chunk at a time, async iterables are passed through
+        chunk_size (int, optional): The most bytes to send at once
+        progress (ProgressCallback, optional): Called after every chunk is sent
+
+    Yields:
+        bytes: The next chunk of the body
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    total = len(source) if isinstance(source, bytes) else None
+
+    sent = 0
+    async for chunk in read_chunks(source, chunk_size):
+        yield chunk
+        sent += len(chunk)
+        if progress:
+            progress(sent, total)
+
+
+class StreamedResponse:
+    """A response whose body is read in chunks, and given up on once it is too large
+
+    Attributes:
+        status (int): The HTTP status code
+        headers (multidict.CIMultiDictProxy): The response headers
+
+    Args:
+        response (aiohttp.ClientResponse): The open response
+        max_bytes (int): The most body bytes to read before giving up
+        chunk_size (int): The most bytes to read at once
+        progress (ProgressCallback): Called after every chunk is read
+    """
+
+    def __init__(
+        self: Self,
+        response: aiohttp.ClientResponse,
+        max_bytes: int,
+        chunk_size: int,
+        progress: ProgressCallback = None,
+    ) -> None:
+        self.response = response
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.received = 0
+
+    @property
+    def status(self: Self) -> int:
+        """The HTTP status code
+
+        Returns:
+            int: The HTTP status code
+        """
+        return self.response.status
+
+    @property
+    def headers(self: Self) -> multidict.CIMultiDictProxy[str]:
+        """The response headers
+
+        Returns:
+            multidict.CIMultiDictProxy[str]: The response headers
+        """
+        return self.response.headers
+
+    async def iter_chunks(self: Self) -> AsyncIterator[bytes]:
+        """Reads the body a chunk at a time
+
+        Raises:
+            HTTPResponseTooLarge: Raised once the body goes over max_bytes
+
+        Yields:
+            bytes: The next chunk of the body
+        """
+        # Refused before reading anything, if the host says how large it is
+        length = self.response.content_length
+        if length is not None and length > self.max_bytes:
+            raise custom_errors.HTTPResponseTooLarge(self.max_bytes)
+
+        async for chunk in self.response.content.iter_chunked(self.chunk_size):
+            self.received += len(chunk)
+            if self.received > self.max_bytes:
+                raise custom_errors.HTTPResponseTooLarge(self.max_bytes)
+            if self.progress:
+                self.progress(self.received, length)
+            yield chunk
+
+    async def read(self: Self) -> bytes:
+        """Reads the whole body, as long as it is under max_bytes
+
+        Returns:
+            bytes: The body
+        """
+        body = bytearray()
+        async for chunk in self.iter_chunks():
+            body += chunk
+        return bytes(body)
+
+    async def text(self: Self) -> str:
+        """Reads the whole body as text, as long as it is under max_bytes
+
+        Returns:
+            str: The decoded body
+        """
+        body = await self.read()
+        return body.decode(self.response.charset or "utf-8", errors="replace")
@@ -0,0 +1,194 @@
+"""
+Defines the metrics registry of the bot internals, and the optional
+HTTP endpoint serving them in the Prometheus text format
+This has no commands
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Self
+
+from aiohttp import web
+
+
+def escape_label(value: str) -> str:
+    """Escapes a label value for the Prometheus text format
+
+    Args:
+        value (str): The raw label value
+
+    Returns:
+        str: The escaped label value
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metric:
+    """A single named metric, holding one value for every set of labels
+
+    Args:
+        name (str): The Prometheus name of the metric
+        kind (str): The Prometheus type, either counter or gauge
+        help_text (str): The description of the metric
+    """
+
+    __slots__ = ("name", "kind", "help_text", "values")
+
+    def __init__(self: Self, name: str, kind: str, help_text: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.values: dict[tuple[tuple[str, str], ...], float] = {}
+
+    def inc(self: Self, amount: float = 1.0, **labels: dict[str, str]) -> None:
+        """Adds to the value of the metric
+
+        Args:
+            amount (float, optional): The amount to add. Defaults to 1
+            **labels (dict[str, str]): The labels of the value to add to
+        """
+        key = tuple(sorted(labels.items()))
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def set(self: Self, value: float, **labels: dict[str, str]) -> None:
+        """Sets the value of the metric
+
+        Args:
+            value (float): The new value
+            **labels (dict[str, str]): The labels of the value to set
+        """
+        self.values[tuple(sorted(labels.items()))] = value
+
+    def render(self: Self) -> list[str]:
+        """Makes the Prometheus text lines for this metric
+
+        Returns:
+            list[str]: The HELP and TYPE lines, followed by every value
+        """
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for key, value in self.values.items():
+            labels = ",".join(f'{label}="{escape_label(text)}"' for label, text in key)
+            name = f"{self.name}{{{labels}}}" if labels else self.name
+            lines.append(f"{name} {value}")
+        return lines
+
+
+class MetricsRegistry:
+    """Every metric of the bot. Counters are updated where things happen,
+    and gauges are set by the collectors right before the metrics are rendered
+    """
+
+    def __init__(self: Self) -> None:
+        self.metrics: dict[str, Metric] = {}
+        self.collectors: list[Callable[[], None]] = []
+
+    def get_metric(self: Self, name: str, kind: str, help_text: str) -> Metric:
+        """Gets a metric, making it if it doesn't exist yet
+
+        Args:
+            name (str): The Prometheus name of the metric
+            kind (str): The Prometheus type, either counter or gauge
+            help_text (str): The description of the metric
+
+        Returns:
+            Metric: The metric with the name
+        """
+        if name not in self.metrics:
+            self.metrics[name] = Metric(name, kind, help_text)
+        return self.metrics[name]
+
+    def counter(self: Self, name: str, help_text: str) -> Metric:
+        """Gets a counter, making it if it doesn't exist yet
+
+        Args:
+            name (str): The Prometheus name of the counter
+            help_text (str): The description of the counter
+
+        Returns:
+            Metric: The counter with the name
+        """
+        return self.get_metric(name, "counter", help_text)
+
+    def gauge(self: Self, name: str, help_text: str) -> Metric:
+        """Gets a gauge, making it if it doesn't exist yet
+
+        Args:
+            name (str): The Prometheus name of the gauge
+            help_text (str): The description of the gauge
+
+        Returns:
+            Metric: The gauge with the name
+        """
+        return self.get_metric(name, "gauge", help_text)
+
+    def add_collector(self: Self, collector: Callable[[], None]) -> None:
+        """Adds a function that is run before every render, to update gauges
+
+        Args:
+            collector (Callable[[], None]): The function to run
+        """
+        self.collectors.append(collector)
+
+    def render(self: Self) -> str:
+        """Runs every collector, then makes the Prometheus text of every metric
+
+        Returns:
+            str: The metrics, in the Prometheus text format
+        """
+        for collector in self.collectors:
+            collector()
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """A small aiohttp server, serving the metrics registry on /metrics
+
+    Args:
+        registry (MetricsRegistry): The metrics to serve
+        host (str): The address to listen on
+        port (int): The port to listen on
+    """
+
+    def __init__(self: Self, registry: MetricsRegistry, host: str, port: int) -> None:
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.runner: web.AppRunner = None
+
+    async def start(self: Self) -> None:
+        """Starts listening for metric scrapes"""
+        if self.runner:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+
+    async def stop(self: Self) -> None:
+        """Stops the server, if it was started"""
+        if not self.runner:
+            return
+        await self.runner.cleanup()
+        self.runner = None
+
+    async def handle_metrics(self: Self, _request: web.Request) -> web.Response:
+        """Responds to a scrape with the current metrics
+
+        Args:
+            _request (web.Request): The scrape request
+
+        Returns:
+            web.Response: The metrics, in the Prometheus text format
+        """
+        return web.Response(
+            text=self.registry.render(), content_type="text/plain", charset="utf-8"
+        )
@@ -0,0 +1,159 @@
+"""
+Defines the database migration runner, which applies the numbered files in the
+migrations folder once each, in order, and records them in a version table
+This has no commands
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from botlogging import LogLevel
+
+if TYPE_CHECKING:
+    import bot
+
+# Matches migration file names, such as m0001_initial_tables
+MIGRATION_NAME = re.compile(r"m(\d{4})_\w+")
+
+CREATE_VERSION_TABLE = (
+    "CREATE TABLE IF NOT EXISTS schema_migrations ("
+    "version INTEGER PRIMARY KEY, "
+    "name VARCHAR NOT NULL, "
+    "applied_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'))"
+)
+
+
+@dataclass
+class Migration:
+    """A single numbered change to the database schema
+
+    Attributes:
+        version (int): The number of the migration, which sets the order
+        name (str): The module name of the migration
+        description (str): The first line of the module docstring
+        upgrade (Callable[[bot.TechSupportBot], Awaitable[None]]): Applies the change
+    """
+
+    version: int
+    name: str
+    description: str
+    upgrade: Callable[[bot.TechSupportBot], Awaitable[None]]
+
+
+def find_migrations(package: str = "migrations") -> list[Migration]:
+    """Finds every migration in a package, in the order they should be applied
+
+    Args:
+        package (str, optional): The package to search. Defaults to "migrations"
+
+    Raises:
+        ValueError: Raised if two migrations have the same version
+
+    Returns:
+        list[Migration]: The migrations, oldest first
+    """
+    migrations = {}
+    for module_info in pkgutil.iter_modules(importlib.import_module(package).__path__):
+        match = MIGRATION_NAME.fullmatch(module_info.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(
+                f"Migrations {migrations[version].name} and {module_info.name}"
+                f" are both version {version}"
+            )
+        module = importlib.import_module(f"{package}.{module_info.name}")
+        migrations[version] = Migration(
+            version=version,
+            name=module_info.name,
+            description=(module.__doc__ or "").strip().split("\n", maxsplit=1)[0],
+            upgrade=module.upgrade,
+        )
+    return [migrations[version] for version in sorted(migrations)]
+
+
+async def run_migrations(
+    bot: bot.TechSupportBot, dry_run: bool = False, package: str = "migrations"
+) -> list[Migration]:
+    """Applies every migration that hasn't been applied yet.
+    Each migration runs in its own transaction, with its version recorded in it,
+    so a failed migration leaves nothing half done and is tried again next start
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database connection
+        dry_run (bool, optional): Only log the migrations that would be applied
+        package (str, optional): The package to find migrations in
+
+    Returns:
+        list[Migration]: The migrations that were pending
+    """
+    started = time.monotonic()
+    await bot.db.status(bot.db.text(CREATE_VERSION_TABLE))
+    applied = {
+        row[0]
+        for row in await bot.db.all(
+            bot.db.text("SELECT version FROM schema_migrations")
+        )
+    }
+    pending = [
+        migration
+        for migration in find_migrations(package)
+        if migration.version not in applied
+    ]
+
+    if not pending:
+        await bot.logger.send_log(
+            message=(
+                f"Database schema is current, checked in {time.monotonic() - started:.2f}s"
+            ),
+            level=LogLevel.DEBUG,
+            console_only=True,
+        )
+        return pending
+
+    for migration in pending:
+        if dry_run:
+            await bot.logger.send_log(
+                message=(
+                    f"Dry run, not applying migration {migration.name}:"
+                    f" {migration.description}"
+                ),
+                level=LogLevel.WARNING,
+                console_only=True,
+            )
+            continue
+
+        migration_started = time.monotonic()
+        async with bot.db.transaction():
+            await migration.upgrade(bot)
+            await bot.db.status(
+                bot.db.text(
+                    "INSERT INTO schema_migrations (version, name)"
+                    " VALUES (:version, :name)"
+                ),
+                version=migration.version,
+                name=migration.name,
+            )
+        await bot.logger.send_log(
+            message=(
+                f"Applied migration {migration.name} in"
+                f" {time.monotonic() - migration_started:.2f}s: {migration.description}"
+            ),
+            level=LogLevel.INFO,
+            console_only=True,
+        )
+
+    await bot.logger.send_log(
+        message=(f"Database migrations finished in {time.monotonic() - started:.2f}s"),
+        level=LogLevel.INFO,
+        console_only=True,
+    )
+    return pending
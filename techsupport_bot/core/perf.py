@@ -0,0 +1,291 @@
+"""
+Defines the per command latency instrumentation, with fixed size histograms
+This has no commands
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextvars
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Self
+
+import asyncpg
+from gino.dialects import asyncpg as gino_asyncpg
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.url import URL
+
+# The upper bound of every histogram bucket, in seconds. 1ms up to about 20 minutes
+BUCKET_BOUNDS: tuple[float, ...] = tuple(0.001 * 1.5**power for power in range(36))
+
+# Called with the SQL and seconds of a slow query,
+# and the name of the command that ran it if there was one
+SlowQueryHandler = Callable[[str, float, str | None], None]
+
+# The command being run in the current task, so HTTP and DB time can be attributed
+current_timing: contextvars.ContextVar[CommandTiming | None] = contextvars.ContextVar(
+    "current_timing", default=None
+)
+
+
+class LatencyHistogram:
+    """A fixed size histogram of durations, using exponential buckets.
+    Memory use never grows, no matter how many durations are recorded
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self: Self) -> None:
+        # The last bucket holds everything above the last bound
+        self.counts: list[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self: Self, seconds: float) -> None:
+        """Adds a single duration to the histogram
+
+        Args:
+            seconds (float): The duration to add
+        """
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self: Self, percent: float) -> float:
+        """Estimates a percentile, as the upper bound of the bucket it falls in
+
+        Args:
+            percent (float): The percentile to get, from 0 to 100
+
+        Returns:
+            float: The estimated duration in seconds, or 0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * percent / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                if index >= len(BUCKET_BOUNDS):
+                    return self.max
+                return min(BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+
+class CommandStats:
+    """The recorded latencies of a single command
+
+    Args:
+        name (str): The qualified name of the command
+    """
+
+    __slots__ = ("name", "wall", "http", "db", "errors", "queries")
+
+    def __init__(self: Self, name: str) -> None:
+        self.name = name
+        self.wall = LatencyHistogram()
+        self.http = LatencyHistogram()
+        self.db = LatencyHistogram()
+        self.errors: int = 0
+        self.queries: int = 0
+
+
+class CommandTiming:
+    """The timings of a single command invocation, while it is running
+
+    Args:
+        name (str): The qualified name of the command
+    """
+
+    __slots__ = ("name", "started", "http_seconds", "db_seconds", "queries", "finished")
+
+    def __init__(self: Self, name: str) -> None:
+        self.name = name
+        self.started: float = time.monotonic()
+        self.http_seconds: float = 0.0
+        self.db_seconds: float = 0.0
+        self.queries: int = 0
+        self.finished: bool = False
+
+
+class QueryStats:
+    """The totals of every database query the bot has run.
+    Queries taking at least slow_seconds are counted as slow, and passed to on_slow
+    """
+
+    __slots__ = ("count", "seconds", "errors", "slow", "slow_seconds", "on_slow")
+
+    def __init__(self: Self) -> None:
+        self.count: int = 0
+        self.seconds: float = 0.0
+        self.errors: int = 0
+        self.slow: int = 0
+        self.slow_seconds: float | None = None
+        self.on_slow: SlowQueryHandler | None = None
+
+
+# Every query is counted here, even if it wasn't run by a command
+query_stats = QueryStats()
+
+
+class PerfRecorder:
+    """Collects the latency histograms of every command the bot runs"""
+
+    def __init__(self: Self) -> None:
+        self.commands: dict[str, CommandStats] = {}
+
+    def start(self: Self, name: str) -> CommandTiming:
+        """Starts timing a command, and makes it the command of the current task
+
+        Args:
+            name (str): The qualified name of the command
+
+        Returns:
+            CommandTiming: The timing to pass to finish() once the command is done
+        """
+        timing = CommandTiming(name)
+        current_timing.set(timing)
+        return timing
+
+    def finish(self: Self, timing: CommandTiming | None, error: bool = False) -> None:
+        """Records the timings of a command that is done. A timing is only recorded once
+
+        Args:
+            timing (CommandTiming | None): The timing from start(), ignored if None
+            error (bool, optional): Whether the command failed. Defaults to False
+        """
+        if timing is None or timing.finished:
+            return
+        timing.finished = True
+
+        stats = self.commands.get(timing.name)
+        if stats is None:
+            stats = CommandStats(timing.name)
+            self.commands[timing.name] = stats
+        stats.wall.record(time.monotonic() - timing.started)
+        stats.http.record(timing.http_seconds)
+        stats.db.record(timing.db_seconds)
+        stats.queries += timing.queries
+        if error:
+            stats.errors += 1
+
+    def top(self: Self, limit: int = 10, percent: float = 95) -> list[CommandStats]:
+        """Gets the slowest commands
+
+        Args:
+            limit (int, optional): The most commands to return. Defaults to 10
+            percent (float, optional): The wall time percentile to sort by. Defaults to 95
+
+        Returns:
+            list[CommandStats]: The slowest commands, slowest first
+        """
+        return sorted(
+            self.commands.values(),
+            key=lambda stats: stats.wall.percentile(percent),
+            reverse=True,
+        )[:limit]
+
+
+def record_http(seconds: float) -> None:
+    """Adds time spent in HTTP calls to the command of the current task
+
+    Args:
+        seconds (float): The time spent
+    """
+    timing = current_timing.get()
+    if timing is not None:
+        timing.http_seconds += seconds
+
+
+def record_query(query: str, seconds: float, failed: bool = False) -> None:
+    """Adds the time of a query to the totals and to the command of the task
+    that made the query, and reports it if it was slow
+
+    Args:
+        query (str): The SQL of the query
+        seconds (float): How long the query took
+        failed (bool, optional): Whether the query raised an error. Defaults to False
+    """
+    query_stats.count += 1
+    query_stats.seconds += seconds
+    if failed:
+        query_stats.errors += 1
+
+    timing = current_timing.get()
+    if timing is not None:
+        timing.db_seconds += seconds
+        timing.queries += 1
+
+    slow_seconds = query_stats.slow_seconds
+    if slow_seconds is not None and seconds >= slow_seconds:
+        query_stats.slow += 1
+        if query_stats.on_slow is not None:
+            query_stats.on_slow(
+                query, seconds, timing.name if timing is not None else None
+            )
+
+
+class TimedConnection(asyncpg.Connection):
+    """An asyncpg connection that times every statement it executes.
+    gino runs its queries straight through _do_execute, skipping the query loggers
+    of asyncpg, so the timing is done there. It runs in the task that made the query
+    """
+
+    async def _do_execute(
+        self: Self,
+        query: str,
+        executor: Callable[..., Awaitable[Any]],
+        timeout: float | None,
+        retry: bool = True,
+        **kwargs: dict[str, Any],
+    ) -> tuple[Any, Any]:
+        """Executes a statement, recording how long it took
+
+        Args:
+            query (str): The SQL of the statement
+            executor (Callable[..., Awaitable[Any]]): Runs the prepared statement
+            timeout (float | None): The most seconds the statement can take
+            retry (bool, optional): Whether the statement can be retried after
+                a schema change. Only the first try is timed, as it includes the retry
+            **kwargs (dict[str, Any]): The rest of the asyncpg execute arguments
+
+        Returns:
+            tuple[Any, Any]: The result and the prepared statement
+        """
+        if not retry:
+            return await super()._do_execute(query, executor, timeout, retry, **kwargs)
+
+        started = time.monotonic()
+        failed = True
+        try:
+            result = await super()._do_execute(
+                query, executor, timeout, retry, **kwargs
+            )
+            failed = False
+            return result
+        finally:
+            record_query(query, time.monotonic() - started, failed)
+
+
+class TimedPool(gino_asyncpg.Pool):
+    """The gino connection pool, made of connections that report query times
+
+    Args:
+        url (URL): The database URL
+        loop (asyncio.AbstractEventLoop): The event loop the pool runs on
+        **kwargs (dict[str, Any]): The rest of the asyncpg pool arguments
+    """
+
+    def __init__(
+        self: Self,
+        url: URL,
+        loop: asyncio.AbstractEventLoop,
+        **kwargs: dict[str, Any],
+    ) -> None:
+        super().__init__(url, loop, connection_class=TimedConnection, **kwargs)
@@ -0,0 +1,130 @@
+"""
+Defines the command rate limiter, shared by prefix and slash commands
+This has no commands
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Self
+
+
+class CommandWindow:
+    """The command history of a single member in a single guild.
+    Timestamps are kept in a fixed size ring, so checks never grow with history
+
+    Args:
+        size (int): The number of commands allowed in the window
+    """
+
+    __slots__ = (
+        "timestamps",
+        "position",
+        "last_command_id",
+        "last_seen",
+    )
+
+    def __init__(self: Self, size: int) -> None:
+        self.timestamps: list[float] = [0.0] * size
+        self.position: int = 0
+        self.last_command_id: int = None
+        self.last_seen: float = 0.0
+
+
+class CommandRateLimiter:
+    """A sliding window rate limiter for commands, with idle entries evicted over time.
+    A member who runs more than the allowed commands in the window is banned for ban_seconds
+
+    Args:
+        ban_seconds (int): How long a member is blocked after going over the limit
+        max_identities (int): The most members to track at once
+    """
+
+    def __init__(
+        self: Self, ban_seconds: int = 600, max_identities: int = 5000
+    ) -> None:
+        self.ban_seconds = ban_seconds
+        self.max_identities = max_identities
+        self.longest_window = 0
+        # Least recently seen identity is always first
+        self.windows: OrderedDict[str, CommandWindow] = OrderedDict()
+        # When each ban ends, kept apart from the windows so evicting a window
+        # never lifts a ban. Every ban is the same length, so the soonest to end is first
+        self.bans: OrderedDict[str, float] = OrderedDict()
+
+    def check(
+        self: Self,
+        identity: str,
+        command_id: int,
+        commands: int,
+        window_seconds: int,
+        now: float = None,
+    ) -> bool:
+        """Records a command run, and checks if the identity is under the rate limit.
+        A single command ID is only ever counted once
+
+        Args:
+            identity (str): The member and guild the command was run by
+            command_id (int): The ID of the message or interaction
+            commands (int): The number of commands allowed in the window
+            window_seconds (int): The length of the window, in seconds
+            now (float, optional): The current time. Defaults to time.monotonic()
+
+        Returns:
+            bool: True if the command should be run, False if under rate limit
+        """
+        if now is None:
+            now = time.monotonic()
+
+        size = max(int(commands), 1)
+        window = self.windows.get(identity)
+        if window is None or len(window.timestamps) != size:
+            window = CommandWindow(size)
+            self.windows[identity] = window
+        self.windows.move_to_end(identity)
+        window.last_seen = now
+
+        if command_id != window.last_command_id:
+            window.last_command_id = command_id
+            # The oldest timestamp is the one about to be overwritten
+            oldest = window.timestamps[window.position]
+            if oldest and now - oldest < window_seconds:
+                self.bans[identity] = now + self.ban_seconds
+                self.bans.move_to_end(identity)
+            window.timestamps[window.position] = now
+            window.position = (window.position + 1) % size
+
+        self.longest_window = max(self.longest_window, window_seconds)
+        self.evict(now)
+
+        return self.bans.get(identity, 0.0) <= now
+
+    def evict(self: Self, now: float) -> None:
+        """Removes identities that have been idle long enough to have no effect,
+        and the least recently seen identities if too many are tracked.
+        Bans are only removed once they end
+
+        Args:
+            now (float): The current time
+        """
+        while self.bans and next(iter(self.bans.values())) <= now:
+            self.bans.popitem(last=False)
+
+        idle_seconds = self.longest_window
+        while self.windows:
+            identity, window = next(iter(self.windows.items()))
+            if (
+                len(self.windows) <= self.max_identities
+                and now - window.last_seen < idle_seconds
+            ):
+                break
+            del self.windows[identity]
+
+    def __len__(self: Self) -> int:
+        """Gets the number of identities currently tracked
+
+        Returns:
+            int: The number of tracked identities
+        """
+        return len(self.windows)
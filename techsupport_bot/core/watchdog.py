@@ -0,0 +1,176 @@
+"""
+Defines the event loop watchdog, which measures how late the loop runs scheduled work
+and captures the stack of whatever blocked it
+This has no commands
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import statistics
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from botlogging import LogLevel
+
+if TYPE_CHECKING:
+    import bot
+
+
+@dataclass
+class LoopStall:
+    """A single time the event loop was blocked past the threshold
+
+    Attributes:
+        time (datetime.datetime): When the stall ended, in UTC
+        seconds (float): How late the loop was
+        stack (str): The stack of the loop thread while it was blocked, if it was caught
+    """
+
+    time: datetime.datetime
+    seconds: float
+    stack: str = None
+
+
+class LoopWatchdog:
+    """Measures event loop lag with a task that should wake every interval.
+    A separate thread watches the heartbeat of that task, and if the loop stops
+    for longer than the threshold, saves the stack of the loop thread
+
+    Attributes:
+        STACK_LIMIT (int): The most frames of a blocked stack to keep
+
+    Args:
+        bot (bot.TechSupportBot): The bot object, used for logging
+        interval (float): How often the lag is measured, in seconds
+        threshold (float): The lag that counts as the loop being blocked, in seconds
+        history (int): The number of recent lag samples to keep
+        max_stalls (int): The number of recent stalls to keep
+    """
+
+    STACK_LIMIT: int = 15
+
+    def __init__(
+        self: Self,
+        bot: bot.TechSupportBot,
+        interval: float = 0.25,
+        threshold: float = 0.5,
+        history: int = 1200,
+        max_stalls: int = 10,
+    ) -> None:
+        self.bot = bot
+        self.interval = interval
+        self.threshold = threshold
+        self.lags: deque[float] = deque(maxlen=history)
+        self.stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        self.stall_count = 0
+        self.max_lag = 0.0
+
+        self.heartbeat = time.monotonic()
+        self.loop_thread_id: int = None
+        self.captured_stack: str = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.task: asyncio.Task = None
+        self.thread: threading.Thread = None
+
+    def start(self: Self) -> None:
+        """Starts the lag task on the running loop, and the thread watching it"""
+        if self.task and not self.task.done():
+            return
+        self.loop_thread_id = threading.get_ident()
+        self.heartbeat = time.monotonic()
+        self.stopped.clear()
+        self.task = asyncio.create_task(self.run())
+        self.thread = threading.Thread(
+            target=self.watch, name="loop-watchdog", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self: Self) -> None:
+        """Stops the lag task and the watching thread"""
+        self.stopped.set()
+        if self.task:
+            self.task.cancel()
+
+    async def run(self: Self) -> None:
+        """Sleeps for the interval forever, recording how late every wake up is"""
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.heartbeat = now
+            lag = max(now - expected, 0.0)
+            self.lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+            if lag >= self.threshold:
+                await self.record_stall(lag)
+
+    async def record_stall(self: Self, lag: float) -> None:
+        """Saves and logs a stall, with the stack captured while it was happening
+
+        Args:
+            lag (float): How late the loop was
+        """
+        with self.lock:
+            stack = self.captured_stack
+            self.captured_stack = None
+
+        stall = LoopStall(
+            time=datetime.datetime.utcnow(),
+            seconds=lag,
+            stack=stack,
+        )
+        self.stalls.append(stall)
+        self.stall_count += 1
+
+        message = f"Event loop was blocked for {lag:.2f}s"
+        if stack:
+            message += f", while running:\n{stack}"
+        await self.bot.logger.send_log(
+            message=message, level=LogLevel.WARNING, console_only=True
+        )
+
+    def watch(self: Self) -> None:
+        """Runs in a thread, saving the loop thread stack once per stall"""
+        while not self.stopped.wait(self.interval):
+            blocked_for = time.monotonic() - self.heartbeat
+            if blocked_for < self.interval + self.threshold:
+                continue
+            with self.lock:
+                if self.captured_stack is not None:
+                    continue
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame)[-self.STACK_LIMIT :])
+            with self.lock:
+                self.captured_stack = stack
+
+    def get_stats(self: Self) -> dict[str, Any]:
+        """Gets a summary of the recent loop lag
+
+        Returns:
+            dict[str, Any]: The recent lag percentiles, maximum lag and stalls
+        """
+        lags = sorted(self.lags)
+        if lags:
+            p50 = statistics.median(lags)
+            p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+        else:
+            p50 = p99 = 0.0
+        return {
+            "p50": p50,
+            "p99": p99,
+            "max": self.max_lag,
+            "stalls": self.stall_count,
+            "last_stall": self.stalls[-1] if self.stalls else None,
+        }
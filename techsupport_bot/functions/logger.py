@@ -37,6 +37,20 @@ async def setup(bot: bot.TechSupportBot) -> None:
 class Logger(cogs.MatchCog):
     """Class for the logger to make it to discord."""
 
+    def match_channels(self: Self, config: munch.Munch) -> set[int]:
+        """Gets every channel that has a logger rule
+
+        Args:
+            config (munch.Munch): The config for the guild to get the channels from
+
+        Returns:
+            set[int]: The set of channel IDs that are logged
+        """
+        return {
+            int(channel_id)
+            for channel_id in config.extensions.logger.channel_map.value.keys()
+        }
+
     async def match(
         self: Self, config: munch.Munch, ctx: commands.Context, _: str
     ) -> bool:
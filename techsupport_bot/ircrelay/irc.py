@@ -31,6 +31,8 @@ class IRCBot(ib3.auth.SASL, irc.bot.SingleServerIRCBot):
         connection (irc.client.ServerConnection): The IRC connection event
         join_thread (threading.Timer): The repeating join channel request thread
         ready (bool): Whether the IRC bot is ready to send messages
+        messages_to_discord (int): The number of IRC messages relayed to discord
+        messages_to_irc (int): The number of lines sent to IRC
 
     Args:
         loop (asyncio.AbstractEventLoop): The running event loop for the discord API.
@@ -48,6 +50,8 @@ class IRCBot(ib3.auth.SASL, irc.bot.SingleServerIRCBot):
     connection: irc.client.ServerConnection = None
     join_thread: threading.Timer = None
     ready: bool = False
+    messages_to_discord: int = 0
+    messages_to_irc: int = 0
 
     def __init__(
         self: Self,
@@ -182,6 +186,7 @@ class IRCBot(ib3.auth.SASL, irc.bot.SingleServerIRCBot):
         Args:
             split_message (dict[str, str]): The formatted message to send to discord
         """
+        self.messages_to_discord += 1
         asyncio.run_coroutine_threadsafe(
             self.irc_cog.send_message_from_irc(split_message=split_message), self.loop
         )
@@ -278,6 +283,7 @@ class IRCBot(ib3.auth.SASL, irc.bot.SingleServerIRCBot):
         message_list = [message[i : i + 430] for i in range(0, len(message), 430)]
         for cut_message in message_list:
             self.connection.privmsg(channel, cut_message)
+            self.messages_to_irc += 1
 
     def on_mode(
         self: Self, _: irc.client.ServerConnection, event: irc.client.Event
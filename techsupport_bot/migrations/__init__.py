@@ -0,0 +1,5 @@
+"""
+This is the folder for the numbered database migrations, applied by core/migrator.py
+Every file is named mNNNN_description.py and has an async upgrade(bot) function.
+Migrations run once each, in order, and must be safe to run on any existing schema
+"""
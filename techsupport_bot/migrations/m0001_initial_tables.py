@@ -0,0 +1,136 @@
+"""Creates the tables as they were before migrations were added.
+Later changes to the models are made by later migrations, never here.
+Installs that already have these tables are left alone
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import bot
+
+# Ordered so that factoids exists before factoid_jobs references it
+CREATE_TABLES = (
+    "CREATE TABLE IF NOT EXISTS appbans ("
+    " pk SERIAL NOT NULL,"
+    " guild_id VARCHAR,"
+    " applicant_id VARCHAR,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS applications ("
+    " pk SERIAL NOT NULL,"
+    " guild_id VARCHAR,"
+    " applicant_name VARCHAR,"
+    " applicant_id VARCHAR,"
+    " application_status VARCHAR,"
+    " background VARCHAR,"
+    " reason VARCHAR,"
+    " application_time TIMESTAMP WITHOUT TIME ZONE,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS duckusers ("
+    " pk SERIAL NOT NULL,"
+    " author_id VARCHAR,"
+    " guild_id VARCHAR,"
+    " befriend_count INTEGER,"
+    " kill_count INTEGER,"
+    " updated TIMESTAMP WITHOUT TIME ZONE,"
+    " speed_record FLOAT,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS factoids ("
+    " factoid_id SERIAL NOT NULL,"
+    " name VARCHAR,"
+    " guild VARCHAR,"
+    " message VARCHAR,"
+    " time TIMESTAMP WITHOUT TIME ZONE,"
+    " embed_config VARCHAR,"
+    " hidden BOOLEAN,"
+    " protected BOOLEAN,"
+    " disabled BOOLEAN,"
+    " restricted BOOLEAN,"
+    " alias VARCHAR,"
+    " PRIMARY KEY (factoid_id))",
+    "CREATE TABLE IF NOT EXISTS grabs ("
+    " pk SERIAL NOT NULL,"
+    " author_id VARCHAR,"
+    " channel VARCHAR,"
+    " guild VARCHAR,"
+    " message VARCHAR,"
+    " time TIMESTAMP WITHOUT TIME ZONE,"
+    " nsfw BOOLEAN,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS guild_config ("
+    " pk SERIAL NOT NULL,"
+    " guild_id VARCHAR,"
+    " config VARCHAR,"
+    " update_time TIMESTAMP WITHOUT TIME ZONE,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS guild_rules ("
+    " pk SERIAL NOT NULL,"
+    " guild_id VARCHAR,"
+    " rules VARCHAR,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS ircchannelmap ("
+    " map_id SERIAL NOT NULL,"
+    " guild_id VARCHAR,"
+    " discord_channel_id VARCHAR,"
+    " irc_channel_id VARCHAR,"
+    " PRIMARY KEY (map_id))",
+    "CREATE TABLE IF NOT EXISTS listeners ("
+    " pk SERIAL NOT NULL,"
+    " src_id VARCHAR,"
+    " dst_id VARCHAR,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS modmail_bans ("
+    " user_id VARCHAR NOT NULL,"
+    " PRIMARY KEY (user_id))",
+    "CREATE TABLE IF NOT EXISTS usernote ("
+    " pk SERIAL NOT NULL,"
+    " user_id VARCHAR,"
+    " guild_id VARCHAR,"
+    " updated TIMESTAMP WITHOUT TIME ZONE,"
+    " author_id VARCHAR,"
+    " body VARCHAR,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS voting ("
+    " vote_id SERIAL NOT NULL,"
+    " guild_id VARCHAR,"
+    " message_id VARCHAR,"
+    " thread_id VARCHAR,"
+    " vote_owner_id VARCHAR,"
+    " vote_description VARCHAR,"
+    " vote_ids_yes VARCHAR,"
+    " vote_ids_no VARCHAR,"
+    " vote_ids_all VARCHAR,"
+    " votes_yes INTEGER,"
+    " votes_no INTEGER,"
+    " votes_total INTEGER,"
+    " start_time TIMESTAMP WITHOUT TIME ZONE,"
+    " vote_active BOOLEAN,"
+    " blind BOOLEAN,"
+    " anonymous BOOLEAN,"
+    " PRIMARY KEY (vote_id))",
+    "CREATE TABLE IF NOT EXISTS warnings ("
+    " pk SERIAL NOT NULL,"
+    " user_id VARCHAR,"
+    " guild_id VARCHAR,"
+    " reason VARCHAR,"
+    " time TIMESTAMP WITHOUT TIME ZONE,"
+    " PRIMARY KEY (pk))",
+    "CREATE TABLE IF NOT EXISTS factoid_jobs ("
+    " job_id SERIAL NOT NULL,"
+    " factoid INTEGER,"
+    " channel VARCHAR,"
+    " cron VARCHAR,"
+    " PRIMARY KEY (job_id),"
+    " FOREIGN KEY (factoid) REFERENCES factoids (factoid_id))",
+)
+
+
+async def upgrade(bot: bot.TechSupportBot) -> None:
+    """Creates the missing tables
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database connection
+    """
+    for statement in CREATE_TABLES:
+        await bot.db.status(bot.db.text(statement))
@@ -0,0 +1,45 @@
+"""Converts guild configs to JSONB, and makes guild_id unique in guild_config"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import bot
+
+
+async def upgrade(bot: bot.TechSupportBot) -> None:
+    """Upgrades a guild_config table made before configs were stored as JSONB
+    This converts the config column to JSONB, and makes guild_id unique so
+    configs can be written with a single UPSERT. Does nothing if already upgraded
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database connection
+    """
+    column_type = await bot.db.scalar(
+        bot.db.text(
+            "SELECT data_type FROM information_schema.columns"
+            " WHERE table_name = 'guild_config' AND column_name = 'config'"
+        )
+    )
+    if column_type != "jsonb":
+        await bot.db.status(
+            bot.db.text(
+                "ALTER TABLE guild_config"
+                " ALTER COLUMN config TYPE JSONB USING config::jsonb"
+            )
+        )
+
+    # Only the newest config for a guild was ever used, so older duplicates are dropped
+    await bot.db.status(
+        bot.db.text(
+            "DELETE FROM guild_config older USING guild_config newer"
+            " WHERE older.guild_id = newer.guild_id AND older.pk < newer.pk"
+        )
+    )
+    await bot.db.status(
+        bot.db.text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS guild_config_guild_id_key"
+            " ON guild_config (guild_id)"
+        )
+    )
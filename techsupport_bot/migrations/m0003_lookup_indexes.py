@@ -0,0 +1,37 @@
+"""Adds the indexes of the hot lookups"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import bot
+
+CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_appbans_guild_applicant"
+    " ON appbans (guild_id, applicant_id)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_guild_applicant_status"
+    " ON applications (guild_id, applicant_id, application_status)",
+    "CREATE INDEX IF NOT EXISTS ix_duckusers_guild_author"
+    " ON duckusers (guild_id, author_id)",
+    "CREATE INDEX IF NOT EXISTS ix_factoids_guild_name ON factoids (guild, name)",
+    "CREATE INDEX IF NOT EXISTS ix_grabs_guild_author_nsfw"
+    " ON grabs (guild, author_id, nsfw)",
+    "CREATE INDEX IF NOT EXISTS ix_listeners_src ON listeners (src_id)",
+    "CREATE INDEX IF NOT EXISTS ix_usernote_guild_user_updated"
+    " ON usernote (guild_id, user_id, updated)",
+    "CREATE INDEX IF NOT EXISTS ix_voting_guild_active"
+    " ON voting (guild_id, vote_active)",
+    "CREATE INDEX IF NOT EXISTS ix_voting_message ON voting (message_id)",
+    "CREATE INDEX IF NOT EXISTS ix_warnings_guild_user ON warnings (guild_id, user_id)",
+)
+
+
+async def upgrade(bot: bot.TechSupportBot) -> None:
+    """Creates the missing indexes
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database connection
+    """
+    for statement in CREATE_INDEXES:
+        await bot.db.status(bot.db.text(statement))
@@ -0,0 +1,58 @@
+"""Converts the discord ID columns of every table from VARCHAR to BIGINT"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import bot
+
+# The discord ID columns of each table, as they were when stored as strings
+SNOWFLAKE_COLUMNS = {
+    "applications": ["guild_id", "applicant_id"],
+    "appbans": ["guild_id", "applicant_id"],
+    "duckusers": ["author_id", "guild_id"],
+    "factoids": ["guild"],
+    "factoid_jobs": ["channel"],
+    "grabs": ["author_id", "channel", "guild"],
+    "ircchannelmap": ["guild_id", "discord_channel_id"],
+    "modmail_bans": ["user_id"],
+    "usernote": ["user_id", "guild_id", "author_id"],
+    "warnings": ["user_id", "guild_id"],
+    "guild_config": ["guild_id"],
+    "listeners": ["src_id", "dst_id"],
+    "guild_rules": ["guild_id"],
+    "voting": ["guild_id", "message_id", "thread_id", "vote_owner_id"],
+}
+
+
+async def upgrade(bot: bot.TechSupportBot) -> None:
+    """Converts every ID column still stored as text, one ALTER per table so each
+    table is only rewritten once. Empty IDs become NULL, and anything else that
+    isn't a number stops the migration, so bad data is never silently dropped
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database connection
+    """
+    for table, columns in SNOWFLAKE_COLUMNS.items():
+        text_columns = [
+            column
+            for column in columns
+            if await bot.db.scalar(
+                bot.db.text(
+                    "SELECT data_type FROM information_schema.columns"
+                    " WHERE table_name = :table AND column_name = :column"
+                ),
+                table=table,
+                column=column,
+            )
+            in ("character varying", "text")
+        ]
+        if not text_columns:
+            continue
+
+        alterations = ", ".join(
+            f"ALTER COLUMN {column} TYPE BIGINT USING NULLIF(TRIM({column}), '')::BIGINT"
+            for column in text_columns
+        )
+        await bot.db.status(bot.db.text(f"ALTER TABLE {table} {alterations}"))
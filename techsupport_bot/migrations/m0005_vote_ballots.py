@@ -0,0 +1,60 @@
+"""Moves the ballots of votes out of the comma separated columns of the voting table,
+into a vote_ballots table with one row per voter
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import bot
+
+CREATE_BALLOTS = (
+    "CREATE TABLE IF NOT EXISTS vote_ballots ("
+    " vote_id INTEGER NOT NULL REFERENCES voting (vote_id) ON DELETE CASCADE,"
+    " voter_id BIGINT NOT NULL,"
+    " choice BOOLEAN NOT NULL,"
+    " voted_at TIMESTAMP WITHOUT TIME ZONE,"
+    " PRIMARY KEY (vote_id, voter_id))"
+)
+
+# A voter in both lists was never possible, but yes wins if the data says otherwise
+COPY_BALLOTS = (
+    "INSERT INTO vote_ballots (vote_id, voter_id, choice, voted_at)"
+    " SELECT vote_id, TRIM(voter)::BIGINT, {choice}, start_time"
+    " FROM voting, unnest(string_to_array({column}, ',')) AS voter"
+    " WHERE TRIM(voter) <> ''"
+    " ON CONFLICT (vote_id, voter_id) DO NOTHING"
+)
+
+
+async def upgrade(bot: bot.TechSupportBot) -> None:
+    """Creates the ballots table, copies every ballot into it, then drops the old
+    columns. Does nothing to the ballots if the old columns are already gone
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database connection
+    """
+    await bot.db.status(bot.db.text(CREATE_BALLOTS))
+
+    old_columns = await bot.db.scalar(
+        bot.db.text(
+            "SELECT count(*) FROM information_schema.columns"
+            " WHERE table_name = 'voting' AND column_name = 'vote_ids_yes'"
+        )
+    )
+    if not old_columns:
+        return
+
+    await bot.db.status(
+        bot.db.text(COPY_BALLOTS.format(column="vote_ids_yes", choice="TRUE"))
+    )
+    await bot.db.status(
+        bot.db.text(COPY_BALLOTS.format(column="vote_ids_no", choice="FALSE"))
+    )
+    await bot.db.status(
+        bot.db.text(
+            "ALTER TABLE voting DROP COLUMN vote_ids_yes,"
+            " DROP COLUMN vote_ids_no, DROP COLUMN vote_ids_all"
+        )
+    )
@@ -0,0 +1,192 @@
+"""
+This is a file to test the extensions/voting.py file
+This contains 5 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import gino
+import munch
+import pytest
+from commands import voting
+from core import databases
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.expression import ClauseElement
+
+
+def setup_local_extension() -> voting.Voting:
+    """A simple function to setup an instance of the voting extension,
+    with the real models on a database that isn't connected
+
+    Returns:
+        voting.Voting: The instance of the Voting class
+    """
+    bot = MagicMock()
+    bot.db = gino.Gino()
+    bot.models = munch.DefaultMunch(None)
+    databases.setup_models(bot)
+    with patch("asyncio.create_task", return_value=None):
+        return voting.Voting(bot=bot, extension_name="voting")
+
+
+def compile_query(query: ClauseElement) -> str:
+    """Compiles a query to the SQL sent to Postgres, on one line
+
+    Args:
+        query (ClauseElement): The query to compile
+
+    Returns:
+        str: The SQL of the query
+    """
+    return " ".join(str(query.compile(dialect=postgresql.dialect())).split())
+
+
+def make_interaction() -> MagicMock:
+    """Makes a fake interaction on a vote message
+
+    Returns:
+        MagicMock: The fake interaction
+    """
+    interaction = MagicMock()
+    interaction.message.id = 10
+    interaction.message.edit = AsyncMock()
+    interaction.user.id = 20
+    interaction.response.send_message = AsyncMock()
+    return interaction
+
+
+class Test_CastBallot:
+    """A set of tests to ensure a ballot is cast with a single upsert"""
+
+    @pytest.mark.asyncio
+    async def test_upsert(self: Self) -> None:
+        """Test to ensure only a changed choice replaces the ballot, and is returned"""
+        # Step 1 - Setup env
+        cog = setup_local_extension()
+        cog.bot.db.first = AsyncMock(return_value=(1,))
+
+        # Step 2 - Call the function
+        counted = await cog.cast_ballot(1, 20, True)
+
+        # Step 3 - Assert that everything works
+        sql = compile_query(cog.bot.db.first.await_args.args[0])
+        assert counted is True
+        assert sql.startswith("INSERT INTO vote_ballots (vote_id, voter_id, choice,")
+        assert (
+            "ON CONFLICT (vote_id, voter_id) DO UPDATE SET"
+            " choice = excluded.choice, voted_at = excluded.voted_at"
+            " WHERE vote_ballots.choice != excluded.choice"
+            " RETURNING vote_ballots.vote_id"
+        ) in sql
+
+    @pytest.mark.asyncio
+    async def test_same_choice(self: Self) -> None:
+        """Test to ensure no returned row means the voter already made this choice"""
+        # Step 1 - Setup env
+        cog = setup_local_extension()
+        cog.bot.db.first = AsyncMock(return_value=None)
+
+        # Step 2 - Call the function
+        counted = await cog.cast_ballot(1, 20, True)
+
+        # Step 3 - Assert that everything works
+        assert counted is False
+
+
+class Test_RegisterVote:
+    """A set of tests to ensure votes are registered and reported to the voter"""
+
+    @pytest.mark.asyncio
+    async def test_already_voted(self: Self) -> None:
+        """Test to ensure voting the same choice again changes nothing"""
+        # Step 1 - Setup env
+        cog = setup_local_extension()
+        cog.search_db_for_vote_by_message = AsyncMock(
+            return_value=munch.Munch(vote_id=1)
+        )
+        cog.cast_ballot = AsyncMock(return_value=False)
+        cog.build_vote_embed = AsyncMock()
+        interaction = make_interaction()
+
+        # Step 2 - Call the function
+        await cog.register_vote(interaction, MagicMock(), choice=True)
+
+        # Step 3 - Assert that everything works
+        cog.cast_ballot.assert_awaited_once_with(1, 20, True)
+        cog.build_vote_embed.assert_not_awaited()
+        interaction.message.edit.assert_not_awaited()
+        interaction.response.send_message.assert_awaited_once_with(
+            "You have already voted yes", ephemeral=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_changed_choice(self: Self) -> None:
+        """Test to ensure a changed choice is counted and the embed is rebuilt"""
+        # Step 1 - Setup env
+        cog = setup_local_extension()
+        cog.search_db_for_vote_by_message = AsyncMock(
+            return_value=munch.Munch(vote_id=1)
+        )
+        cog.cast_ballot = AsyncMock(return_value=True)
+        cog.build_vote_embed = AsyncMock(return_value="embed")
+        interaction = make_interaction()
+        view = MagicMock()
+
+        # Step 2 - Call the function
+        await cog.register_vote(interaction, view, choice=False)
+
+        # Step 3 - Assert that everything works
+        cog.cast_ballot.assert_awaited_once_with(1, 20, False)
+        interaction.message.edit.assert_awaited_once_with(embed="embed", view=view)
+        interaction.response.send_message.assert_awaited_once_with(
+            "Your vote for no has been counted", ephemeral=True
+        )
+
+
+class Test_ClearVote:
+    """A set of tests to ensure a voter can remove their ballot"""
+
+    @pytest.mark.asyncio
+    async def test_deletes_own_ballot(
+        self: Self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure only the ballot of the voter in this vote is deleted
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to capture the delete query
+        """
+        # Step 1 - Setup env
+        cog = setup_local_extension()
+        cog.search_db_for_vote_by_message = AsyncMock(
+            return_value=munch.Munch(vote_id=1)
+        )
+        cog.build_vote_embed = AsyncMock(return_value="embed")
+        interaction = make_interaction()
+        status = AsyncMock()
+        monkeypatch.setattr(gino.api.GinoExecutor, "status", status)
+        queries = []
+        monkeypatch.setattr(
+            gino.api.GinoExecutor,
+            "__init__",
+            lambda executor, query: queries.append(query),
+        )
+
+        # Step 2 - Call the function
+        await cog.clear_vote(interaction, MagicMock())
+
+        # Step 3 - Assert that everything works
+        status.assert_awaited_once()
+        assert compile_query(queries[0]) == (
+            "DELETE FROM vote_ballots WHERE vote_ballots.vote_id = %(vote_id_1)s"
+            " AND vote_ballots.voter_id = %(voter_id_1)s"
+        )
+        assert queries[0].compile(dialect=postgresql.dialect()).params == {
+            "vote_id_1": 1,
+            "voter_id_1": 20,
+        }
+        interaction.response.send_message.assert_awaited_once_with(
+            "Your vote has been removed", ephemeral=True
+        )
@@ -0,0 +1,146 @@
+"""
+This is a file to test the core/cogs.py file
+This contains 5 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import munch
+import pytest
+from core import cogs, guildconfig
+
+
+def make_match_cog(
+    bot: MagicMock, match_result: bool, match_order: int = 100
+) -> MagicMock:
+    """A helper to make a fake match cog
+
+    Args:
+        bot (MagicMock): The fake bot the cog belongs to
+        match_result (bool): What match() should return
+        match_order (int): The order the cog should be matched in
+
+    Returns:
+        MagicMock: The fake match cog
+    """
+    cog = MagicMock()
+    cog.bot = bot
+    cog.MATCH_ORDER = match_order
+    cog.extension_enabled.return_value = True
+    cog.match_channels.return_value = None
+    cog.match = AsyncMock(return_value=match_result)
+    cog.handle_response = AsyncMock()
+    return cog
+
+
+def make_env() -> tuple[MagicMock, MagicMock]:
+    """A helper to make a fake bot and context
+
+    Returns:
+        tuple[MagicMock, MagicMock]: The fake bot and the fake context
+    """
+    bot = MagicMock()
+    bot.guild_configs = guildconfig.GuildConfigStore()
+    bot.guild_configs["1"] = munch.Munch(guild_id="1", logging_channel=None)
+    ctx = MagicMock()
+    ctx.guild.id = 1
+    ctx.channel.id = 10
+    ctx.channel.parent_id = None
+    ctx.message.content = "message"
+    return bot, ctx
+
+
+class Test_MatchDispatcher:
+    """A set of tests to ensure the MatchDispatcher works"""
+
+    @pytest.mark.asyncio
+    async def test_only_matched_cogs_respond(self: Self) -> None:
+        """Test to ensure only cogs that match get a response"""
+        # Step 1 - Setup env
+        bot, ctx = make_env()
+        dispatcher = cogs.MatchDispatcher(bot)
+        matched_cog = make_match_cog(bot, True)
+        unmatched_cog = make_match_cog(bot, False)
+        dispatcher.register(matched_cog)
+        dispatcher.register(unmatched_cog)
+
+        # Step 2 - Call the function
+        await dispatcher.dispatch(ctx)
+
+        # Step 3 - Assert that everything works
+        matched_cog.handle_response.assert_awaited_once_with(
+            bot.guild_configs["1"], ctx, "message", True
+        )
+        unmatched_cog.handle_response.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_match_order(self: Self) -> None:
+        """Test to ensure cogs are matched in MATCH_ORDER"""
+        # Step 1 - Setup env
+        bot, ctx = make_env()
+        dispatcher = cogs.MatchDispatcher(bot)
+        late_cog = make_match_cog(bot, False, match_order=100)
+        early_cog = make_match_cog(bot, False, match_order=10)
+        dispatcher.register(late_cog)
+        dispatcher.register(early_cog)
+
+        # Step 2 - Call the function
+        await dispatcher.dispatch(ctx)
+
+        # Step 3 - Assert that everything works
+        assert dispatcher.match_cogs == [early_cog, late_cog]
+
+    @pytest.mark.asyncio
+    async def test_disabled_cog_skipped(self: Self) -> None:
+        """Test to ensure a cog whose extension is disabled is never matched"""
+        # Step 1 - Setup env
+        bot, ctx = make_env()
+        dispatcher = cogs.MatchDispatcher(bot)
+        disabled_cog = make_match_cog(bot, True)
+        disabled_cog.extension_enabled.return_value = False
+        dispatcher.register(disabled_cog)
+
+        # Step 2 - Call the function
+        await dispatcher.dispatch(ctx)
+
+        # Step 3 - Assert that everything works
+        disabled_cog.match.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unregister(self: Self) -> None:
+        """Test to ensure an unregistered cog no longer gets messages"""
+        # Step 1 - Setup env
+        bot, ctx = make_env()
+        dispatcher = cogs.MatchDispatcher(bot)
+        match_cog = make_match_cog(bot, True)
+        dispatcher.register(match_cog)
+        dispatcher.unregister(match_cog)
+
+        # Step 2 - Call the function
+        await dispatcher.dispatch(ctx)
+
+        # Step 3 - Assert that everything works
+        match_cog.match.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_channel_prefilter(self: Self) -> None:
+        """Test to ensure cogs are only matched in the channels they declare"""
+        # Step 1 - Setup env
+        bot, ctx = make_env()
+        dispatcher = cogs.MatchDispatcher(bot)
+        watching_cog = make_match_cog(bot, True)
+        watching_cog.match_channels.return_value = {10}
+        other_cog = make_match_cog(bot, True)
+        other_cog.match_channels.return_value = {20}
+        dispatcher.register(watching_cog)
+        dispatcher.register(other_cog)
+
+        # Step 2 - Call the function
+        await dispatcher.dispatch(ctx)
+
+        # Step 3 - Assert that everything works
+        watching_cog.match.assert_awaited_once()
+        other_cog.match.assert_not_awaited()
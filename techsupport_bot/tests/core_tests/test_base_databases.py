@@ -0,0 +1,128 @@
+"""
+This is a file to test the core/databases.py file
+This contains 5 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import MagicMock
+
+import gino
+import munch
+from core import databases
+from migrations import m0001_initial_tables, m0003_lookup_indexes
+
+
+def make_bot() -> MagicMock:
+    """Makes a fake bot with the models set up on a database that isn't connected
+
+    Returns:
+        MagicMock: The fake bot
+    """
+    bot = MagicMock()
+    bot.db = gino.Gino()
+    bot.models = munch.DefaultMunch(None)
+    databases.setup_models(bot)
+    return bot
+
+
+class Test_Indexes:
+    """A set of tests to ensure the lookup indexes are declared and created"""
+
+    def test_lookups_indexed(self: Self) -> None:
+        """Test to ensure the hot lookups have an index"""
+        # Step 1 - Setup env
+        bot = make_bot()
+
+        # Step 2 - Call the function
+        indexes = {
+            (table.name, tuple(column.name for column in index.columns))
+            for table in bot.db.sorted_tables
+            for index in table.indexes
+        }
+
+        # Step 3 - Assert that everything works
+        assert ("factoids", ("guild", "name")) in indexes
+        assert ("warnings", ("guild_id", "user_id")) in indexes
+        assert ("voting", ("message_id",)) in indexes
+
+    def test_created_by_migration(self: Self) -> None:
+        """Test to ensure every index declared on the models is made by a migration"""
+        # Step 1 - Setup env
+        bot = make_bot()
+
+        # Step 2 - Call the function
+        declared = {
+            index.name for table in bot.db.sorted_tables for index in table.indexes
+        }
+        created = {
+            statement.split()[5] for statement in m0003_lookup_indexes.CREATE_INDEXES
+        }
+
+        # Step 3 - Assert that everything works
+        assert declared == created
+
+
+class Test_Snowflake:
+    """A set of tests to ensure discord IDs are stored as BIGINT"""
+
+    def test_bind_and_result(self: Self) -> None:
+        """Test to ensure IDs are sent as ints and read back as strings"""
+        # Step 1 - Setup env
+        bot = make_bot()
+        snowflake = bot.models.Factoid.guild.type
+
+        # Step 2 - Call the function
+        bound = [
+            snowflake.process_bind_param(value, None) for value in ("1024", 1024, None)
+        ]
+        result = snowflake.process_result_value(1024, None)
+
+        # Step 3 - Assert that everything works
+        assert isinstance(snowflake, databases.Snowflake)
+        assert bound == [1024, 1024, None]
+        assert result == "1024"
+
+
+class Test_VoteBallots:
+    """A set of tests to ensure ballots are stored one row per voter"""
+
+    def test_keyed_by_voter(self: Self) -> None:
+        """Test to ensure a voter can only have one ballot per vote"""
+        # Step 1 - Setup env
+        bot = make_bot()
+
+        # Step 2 - Call the function
+        ballots = bot.models.VoteBallot.__table__
+        votes = bot.models.Votes.__table__
+
+        # Step 3 - Assert that everything works
+        assert [column.name for column in ballots.primary_key] == [
+            "vote_id",
+            "voter_id",
+        ]
+        assert isinstance(ballots.c.voter_id.type, databases.Snowflake)
+        assert "vote_ids_yes" not in votes.c
+
+
+class Test_Baseline:
+    """A set of tests to ensure the baseline migration matches the tables in use"""
+
+    def test_every_table(self: Self) -> None:
+        """Test to ensure every table is made by the baseline, or by its own migration"""
+        # Step 1 - Setup env
+        bot = make_bot()
+
+        # Step 2 - Call the function
+        declared = {table.name for table in bot.db.sorted_tables}
+        created = {
+            statement.split()[5] for statement in m0001_initial_tables.CREATE_TABLES
+        }
+
+        # Step 3 - Assert that everything works
+        assert declared - created == {"vote_ballots"}
+        assert all(
+            statement.startswith("CREATE TABLE IF NOT EXISTS")
+            for statement in m0001_initial_tables.CREATE_TABLES
+        )
@@ -0,0 +1,71 @@
+"""
+This is a file to test the core/extensionloader.py file
+This contains 4 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+import pytest
+from core import extensionloader
+
+
+class Test_BuildLoadPlan:
+    """A set of tests to ensure the extension load plan is built correctly"""
+
+    def test_no_dependencies(self: Self) -> None:
+        """Test to ensure extensions without dependencies all load in one wave"""
+        # Step 1 - Setup env
+        extensions = ["factoids", "relay", "logger"]
+
+        # Step 2 - Call the function
+        plan = extensionloader.build_load_plan(extensions, {})
+
+        # Step 3 - Assert that everything works
+        assert plan == [["factoids", "relay", "logger"]]
+
+    def test_dependencies_load_first(self: Self) -> None:
+        """Test to ensure an extension loads after its dependencies,
+        and unloaded dependencies are ignored"""
+        # Step 1 - Setup env
+        extensions = ["who", "application", "factoids"]
+        dependencies = {"who": ["application", "disabled"]}
+
+        # Step 2 - Call the function
+        plan = extensionloader.build_load_plan(extensions, dependencies)
+
+        # Step 3 - Assert that everything works
+        assert plan == [["application", "factoids"], ["who"]]
+
+    def test_cycle_raises(self: Self) -> None:
+        """Test to ensure a dependency cycle is an error"""
+        # Step 1 - Setup env
+        dependencies = {"one": ["two"], "two": ["one"]}
+
+        # Step 2 and 3 - Call the function and assert it fails
+        with pytest.raises(ValueError):
+            extensionloader.build_load_plan(["one", "two"], dependencies)
+
+
+class Test_StartupReport:
+    """A set of tests to ensure the startup report is logged once preconfig is done"""
+
+    def test_last_preconfig(self: Self) -> None:
+        """Test to ensure only the last startup preconfig to finish reports"""
+        # Step 1 - Setup env
+        report = extensionloader.StartupReport()
+        report.get("factoids").load_seconds = 0.5
+        report.start_preconfig()
+        report.start_preconfig()
+
+        # Step 2 - Call the function
+        first = report.record_preconfig("factoids", 1.0)
+        last = report.record_preconfig("factoids", 2.0)
+        report.start_preconfig()
+        reloaded = report.record_preconfig("factoids", 1.0)
+
+        # Step 3 - Assert that everything works
+        assert [first, last, reloaded] == [False, True, False]
+        assert "preconfig" not in report.format(preconfig=False)
+        assert "4.000s" in report.format()
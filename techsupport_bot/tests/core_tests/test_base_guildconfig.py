@@ -0,0 +1,151 @@
+"""
+This is a file to test the core/guildconfig.py file
+This contains 7 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import munch
+import pytest
+from core import guildconfig
+
+
+def make_config() -> munch.Munch:
+    """A helper to make a raw guild config
+
+    Returns:
+        munch.Munch: The raw guild config
+    """
+    return munch.munchify(
+        {
+            "guild_id": "1",
+            "command_prefix": ".",
+            "logging_channel": "100",
+            "enable_logging": True,
+            "private_channels": ["200", "not an id"],
+            "enabled_extensions": ["protect", "factoids"],
+            "rate_limit": {"enabled": True, "commands": 4, "time": 10},
+            "extensions": {
+                "protect": {
+                    "channels": {"value": ["300"]},
+                    "bypass_ids": {"value": [400, "401"]},
+                    "bypass_roles": {"value": ["Helper"]},
+                }
+            },
+        }
+    )
+
+
+class Test_GuildConfigStore:
+    """A set of tests to ensure guild configs are compiled into snapshots"""
+
+    def test_compiled_snapshot(self: Self) -> None:
+        """Test to ensure IDs are converted and lists are made into sets"""
+        # Step 1 - Setup env
+        store = guildconfig.GuildConfigStore()
+
+        # Step 2 - Call the function
+        store["1"] = make_config()
+        snapshot = store.snapshot(1)
+
+        # Step 3 - Assert that everything works
+        assert snapshot.logging_channel == 100
+        assert snapshot.private_channels == frozenset({200})
+        assert snapshot.enabled_extensions == frozenset({"protect", "factoids"})
+        assert snapshot.protect_channels == frozenset({300})
+        assert snapshot.protect_bypass_ids == frozenset({400, 401})
+        assert snapshot.protect_bypass_roles == frozenset({"helper"})
+        assert snapshot.factoid_restricted_channels == frozenset()
+
+    def test_version_changes(self: Self) -> None:
+        """Test to ensure setting a config again makes a new version"""
+        # Step 1 - Setup env
+        store = guildconfig.GuildConfigStore()
+        store["1"] = make_config()
+        old_version = store.snapshot("1").version
+
+        # Step 2 - Call the function
+        store["1"] = make_config()
+
+        # Step 3 - Assert that everything works
+        assert store.snapshot("1").version > old_version
+
+    def test_reset_config_removes_snapshot(self: Self) -> None:
+        """Test to ensure a falsy config has no snapshot"""
+        # Step 1 - Setup env
+        store = guildconfig.GuildConfigStore()
+        store["1"] = make_config()
+
+        # Step 2 - Call the function
+        store["1"] = False
+
+        # Step 3 - Assert that everything works
+        assert store.snapshot(1) is None
+
+
+class Test_BuildConfigPatch:
+    """A set of tests to ensure only changed config keys are written"""
+
+    def test_changed_and_removed_keys(self: Self) -> None:
+        """Test to ensure changed, added and removed keys are all found"""
+        # Step 1 - Setup env
+        old_config = {"prefix": ".", "logging": True, "old_key": 1}
+        new_config = {"prefix": "!", "logging": True, "new_key": 2}
+
+        # Step 2 - Call the function
+        patch = guildconfig.build_config_patch(old_config, new_config)
+
+        # Step 3 - Assert that everything works
+        assert patch == ([(["prefix"], "!"), (["new_key"], 2)], [["old_key"]])
+
+    def test_nested_key_changed(self: Self) -> None:
+        """Test to ensure a change deep in the config only patches that key"""
+        # Step 1 - Setup env
+        old_config = {"extensions": {"factoids": {"prefix": "?"}, "duck": {"on": 1}}}
+        new_config = {"extensions": {"factoids": {"prefix": "!"}, "duck": {"on": 1}}}
+
+        # Step 2 - Call the function
+        changed, removed = guildconfig.build_config_patch(old_config, new_config)
+        query = guildconfig.build_patch_query(len(changed), len(removed))
+
+        # Step 3 - Assert that everything works
+        assert changed == [(["extensions", "factoids", "prefix"], "!")]
+        assert not removed
+        assert query.count("jsonb_set") == 1
+
+    def test_reset_config_replaces(self: Self) -> None:
+        """Test to ensure a config that isn't a dict replaces the whole config"""
+        # Step 1 - Setup env
+        old_config = {"prefix": "."}
+
+        # Step 2 - Call the function
+        patch = guildconfig.build_config_patch(old_config, False)
+
+        # Step 3 - Assert that everything works
+        assert patch is None
+
+
+class Test_GuildConfigWriter:
+    """A set of tests to ensure configs are written to the database"""
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_retried(self: Self) -> None:
+        """Test to ensure a config that failed to write is kept, and flushed again later"""
+        # Step 1 - Setup env
+        bot = MagicMock()
+        bot.logger.send_log = AsyncMock()
+        bot.db.status = AsyncMock(side_effect=ConnectionError("database down"))
+        writer = guildconfig.GuildConfigWriter(bot, debounce_seconds=60)
+        writer.pending["1"] = {"prefix": "!"}
+
+        # Step 2 - Call the function
+        await writer.flush("1")
+
+        # Step 3 - Assert that everything works
+        assert writer.pending["1"] == {"prefix": "!"}
+        assert writer.failures["1"] == 1
+        assert "1" in writer.flush_tasks
+        writer.flush_tasks["1"].cancel()
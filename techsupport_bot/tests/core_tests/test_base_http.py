@@ -0,0 +1,165 @@
+"""
+This is a file to test the core/http.py file
+This contains 6 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import munch
+import pytest
+from core import http, httpcache, metrics
+
+
+def make_bot() -> MagicMock:
+    """Makes a fake bot, with just what HTTPCalls uses
+
+    Returns:
+        MagicMock: The fake bot
+    """
+    bot = MagicMock()
+    bot.metrics = metrics.MetricsRegistry()
+    bot.logger.send_log = AsyncMock()
+    bot.file_config = munch.munchify(
+        {"cache": {"http_cache_seconds": 60}, "api": {"api_url": {}}}
+    )
+    return bot
+
+
+def make_http_calls() -> http.HTTPCalls:
+    """Makes an HTTPCalls object with a fake bot, and a fake upstream fetch
+
+    Returns:
+        http.HTTPCalls: The HTTPCalls object, with fetch replaced by a slow mock
+    """
+    http_calls = http.HTTPCalls(make_bot())
+
+    async def fetch(*_args: tuple) -> httpcache.CachedResponse:
+        await asyncio.sleep(0.05)
+        return httpcache.CachedResponse(status=200, text='{"value": 1}')
+
+    http_calls.fetch = AsyncMock(side_effect=fetch)
+    return http_calls
+
+
+class Test_SharedFetch:
+    """A set of tests to ensure identical GET requests share one upstream call"""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share(self: Self) -> None:
+        """Test to ensure identical GETs made at once only call upstream once"""
+        # Step 1 - Setup env
+        http_calls = make_http_calls()
+
+        # Step 2 - Call the function
+        results = await asyncio.gather(
+            *(http_calls.http_call("get", "https://xkcd.com/1/") for _ in range(5))
+        )
+
+        # Step 3 - Assert that everything works
+        assert http_calls.fetch.await_count == 1
+        assert all(result.value == 1 for result in results)
+        assert not http_calls.in_flight
+
+    @pytest.mark.asyncio
+    async def test_different_gets_not_shared(self: Self) -> None:
+        """Test to ensure different GETs are not shared"""
+        # Step 1 - Setup env
+        http_calls = make_http_calls()
+
+        # Step 2 - Call the function
+        await asyncio.gather(
+            http_calls.http_call("get", "https://xkcd.com/1/"),
+            http_calls.http_call("get", "https://xkcd.com/2/"),
+            http_calls.http_call(
+                "get", "https://xkcd.com/1/", headers={"Authorization": "a"}
+            ),
+        )
+
+        # Step 3 - Assert that everything works
+        assert http_calls.fetch.await_count == 3
+
+
+class Test_Fetch:
+    """A set of tests to ensure failed requests are retried correctly"""
+
+    @pytest.mark.asyncio
+    async def test_connect_error_retried(self: Self) -> None:
+        """Test to ensure a GET that couldn't connect is retried,
+        and the attempt that never reached the host is refunded
+        """
+        # Step 1 - Setup env
+        http_calls = http.HTTPCalls(make_bot())
+        http_calls.retry_backoff = 0
+        connect_error = aiohttp.ClientConnectorError(MagicMock(), OSError("refused"))
+        http_calls.send = AsyncMock(
+            side_effect=[connect_error, httpcache.CachedResponse(200, "{}")]
+        )
+
+        # Step 2 - Call the function
+        response = await http_calls.http_call("get", "https://xkcd.com/1/")
+
+        # Step 3 - Assert that everything works
+        assert response.status_code == 200
+        assert http_calls.send.await_count == 2
+        assert len(http_calls.host_limiters["xkcd.com"].history) == 1
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried(self: Self) -> None:
+        """Test to ensure a POST that got a server error isn't sent again"""
+        # Step 1 - Setup env
+        http_calls = http.HTTPCalls(make_bot())
+        http_calls.retry_backoff = 0
+        http_calls.send = AsyncMock(return_value=httpcache.CachedResponse(503, "{}"))
+
+        # Step 2 - Call the function
+        response = await http_calls.http_call("post", "https://xkcd.com/1/")
+
+        # Step 3 - Assert that everything works
+        assert response.status_code == 503
+        assert http_calls.send.await_count == 1
+        assert http_calls.host_health["xkcd.com"].failures == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_keeps_rate_limit_slot(self: Self) -> None:
+        """Test to ensure a retry on a host allowing 1 call is sent,
+        without taking another rate limit slot
+        """
+        # Step 1 - Setup env
+        http_calls = http.HTTPCalls(make_bot())
+        http_calls.retry_backoff = 0
+        http_calls.send = AsyncMock(
+            side_effect=[
+                httpcache.CachedResponse(503, "{}"),
+                httpcache.CachedResponse(200, '{"ip": "8.8.8.8"}'),
+            ]
+        )
+
+        # Step 2 - Call the function
+        response = await http_calls.http_call("get", "https://ipinfo.io/8.8.8.8")
+
+        # Step 3 - Assert that everything works
+        assert response.ip == "8.8.8.8"
+        assert http_calls.send.await_count == 2
+        assert len(http_calls.host_limiters["ipinfo.io"].history) == 1
+        assert http_calls.host_health["ipinfo.io"].failures == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_one_failure(self: Self) -> None:
+        """Test to ensure a request that fails every try is a single host failure"""
+        # Step 1 - Setup env
+        http_calls = http.HTTPCalls(make_bot())
+        http_calls.retry_backoff = 0
+        http_calls.send = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        # Step 2 - Call the function
+        with pytest.raises(asyncio.TimeoutError):
+            await http_calls.http_call("get", "https://newsapi.org/v2/top")
+
+        # Step 3 - Assert that everything works
+        assert http_calls.send.await_count == http_calls.retries + 1
+        assert http_calls.host_health["newsapi.org"].failures == 1
@@ -0,0 +1,185 @@
+"""
+This is a file to test the core/httpcache.py file
+This contains 9 tests
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Self
+
+from core import httpcache
+
+
+class Test_MakeCacheKey:
+    """A set of tests to ensure cache keys are made correctly"""
+
+    def test_path_case_kept(self: Self) -> None:
+        """Test to ensure only the host is lowercased"""
+        # Step 1 - Setup env
+        url = "HTTPS://XKCD.com/Info.0.JSON"
+
+        # Step 2 - Call the function
+        key = httpcache.make_cache_key(url)
+
+        # Step 3 - Assert that everything works
+        assert key == "https://xkcd.com/Info.0.JSON"
+
+    def test_params_sorted(self: Self) -> None:
+        """Test to ensure the order of params doesn't change the key"""
+        # Step 1 - Setup env
+        url = "https://a.com/search"
+
+        # Step 2 - Call the function
+        first = httpcache.make_cache_key(url, {"q": "Word", "key": "1"})
+        second = httpcache.make_cache_key(url, {"key": "1", "q": "Word"})
+
+        # Step 3 - Assert that everything works
+        assert first == second == "https://a.com/search?key=1&q=Word"
+
+
+class Test_ResponseCache:
+    """A set of tests to ensure the response cache works"""
+
+    def test_byte_budget(self: Self) -> None:
+        """Test to ensure the least recently used responses are evicted to fit"""
+        # Step 1 - Setup env
+        cache = httpcache.ResponseCache(max_bytes=700, default_ttl=60)
+        cache.set("a", "a.com", httpcache.CachedResponse(200, "x" * 100), now=0)
+        cache.set("b", "a.com", httpcache.CachedResponse(200, "x" * 100), now=0)
+        cache.get("a", now=1)
+
+        # Step 2 - Call the function
+        cache.set("c", "a.com", httpcache.CachedResponse(200, "x" * 100), now=2)
+
+        # Step 3 - Assert that everything works
+        assert list(cache.entries) == ["a", "c"]
+        assert cache.total_bytes <= cache.max_bytes
+
+    def test_host_ttl_and_stale(self: Self) -> None:
+        """Test to ensure a response goes stale after its host TTL, then expires"""
+        # Step 1 - Setup env
+        cache = httpcache.ResponseCache(
+            max_bytes=10000,
+            default_ttl=60,
+            host_ttls={"xkcd.com": 10},
+            stale_seconds=30,
+        )
+        cache.set("a", "xkcd.com", httpcache.CachedResponse(200, "{}"), now=0)
+
+        # Step 2 - Call the function
+        _, fresh = cache.get("a", now=5)
+        stale_entry, stale_fresh = cache.get("a", now=20)
+        expired_entry, _ = cache.get("a", now=50)
+
+        # Step 3 - Assert that everything works
+        assert fresh
+        assert stale_entry is not None and not stale_fresh
+        assert expired_entry is None
+
+    def test_json_decoded_once(self: Self) -> None:
+        """Test to ensure the JSON body is only decoded the first time"""
+        # Step 1 - Setup env
+        response = httpcache.CachedResponse(200, '{"num": 1}')
+
+        # Step 2 - Call the function
+        first = response.json()
+        second = response.json()
+
+        # Step 3 - Assert that everything works
+        assert first == {"num": 1}
+        assert first is second
+
+
+class Test_DiskCache:
+    """A set of tests to ensure the disk cache tier works"""
+
+    def test_survives_reopen(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure a stored response can be read after reopening the file
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the SQLite file
+        """
+        # Step 1 - Setup env
+        path = str(tmp_path / "cache.sqlite3")
+        cache = httpcache.DiskCache(path, max_bytes=10000, host_ttls={"xkcd.com": 60})
+        cache.set("a", "xkcd.com", httpcache.CachedResponse(200, '{"num": 1}'), now=0)
+        cache.close()
+
+        # Step 2 - Call the function
+        reopened = httpcache.DiskCache(path, max_bytes=10000, host_ttls={})
+        entry = reopened.get("a", now=30)
+        expired = reopened.get("a", now=60)
+
+        # Step 3 - Assert that everything works
+        assert entry.json() == {"num": 1}
+        assert expired is None
+
+    def test_ineligible_host(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure hosts without a disk TTL are never stored
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the SQLite file
+        """
+        # Step 1 - Setup env
+        cache = httpcache.DiskCache(
+            str(tmp_path / "cache.sqlite3"), max_bytes=10000, host_ttls={}
+        )
+
+        # Step 2 - Call the function
+        cache.set("a", "a.com", httpcache.CachedResponse(200, "{}"), now=0)
+
+        # Step 3 - Assert that everything works
+        assert cache.get("a", now=1) is None
+
+    def test_byte_budget(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure the least recently used responses are evicted to fit
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the SQLite file
+        """
+        # Step 1 - Setup env
+        cache = httpcache.DiskCache(
+            str(tmp_path / "cache.sqlite3"), max_bytes=700, host_ttls={"a.com": 60}
+        )
+        cache.set("a", "a.com", httpcache.CachedResponse(200, "x" * 100), now=0)
+        cache.set("b", "a.com", httpcache.CachedResponse(200, "x" * 100), now=1)
+        cache.get("a", now=2)
+
+        # Step 2 - Call the function
+        cache.set("c", "a.com", httpcache.CachedResponse(200, "x" * 100), now=3)
+
+        # Step 3 - Assert that everything works
+        assert cache.get("a", now=4) is not None
+        assert cache.get("b", now=4) is None
+        assert cache.get("c", now=4) is not None
+
+    def test_running_total(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure the stored bytes are tracked without summing the file
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the SQLite file
+        """
+        # Step 1 - Setup env
+        path = str(tmp_path / "cache.sqlite3")
+        cache = httpcache.DiskCache(path, max_bytes=700, host_ttls={"a.com": 60})
+        size = httpcache.CachedResponse(200, "x" * 100).size
+
+        # Step 2 - Call the function
+        cache.set("a", "a.com", httpcache.CachedResponse(200, "x" * 100), now=0)
+        cache.set("a", "a.com", httpcache.CachedResponse(200, "x" * 100), now=1)
+        cache.set("b", "a.com", httpcache.CachedResponse(200, "x" * 100), now=2)
+        replaced = cache.total_bytes
+        cache.get("a", now=61)
+        expired = cache.total_bytes
+        cache.set("c", "a.com", httpcache.CachedResponse(200, "x" * 100), now=62)
+        cache.set("d", "a.com", httpcache.CachedResponse(200, "x" * 100), now=63)
+        evicted = cache.total_bytes
+        cache.close()
+        reopened = httpcache.DiskCache(path, max_bytes=700, host_ttls={})
+
+        # Step 3 - Assert that everything works
+        assert replaced == 2 * size
+        assert expired == size
+        assert evicted == 2 * size
+        assert reopened.total_bytes == evicted
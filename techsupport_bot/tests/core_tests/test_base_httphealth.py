@@ -0,0 +1,57 @@
+"""
+This is a file to test the core/httphealth.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+import pytest
+from core import custom_errors, httphealth
+
+
+class Test_HostHealth:
+    """A set of tests to ensure the circuit breaker opens and closes correctly"""
+
+    def test_opens_after_threshold(self: Self) -> None:
+        """Test to ensure the circuit opens after enough failures in a row"""
+        # Step 1 - Setup env
+        health = httphealth.HostHealth(failure_threshold=2, reset_seconds=30)
+        health.record_failure(now=0)
+        health.check(now=1)
+
+        # Step 2 - Call the function
+        health.record_failure(now=1)
+
+        # Step 3 - Assert that everything works
+        with pytest.raises(custom_errors.HTTPHostDown) as error:
+            health.check(now=2)
+        assert error.value.wait == 29
+
+    def test_single_trial(self: Self) -> None:
+        """Test to ensure only one trial call is let through once the circuit resets"""
+        # Step 1 - Setup env
+        health = httphealth.HostHealth(failure_threshold=1, reset_seconds=30)
+        health.record_failure(now=0)
+
+        # Step 2 - Call the function
+        health.check(now=31)
+
+        # Step 3 - Assert that everything works
+        with pytest.raises(custom_errors.HTTPHostDown):
+            health.check(now=32)
+
+    def test_success_closes(self: Self) -> None:
+        """Test to ensure a successful trial closes the circuit"""
+        # Step 1 - Setup env
+        health = httphealth.HostHealth(failure_threshold=1, reset_seconds=30)
+        health.record_failure(now=0)
+        health.check(now=31)
+
+        # Step 2 - Call the function
+        health.record_success()
+
+        # Step 3 - Assert that everything works
+        assert not health.is_open
+        health.check(now=32)
@@ -0,0 +1,86 @@
+"""
+This is a file to test the core/httplimit.py file
+This contains 4 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Self
+
+import pytest
+from core import custom_errors, httplimit
+
+
+class Test_HostRateLimiter:
+    """A set of tests to ensure the host rate limiter queues calls fairly"""
+
+    @pytest.mark.asyncio
+    async def test_no_wait_raises(self: Self) -> None:
+        """Test to ensure a call that doesn't wait is refused once over the limit"""
+        # Step 1 - Setup env
+        limiter = httplimit.HostRateLimiter(calls=1, window=60)
+        await limiter.acquire()
+
+        # Step 2 - Call the function
+        with pytest.raises(custom_errors.HTTPRateLimit):
+            await limiter.acquire()
+
+        # Step 3 - Assert that everything works
+        assert len(limiter.history) == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_until_allowed(self: Self) -> None:
+        """Test to ensure a call that waits goes through once the window moves"""
+        # Step 1 - Setup env
+        limiter = httplimit.HostRateLimiter(calls=1, window=0.05)
+        await limiter.acquire()
+
+        # Step 2 - Call the function
+        await limiter.acquire(wait=1)
+
+        # Step 3 - Assert that everything works
+        assert len(limiter.history) == 1
+        assert limiter.queued() == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_and_fairness(self: Self) -> None:
+        """Test to ensure interactive calls go first, and guilds take turns"""
+        # Step 1 - Setup env
+        limiter = httplimit.HostRateLimiter(calls=1, window=0.02)
+        await limiter.acquire()
+        order = []
+
+        async def call(name: str, priority: httplimit.Priority, guild: str) -> None:
+            await limiter.acquire(wait=1, priority=priority, guild=guild)
+            order.append(name)
+
+        # Step 2 - Call the function
+        await asyncio.gather(
+            call("background", httplimit.Priority.BACKGROUND, "1"),
+            call("a1", httplimit.Priority.INTERACTIVE, "a"),
+            call("a2", httplimit.Priority.INTERACTIVE, "a"),
+            call("b1", httplimit.Priority.INTERACTIVE, "b"),
+        )
+
+        # Step 3 - Assert that everything works
+        assert order == ["a1", "b1", "a2", "background"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_passed(self: Self) -> None:
+        """Test to ensure a call queued behind others is refused and dequeued
+        once its deadline passes
+        """
+        # Step 1 - Setup env
+        limiter = httplimit.HostRateLimiter(calls=1, window=0.1)
+        await limiter.acquire()
+
+        # Step 2 - Call the function
+        first = asyncio.create_task(limiter.acquire(wait=1))
+        await asyncio.sleep(0)
+        with pytest.raises(custom_errors.HTTPRateLimit):
+            await limiter.acquire(wait=0.15, priority=httplimit.Priority.BACKGROUND)
+        await first
+
+        # Step 3 - Assert that everything works
+        assert limiter.queued() == 0
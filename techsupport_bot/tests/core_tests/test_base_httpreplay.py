@@ -0,0 +1,110 @@
+"""
+This is a file to test the core/httpreplay.py file
+This contains 5 tests
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Self
+from unittest.mock import AsyncMock
+
+import pytest
+from core import http, httpcache, httpreplay
+from tests.core_tests.test_base_http import make_bot
+
+
+class Test_RedactUrl:
+    """A set of tests to ensure fixtures never hold secrets"""
+
+    def test_secret_params_removed(self: Self) -> None:
+        """Test to ensure secret query parameters are blanked, and the rest sorted"""
+        # Step 1 - Setup env
+        url = "https://newsapi.org/v2/top?country=us&apiKey=secret"
+
+        # Step 2 - Call the function
+        redacted = httpreplay.redact_url(url, {"category": "tech"})
+
+        # Step 3 - Assert that everything works
+        assert "secret" not in redacted
+        assert redacted == (
+            "https://newsapi.org/v2/top?apiKey=&category=tech&country=us"
+        )
+
+
+class Test_FixtureTransport:
+    """A set of tests to ensure responses are recorded and replayed"""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure a recorded response is replayed without the network
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the fixtures
+        """
+        # Step 1 - Setup env
+        live = AsyncMock(return_value=httpcache.CachedResponse(200, '{"num": 1}'))
+        recorder = httpreplay.FixtureTransport(str(tmp_path), "record", live)
+        await recorder.send("get", "https://xkcd.com/1/info.0.json", (), {})
+        replayer = httpreplay.FixtureTransport(str(tmp_path), "replay", AsyncMock())
+
+        # Step 2 - Call the function
+        response = await replayer.send("get", "https://xkcd.com/1/info.0.json", (), {})
+
+        # Step 3 - Assert that everything works
+        assert response.json() == {"num": 1}
+        assert live.await_count == 1
+        replayer.live.assert_not_awaited()
+
+    def test_body_changes_key(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure requests with different bodies are recorded separately
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the fixtures
+        """
+        # Step 1 - Setup env
+        transport = httpreplay.FixtureTransport(str(tmp_path), "replay", AsyncMock())
+        url = "https://api.openai.com/v1/chat/completions"
+
+        # Step 2 - Call the function
+        first = transport.get_path("post", url, {"json": {"prompt": "a"}})
+        second = transport.get_path("post", url, {"json": {"prompt": "b"}})
+
+        # Step 3 - Assert that everything works
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_missing_fixture(self: Self, tmp_path: os.PathLike) -> None:
+        """Test to ensure replaying an unrecorded request fails clearly
+
+        Args:
+            tmp_path (os.PathLike): A temporary directory for the fixtures
+        """
+        # Step 1 - Setup env
+        transport = httpreplay.FixtureTransport(str(tmp_path), "replay", AsyncMock())
+
+        # Step 2 - Call the function
+        with pytest.raises(httpreplay.FixtureNotFoundError):
+            await transport.send("get", "https://xkcd.com/2/", (), {})
+
+        # Step 3 - Assert that everything works
+        transport.live.assert_not_awaited()
+
+    @pytest.mark.parametrize("mode", ["recrod", "Live", ""])
+    def test_unknown_mode_rejected(self: Self, mode: str) -> None:
+        """Test to ensure a mistyped fixture mode stops the bot, instead of replaying
+
+        Args:
+            mode (str): The mistyped mode
+        """
+        # Step 1 - Setup env
+        bot = make_bot()
+        bot.file_config.api.http = {"fixtures": {"mode": mode}}
+
+        # Step 2 - Call the function
+        with pytest.raises(ValueError):
+            http.HTTPCalls(bot)
+
+        # Step 3 - Assert that everything works
+        with pytest.raises(ValueError):
+            httpreplay.FixtureTransport("fixtures", mode, AsyncMock())
@@ -0,0 +1,92 @@
+"""
+This is a file to test the core/httpstream.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Self
+from unittest.mock import MagicMock
+
+import pytest
+from core import custom_errors, httpstream
+
+
+def make_response(chunks: list[bytes], content_length: int = None) -> MagicMock:
+    """Makes a fake aiohttp response, that returns the given chunks
+
+    Args:
+        chunks (list[bytes]): The chunks of the body
+        content_length (int, optional): The length the response claims to have
+
+    Returns:
+        MagicMock: The fake response
+    """
+
+    async def iter_chunked(_: int) -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    response = MagicMock()
+    response.content_length = content_length
+    response.charset = None
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+class Test_StreamBody:
+    """A set of tests to ensure request bodies are sent in chunks"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_progress(self: Self) -> None:
+        """Test to ensure a body is split into chunks, reporting progress each time"""
+        # Step 1 - Setup env
+        progress = []
+
+        # Step 2 - Call the function
+        chunks = [
+            chunk
+            async for chunk in httpstream.stream_body(
+                "abcde",
+                chunk_size=2,
+                progress=lambda sent, total: progress.append(sent),
+            )
+        ]
+
+        # Step 3 - Assert that everything works
+        assert chunks == [b"ab", b"cd", b"e"]
+        assert progress == [2, 4, 5]
+
+
+class Test_StreamedResponse:
+    """A set of tests to ensure responses are read in chunks, up to a limit"""
+
+    @pytest.mark.asyncio
+    async def test_text_under_limit(self: Self) -> None:
+        """Test to ensure a body under the limit is read whole"""
+        # Step 1 - Setup env
+        response = httpstream.StreamedResponse(
+            make_response([b"https://", b"linx/a"]), max_bytes=100, chunk_size=8
+        )
+
+        # Step 2 - Call the function
+        text = await response.text()
+
+        # Step 3 - Assert that everything works
+        assert text == "https://linx/a"
+
+    @pytest.mark.asyncio
+    async def test_over_limit(self: Self) -> None:
+        """Test to ensure reading stops once the body goes over the limit"""
+        # Step 1 - Setup env
+        response = httpstream.StreamedResponse(
+            make_response([b"a" * 8, b"a" * 8, b"a" * 8]), max_bytes=10, chunk_size=8
+        )
+
+        # Step 2 - Call the function
+        with pytest.raises(custom_errors.HTTPResponseTooLarge):
+            await response.read()
+
+        # Step 3 - Assert that everything works
+        assert response.received == 16
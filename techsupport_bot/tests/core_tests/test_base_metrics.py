@@ -0,0 +1,54 @@
+"""
+This is a file to test the core/metrics.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+from core import metrics
+
+
+class Test_MetricsRegistry:
+    """A set of tests to ensure the metrics registry renders correctly"""
+
+    def test_counter_labels(self: Self) -> None:
+        """Test to ensure counters are added up per set of labels"""
+        # Step 1 - Setup env
+        registry = metrics.MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests made")
+
+        # Step 2 - Call the function
+        counter.inc(host="a.com")
+        counter.inc(host="a.com")
+        counter.inc(host="b.com")
+        output = registry.render()
+
+        # Step 3 - Assert that everything works
+        assert "# TYPE requests_total counter" in output
+        assert 'requests_total{host="a.com"} 2.0' in output
+        assert 'requests_total{host="b.com"} 1.0' in output
+
+    def test_label_escaped(self: Self) -> None:
+        """Test to ensure quotes in label values are escaped"""
+        # Step 1 - Setup env
+        registry = metrics.MetricsRegistry()
+
+        # Step 2 - Call the function
+        registry.gauge("depth", "Queue depth").set(1, name='a"b')
+
+        # Step 3 - Assert that everything works
+        assert 'depth{name="a\\"b"} 1' in registry.render()
+
+    def test_collectors_run(self: Self) -> None:
+        """Test to ensure collectors update gauges before rendering"""
+        # Step 1 - Setup env
+        registry = metrics.MetricsRegistry()
+        registry.add_collector(lambda: registry.gauge("tasks", "Tasks").set(5))
+
+        # Step 2 - Call the function
+        output = registry.render()
+
+        # Step 3 - Assert that everything works
+        assert "tasks 5" in output
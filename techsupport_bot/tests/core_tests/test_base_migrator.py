@@ -0,0 +1,104 @@
+"""
+This is a file to test the core/migrator.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from core import migrator
+
+
+def make_bot(applied: list[int]) -> MagicMock:
+    """Makes a fake bot, with a database that has some migrations applied
+
+    Args:
+        applied (list[int]): The versions already in the version table
+
+    Returns:
+        MagicMock: The fake bot
+    """
+    bot = MagicMock()
+    bot.logger.send_log = AsyncMock()
+    bot.db.status = AsyncMock()
+    bot.db.all = AsyncMock(return_value=[(version,) for version in applied])
+    bot.db.text = str
+    return bot
+
+
+def make_migrations() -> list[migrator.Migration]:
+    """Makes fake migrations, that record nothing
+
+    Returns:
+        list[migrator.Migration]: Versions 1 to 3, oldest first
+    """
+    return [
+        migrator.Migration(version, f"m000{version}_test", "Test", AsyncMock())
+        for version in range(1, 4)
+    ]
+
+
+class Test_FindMigrations:
+    """A set of tests to ensure the migration files are found in order"""
+
+    def test_in_order(self: Self) -> None:
+        """Test to ensure the real migrations are found, oldest first"""
+        # Step 1 - Setup env
+        package = "migrations"
+
+        # Step 2 - Call the function
+        migrations = migrator.find_migrations(package)
+
+        # Step 3 - Assert that everything works
+        versions = [migration.version for migration in migrations]
+        assert versions == sorted(versions)
+        assert migrations[0].name == "m0001_initial_tables"
+
+
+class Test_RunMigrations:
+    """A set of tests to ensure only pending migrations are applied"""
+
+    @pytest.mark.asyncio
+    async def test_pending_applied(self: Self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test to ensure only migrations missing from the version table run
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the real migrations
+        """
+        # Step 1 - Setup env
+        bot = make_bot(applied=[1])
+        migrations = make_migrations()
+        monkeypatch.setattr(migrator, "find_migrations", lambda _: migrations)
+
+        # Step 2 - Call the function
+        pending = await migrator.run_migrations(bot)
+
+        # Step 3 - Assert that everything works
+        assert [migration.version for migration in pending] == [2, 3]
+        migrations[0].upgrade.assert_not_awaited()
+        migrations[1].upgrade.assert_awaited_once_with(bot)
+        migrations[2].upgrade.assert_awaited_once_with(bot)
+
+    @pytest.mark.asyncio
+    async def test_dry_run(self: Self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test to ensure a dry run applies and records nothing
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the real migrations
+        """
+        # Step 1 - Setup env
+        bot = make_bot(applied=[])
+        migrations = make_migrations()
+        monkeypatch.setattr(migrator, "find_migrations", lambda _: migrations)
+
+        # Step 2 - Call the function
+        pending = await migrator.run_migrations(bot, dry_run=True)
+
+        # Step 3 - Assert that everything works
+        assert len(pending) == 3
+        assert all(not migration.upgrade.await_count for migration in migrations)
+        # Only the version table was made, nothing was inserted
+        assert bot.db.status.await_count == 1
@@ -0,0 +1,233 @@
+"""
+This is a file to test the core/perf.py file
+This contains 7 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any, Self
+from unittest.mock import MagicMock
+
+import asyncpg
+import gino
+import pytest
+from core import perf
+from gino.dialects.asyncpg import AsyncpgDialect
+
+
+class FakePool:
+    """A gino pool that always hands out the same connection
+
+    Attributes:
+        raw_pool (Self): The asyncpg pool under the gino pool, which is this pool
+
+    Args:
+        connection (perf.TimedConnection): The connection to hand out
+    """
+
+    def __init__(self: Self, connection: perf.TimedConnection) -> None:
+        self.connection = connection
+
+    @property
+    def raw_pool(self: Self) -> Self:
+        """The asyncpg pool under the gino pool, which is this pool
+
+        Returns:
+            Self: This pool
+        """
+        return self
+
+    async def acquire(self: Self, *, timeout: float = None) -> perf.TimedConnection:
+        """Hands out the connection
+
+        Args:
+            timeout (float, optional): Unused
+
+        Returns:
+            perf.TimedConnection: The connection
+        """
+        return self.connection
+
+    async def release(self: Self, connection: perf.TimedConnection) -> None:
+        """Takes back the connection, which does nothing
+
+        Args:
+            connection (perf.TimedConnection): The connection
+        """
+
+
+def make_engine(
+    monkeypatch: pytest.MonkeyPatch, seconds: float, error: Exception = None
+) -> gino.GinoEngine:
+    """Makes a gino engine over a timed connection, where the server part of asyncpg
+    is replaced by a statement taking the given time. Everything above it is real
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the server part of asyncpg
+        seconds (float): How long every statement takes
+        error (Exception, optional): The error every statement raises, if any
+
+    Returns:
+        gino.GinoEngine: The engine
+    """
+
+    async def do_execute(*_args: tuple, **_kwargs: dict[str, Any]) -> tuple:
+        await asyncio.sleep(seconds)
+        if error is not None:
+            raise error
+        return ([], b"SELECT 1", False), MagicMock()
+
+    monkeypatch.setattr(asyncpg.Connection, "_do_execute", do_execute)
+    # pylint: disable=protected-access
+    connection = object.__new__(perf.TimedConnection)
+    connection._aborted = True
+    connection._protocol = MagicMock()
+    connection._protocol._get_timeout = lambda timeout: timeout
+    connection._stmt_exclusive_section = contextlib.nullcontext()
+    return gino.GinoEngine(
+        AsyncpgDialect(), FakePool(connection), asyncio.get_running_loop()
+    )
+
+
+class Test_LatencyHistogram:
+    """A set of tests to ensure the latency histogram works"""
+
+    def test_percentiles(self: Self) -> None:
+        """Test to ensure percentiles land in the right bucket"""
+        # Step 1 - Setup env
+        histogram = perf.LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.01)
+        histogram.record(5.0)
+
+        # Step 2 - Call the function
+        p50 = histogram.percentile(50)
+        p100 = histogram.percentile(100)
+
+        # Step 3 - Assert that everything works
+        assert 0.01 <= p50 < 0.02
+        assert p100 == 5.0
+
+    def test_fixed_size(self: Self) -> None:
+        """Test to ensure the histogram never grows"""
+        # Step 1 - Setup env
+        histogram = perf.LatencyHistogram()
+
+        # Step 2 - Call the function
+        for seconds in range(10000):
+            histogram.record(seconds)
+
+        # Step 3 - Assert that everything works
+        assert len(histogram.counts) == len(perf.BUCKET_BOUNDS) + 1
+        assert histogram.count == 10000
+
+
+class Test_PerfRecorder:
+    """A set of tests to ensure the perf recorder works"""
+
+    def test_http_time_attributed(self: Self) -> None:
+        """Test to ensure HTTP time is added to the running command"""
+        # Step 1 - Setup env
+        recorder = perf.PerfRecorder()
+        timing = recorder.start("ping")
+
+        # Step 2 - Call the function
+        perf.record_http(0.5)
+        recorder.finish(timing, error=True)
+
+        # Step 3 - Assert that everything works
+        stats = recorder.commands["ping"]
+        assert stats.http.max == 0.5
+        assert stats.errors == 1
+
+    def test_finish_only_once(self: Self) -> None:
+        """Test to ensure a command finished twice is only recorded once"""
+        # Step 1 - Setup env
+        recorder = perf.PerfRecorder()
+        timing = recorder.start("ping")
+
+        # Step 2 - Call the function
+        recorder.finish(timing)
+        recorder.finish(timing, error=True)
+
+        # Step 3 - Assert that everything works
+        assert recorder.commands["ping"].wall.count == 1
+        assert recorder.commands["ping"].errors == 0
+
+    @pytest.mark.asyncio
+    async def test_gino_queries_attributed(
+        self: Self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure queries run through gino are timed and added to the command
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the global query stats
+        """
+        # Step 1 - Setup env
+        monkeypatch.setattr(perf, "query_stats", perf.QueryStats())
+        engine = make_engine(monkeypatch, seconds=0.01)
+        recorder = perf.PerfRecorder()
+        timing = recorder.start("factoid")
+
+        # Step 2 - Call the function
+        await engine.status(gino.Gino().text("SELECT :value"), value=1)
+        await engine.all(gino.Gino().text("SELECT 2"))
+        recorder.finish(timing)
+
+        # Step 3 - Assert that everything works
+        stats = recorder.commands["factoid"]
+        assert stats.queries == 2
+        assert stats.db.max >= 0.02
+        assert perf.query_stats.count == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_gino_query_reported(
+        self: Self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure a gino query over the threshold is reported as slow
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the global query stats
+        """
+        # Step 1 - Setup env
+        monkeypatch.setattr(perf, "query_stats", perf.QueryStats())
+        perf.query_stats.slow_seconds = 0.05
+        perf.query_stats.on_slow = MagicMock()
+        engine = make_engine(monkeypatch, seconds=0.06)
+        timing = perf.PerfRecorder().start("factoid")
+
+        # Step 2 - Call the function
+        await engine.status(gino.Gino().text("SELECT pg_sleep(1)"))
+
+        # Step 3 - Assert that everything works
+        assert perf.query_stats.slow == 1
+        query, seconds, command = perf.query_stats.on_slow.call_args.args
+        assert "pg_sleep" in query
+        assert seconds >= 0.05
+        assert command == timing.name
+
+    @pytest.mark.asyncio
+    async def test_failed_gino_query_counted(
+        self: Self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure a failed gino query reaches the totals the metrics read
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the global query stats
+        """
+        # Step 1 - Setup env
+        monkeypatch.setattr(perf, "query_stats", perf.QueryStats())
+        engine = make_engine(
+            monkeypatch, seconds=0.01, error=asyncpg.PostgresError("failed")
+        )
+
+        # Step 2 - Call the function
+        with pytest.raises(asyncpg.PostgresError):
+            await engine.status(gino.Gino().text("SELECT 1"))
+
+        # Step 3 - Assert that everything works
+        assert perf.query_stats.count == 1
+        assert perf.query_stats.errors == 1
+        assert perf.query_stats.seconds >= 0.01
@@ -0,0 +1,84 @@
+"""
+This is a file to test the core/ratelimit.py file
+This contains 5 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+from core import ratelimit
+
+
+class Test_CommandRateLimiter:
+    """A set of tests to ensure the command rate limiter works"""
+
+    def test_under_limit(self: Self) -> None:
+        """Test to ensure commands under the limit are allowed"""
+        # Step 1 - Setup env
+        limiter = ratelimit.CommandRateLimiter()
+
+        # Step 2 - Call the function
+        results = [
+            limiter.check("1-1", command_id, 3, 10, now=100 + command_id)
+            for command_id in range(3)
+        ]
+
+        # Step 3 - Assert that everything works
+        assert results == [True, True, True]
+
+    def test_over_limit_bans(self: Self) -> None:
+        """Test to ensure going over the limit bans until the ban expires"""
+        # Step 1 - Setup env
+        limiter = ratelimit.CommandRateLimiter(ban_seconds=600)
+        for command_id in range(3):
+            limiter.check("1-1", command_id, 3, 10, now=100 + command_id)
+
+        # Step 2 - Call the function
+        over_limit = limiter.check("1-1", 3, 3, 10, now=104)
+        still_banned = limiter.check("1-1", 4, 3, 10, now=600)
+        unbanned = limiter.check("1-1", 5, 3, 10, now=2000)
+
+        # Step 3 - Assert that everything works
+        assert not over_limit
+        assert not still_banned
+        assert unbanned
+
+    def test_same_command_counted_once(self: Self) -> None:
+        """Test to ensure checking the same command many times only counts it once"""
+        # Step 1 - Setup env
+        limiter = ratelimit.CommandRateLimiter()
+
+        # Step 2 - Call the function
+        results = [limiter.check("1-1", 1, 1, 10, now=100) for _ in range(5)]
+
+        # Step 3 - Assert that everything works
+        assert all(results)
+
+    def test_idle_identities_evicted(self: Self) -> None:
+        """Test to ensure identities that have been idle are no longer tracked"""
+        # Step 1 - Setup env
+        limiter = ratelimit.CommandRateLimiter(ban_seconds=600)
+        limiter.check("1-1", 1, 3, 10, now=100)
+
+        # Step 2 - Call the function
+        limiter.check("2-1", 2, 3, 10, now=1000)
+
+        # Step 3 - Assert that everything works
+        assert list(limiter.windows) == ["2-1"]
+
+    def test_ban_kept_when_evicted(self: Self) -> None:
+        """Test to ensure a banned identity stays banned when pushed out by others"""
+        # Step 1 - Setup env
+        limiter = ratelimit.CommandRateLimiter(ban_seconds=600, max_identities=2)
+        for command_id in range(4):
+            limiter.check("1-1", command_id, 3, 10, now=100 + command_id)
+
+        # Step 2 - Call the function
+        for member in range(2, 10):
+            limiter.check(f"{member}-1", member * 10, 3, 10, now=110)
+        still_banned = limiter.check("1-1", 100, 3, 10, now=120)
+
+        # Step 3 - Assert that everything works
+        assert not still_banned
+        assert list(limiter.bans) == ["1-1"]
@@ -0,0 +1,68 @@
+"""
+This is a file to test the core/watchdog.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from core import watchdog
+
+
+def make_watchdog() -> watchdog.LoopWatchdog:
+    """Makes a fast loop watchdog with a fake bot logger
+
+    Returns:
+        watchdog.LoopWatchdog: The watchdog, not yet started
+    """
+    bot = MagicMock()
+    bot.logger.send_log = AsyncMock()
+    return watchdog.LoopWatchdog(bot, interval=0.02, threshold=0.1)
+
+
+def block_the_loop() -> None:
+    """A synchronous call that holds the event loop"""
+    time.sleep(0.4)
+
+
+class Test_LoopWatchdog:
+    """A set of tests to ensure the loop watchdog works"""
+
+    @pytest.mark.asyncio
+    async def test_no_stall(self: Self) -> None:
+        """Test to ensure a free loop has no stalls"""
+        # Step 1 - Setup env
+        loop_watchdog = make_watchdog()
+
+        # Step 2 - Call the function
+        loop_watchdog.start()
+        await asyncio.sleep(0.2)
+        loop_watchdog.stop()
+
+        # Step 3 - Assert that everything works
+        assert loop_watchdog.get_stats()["stalls"] == 0
+        assert loop_watchdog.lags
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_captured(self: Self) -> None:
+        """Test to ensure a blocking call is recorded with its stack"""
+        # Step 1 - Setup env
+        loop_watchdog = make_watchdog()
+        loop_watchdog.start()
+        await asyncio.sleep(0.05)
+
+        # Step 2 - Call the function
+        block_the_loop()
+        await asyncio.sleep(0.1)
+        loop_watchdog.stop()
+
+        # Step 3 - Assert that everything works
+        stats = loop_watchdog.get_stats()
+        assert stats["stalls"] == 1
+        assert "block_the_loop" in stats["last_stall"].stack
+        loop_watchdog.bot.logger.send_log.assert_awaited_once()